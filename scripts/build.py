@@ -3,20 +3,42 @@
 Dispatch to each exporter to generate all formats from crf.json.
 """
 import json
+import os
 import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-import crfgen.exporter.csv  # noqa
-import crfgen.exporter.docx  # noqa
-import crfgen.exporter.latex  # noqa
-
-# Import exporters to register them
-import crfgen.exporter.markdown  # noqa
-import crfgen.exporter.odm  # noqa
-import crfgen.exporter.xlsx  # noqa
+# Exporters are imported by the registry on first use.
 from crfgen.exporter import registry as reg
+from crfgen.manifest import BuildManifest, exporter_version
 from crfgen.schema import Form
 
+_worker_forms: list[Form] = []
+
+
+def _init_worker(payload: bytes) -> None:
+    """Decode the forms once per worker process."""
+    global _worker_forms
+    _worker_forms = [Form.model_validate(d) for d in json.loads(payload)]
+
+
+def _render(
+    fmt: str, outdir: Path, select: list[int], forms=None
+) -> tuple[str, float, str | None]:
+    """Run one exporter on the *select* ed forms.
+
+    Returns the format, the duration and the formatted error, if any.
+    """
+    forms = _worker_forms if forms is None else forms
+    start = time.perf_counter()
+    try:
+        reg.get(fmt)([forms[i] for i in select], outdir)
+    except Exception:
+        return fmt, time.perf_counter() - start, traceback.format_exc()
+    return fmt, time.perf_counter() - start, None
+
 
 def main() -> None:
     import argparse
@@ -41,6 +63,18 @@ def main() -> None:
         default=reg.formats(),
         help="Which formats to generate",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Run exporters in N worker processes (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore the build manifest and re-render everything",
+    )
     args = parser.parse_args()
 
     src = Path(args.source)
@@ -54,10 +88,66 @@ def main() -> None:
     outdir = Path(args.outdir)
     outdir.mkdir(parents=True, exist_ok=True)
 
+    unknown = sorted(set(args.formats) - set(reg.formats()))
+    if unknown:
+        sys.exit(f"ERROR: unknown format(s): {', '.join(unknown)}")
+    manifest = BuildManifest.load(outdir)
+    if args.force:
+        manifest.formats.clear()
+    plan = {}
+    failed = []
     for fmt in args.formats:
-        fn = reg.get(fmt)
-        print(f"[build] Rendering {fmt} → {outdir}")
-        fn(forms, outdir)
+        # Importing the exporter or hashing its templates may fail, e.g. when
+        # an optional dependency is missing; the other formats still build.
+        try:
+            fn = reg.get(fmt)
+            version = exporter_version(fn, fn.templates)
+            select = manifest.stale(fmt, forms, version, fn.per_form)
+        except Exception:
+            manifest.forget(fmt)
+            failed.append(fmt)
+            print(f"[build] {fmt}: FAILED\n{traceback.format_exc()}", file=sys.stderr)
+            continue
+        if select:
+            plan[fmt] = (fn, version, select)
+        else:
+            print(f"[build] {fmt}: up to date")
+
+    workers = min(args.jobs or os.cpu_count() or 1, max(len(plan), 1))
+    if plan:
+        print(f"[build] Rendering {', '.join(plan)} → {outdir}")
+    if workers > 1:
+        # Forms travel to each worker once, as compact JSON.
+        payload = json.dumps(
+            [f.model_dump(mode="json") for f in forms], separators=(",", ":")
+        ).encode()
+        with ProcessPoolExecutor(
+            workers, initializer=_init_worker, initargs=(payload,)
+        ) as pool:
+            futures = [
+                pool.submit(_render, fmt, outdir, select)
+                for fmt, (_, _, select) in plan.items()
+            ]
+            results = [f.result() for f in futures]
+    else:
+        results = [
+            _render(fmt, outdir, select, forms) for fmt, (_, _, select) in plan.items()
+        ]
+
+    for fmt, elapsed, error in results:
+        fn, version, select = plan[fmt]
+        if error is None:
+            manifest.record(fmt, forms, version, fn.per_form, fn.outputs)
+            print(f"[build] {fmt}: done in {elapsed:.2f}s ({len(select)} form(s))")
+        else:
+            manifest.forget(fmt)
+            failed.append(fmt)
+            print(
+                f"[build] {fmt}: FAILED after {elapsed:.2f}s\n{error}", file=sys.stderr
+            )
+    manifest.save()
+    if failed:
+        sys.exit(f"ERROR: {len(failed)} format(s) failed: {', '.join(failed)}")
 
 
 if __name__ == "__main__":
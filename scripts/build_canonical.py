@@ -2,19 +2,147 @@
 import argparse
 import sys
 
-from crfgen.auth import get_client
-from crfgen.crawl import harvest, write_json
+from crfgen.auth import get_api_key
+from crfgen.cache import ResponseCache
+from crfgen.cassette import Cassette
+from crfgen.checkpoint import Journal
+from crfgen.crawl import harvest_if_changed, iter_harvest
+from crfgen.ratelimit import AdaptiveRateLimiter
+from crfgen.schema import dump_forms, dump_forms_ndjson
 
 p = argparse.ArgumentParser()
-p.add_argument("-o", "--out", default="crf.json")
+p.add_argument(
+    "-o",
+    "--out",
+    default="crf.json",
+    help="Output file; a .ndjson suffix streams one form per line",
+)
 p.add_argument("-v", "--version", help="IG version substring (optional)")
+p.add_argument(
+    "--cache-dir", help="Directory for the on-disk Library response cache (optional)"
+)
+p.add_argument(
+    "--cache-max-age",
+    type=float,
+    default=0,
+    metavar="SECONDS",
+    help="Serve cached responses younger than this without revalidating (default 0)",
+)
+p.add_argument(
+    "--rate-limit",
+    type=float,
+    metavar="RPS",
+    help="Pace requests to this many per second and retry throttled ones (optional)",
+)
+p.add_argument(
+    "--incremental",
+    action="store_true",
+    help="Skip the crawl when /mdr/lastupdated reports no changes since the last run",
+)
+p.add_argument(
+    "--journal",
+    help="Checkpoint journal; an interrupted harvest resumes from it and it is "
+    "deleted once the output is written (optional)",
+)
+p.add_argument(
+    "--worker",
+    help="Only crawl domains claimed under this name in --journal; writes no output",
+)
+tape = p.add_mutually_exclusive_group()
+tape.add_argument(
+    "--record", metavar="CASSETTE", help="Record all Library traffic to this archive"
+)
+tape.add_argument(
+    "--replay",
+    metavar="CASSETTE",
+    help="Harvest offline from an archive written by --record",
+)
 args = p.parse_args()
+if args.worker and not args.journal:
+    p.error("--worker requires --journal")
+if args.incremental and (args.record or args.replay):
+    p.error("--incremental cannot be combined with --record/--replay")
+if args.incremental and args.journal:
+    p.error("--incremental cannot be combined with --journal")
+if args.cache_max_age and not args.cache_dir:
+    p.error("--cache-max-age requires --cache-dir")
 
-try:
-    client = get_client()
-except ValueError as e:
-    sys.exit(f"ERROR: {e}")
+if args.replay:
+    api_key = "offline"
+    cassette = Cassette(args.replay)
+else:
+    try:
+        api_key = get_api_key()
+    except ValueError as e:
+        sys.exit(f"ERROR: {e}")
+    cassette = Cassette(args.record, mode="record") if args.record else None
 
-forms = harvest(client, ig_filter=args.version)
-write_json(forms, args.out)
-print(f"✅  Saved {len(forms)} forms -> {args.out}")
+cache = (
+    ResponseCache(args.cache_dir, max_age=args.cache_max_age)
+    if args.cache_dir
+    else None
+)
+limiter = (
+    AdaptiveRateLimiter(rate=args.rate_limit, max_rate=args.rate_limit)
+    if args.rate_limit
+    else None
+)
+journal = Journal(args.journal) if args.journal else None
+if args.worker:
+    forms = iter_harvest(
+        api_key,
+        ig_filter=args.version,
+        cache=cache,
+        limiter=limiter,
+        journal=journal,
+        worker=args.worker,
+        cassette=cassette,
+    )
+    count = sum(1 for _ in forms)
+    if args.record:
+        cassette.save()
+    print(f"✅  Worker {args.worker} completed {count} forms -> {args.journal}")
+    sys.exit(0)
+if args.incremental:
+    forms = harvest_if_changed(
+        api_key, args.out, ig_filter=args.version, cache=cache, limiter=limiter
+    )
+    if forms is None:
+        print(f"✅  {args.out} is up to date")
+        sys.exit(0)
+    count = len(forms)
+elif args.out.endswith(".ndjson"):
+    forms = iter_harvest(
+        api_key,
+        ig_filter=args.version,
+        cache=cache,
+        limiter=limiter,
+        journal=journal,
+        cassette=cassette,
+    )
+    count = dump_forms_ndjson(forms, args.out)
+else:
+    forms = list(
+        iter_harvest(
+            api_key,
+            ig_filter=args.version,
+            cache=cache,
+            limiter=limiter,
+            journal=journal,
+            cassette=cassette,
+        )
+    )
+    dump_forms(forms, args.out)
+    count = len(forms)
+if journal is not None:
+    journal.clear()
+print(f"✅  Saved {count} forms -> {args.out}")
+if args.record:
+    cassette.save()
+    print(f"recorded {len(cassette)} responses -> {args.record}")
+if cache is not None:
+    stats = cache.stats
+    print(
+        f"cache: {stats.hits} hits / {stats.revalidated} revalidated"
+        f" / {stats.misses} misses"
+    )
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Build the offline Controlled Terminology store from the CDISC CT workbooks.
+"""
+import argparse
+import pathlib
+
+from crfgen.ctstore import build_ct_store
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "workbooks",
+        nargs="*",
+        help="CT workbooks (default: data_standards/terminology/*.xlsx)",
+    )
+    parser.add_argument("-o", "--out", default="ct.sqlite", help="Store to write")
+    args = parser.parse_args()
+
+    workbooks = args.workbooks or sorted(
+        pathlib.Path("data_standards/terminology").glob("*_CT_*.xlsx")
+    )
+    counts = build_ct_store(workbooks, args.out)
+    print(f"✓ {counts['codelists']} codelists, {counts['terms']} terms → {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -29,16 +29,30 @@ from the metadata.
 """
 
 import argparse
+import hashlib
+import io
+import os
 import pathlib
-from typing import Dict, Tuple
+import shutil
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 import pandas as pd
 from docx import Document
-from docx.enum.section import WD_ORIENT
+from docx.enum.section import WD_ORIENT, WD_SECTION
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml import OxmlElement, parse_xml
 from docx.oxml.ns import nsdecls, qn
 from docx.shared import Pt, RGBColor
+from docx.table import Table
+from lxml import etree
+
+from crfgen.docxtable import append_rows
 
 ###############################################################################
 # Domain‑to‑category mapping
@@ -108,22 +122,42 @@ def get_domain_info(domain: str) -> Tuple[str, str]:
 ###############################################################################
 
 
-def _add_page_field(paragraph):
-    """Insert Word PAGE field into *paragraph* (in‑place)."""
-    run = paragraph.add_run()
+# OOXML snippets are parsed once and deep-copied on use; ``{slot}`` fields are
+# filled before parsing, so each distinct value is parsed only once as well.
+_PAGE_FIELD_XML = (
+    f"<w:r {nsdecls('w')}>"
+    '<w:fldChar w:fldCharType="begin"/>'
+    '<w:instrText xml:space="preserve">PAGE</w:instrText>'
+    '<w:fldChar w:fldCharType="end"/>'
+    "</w:r>"
+)
+_SHADING_XML = f'<w:shd {nsdecls("w")} w:fill="{{fill}}" w:val="clear"/>'
+_BORDERS_XML = (
+    f"<w:tcBorders {nsdecls('w')}>"
+    '<w:bottom w:val="single" w:sz="4" w:color="auto"/>'
+    "</w:tcBorders>"
+)
+_CONTENT_CONTROL_XML = (
+    f"<w:sdt {nsdecls('w', 'w14')}>"
+    "<w:sdtPr><w14:{kind}/></w:sdtPr>"
+    "<w:sdtContent><w:r><w:t/></w:r></w:sdtContent>"
+    "</w:sdt>"
+)
+
+
+@lru_cache(maxsize=None)
+def _parsed(xml: str):
+    return parse_xml(xml)
+
 
-    fld_char_begin = OxmlElement("w:fldChar")
-    fld_char_begin.set(qn("w:fldCharType"), "begin")
-    run._r.append(fld_char_begin)
+def _fragment(xml: str, **slots: str):
+    """Return a fresh copy of the element parsed from *xml* with *slots* filled."""
+    return deepcopy(_parsed(xml.format(**slots) if slots else xml))
 
-    instr = OxmlElement("w:instrText")
-    instr.set(qn("xml:space"), "preserve")
-    instr.text = "PAGE"
-    run._r.append(instr)
 
-    fld_char_end = OxmlElement("w:fldChar")
-    fld_char_end.set(qn("w:fldCharType"), "end")
-    run._r.append(fld_char_end)
+def _add_page_field(paragraph):
+    """Insert Word PAGE field into *paragraph* (in‑place)."""
+    paragraph._p.append(_fragment(_PAGE_FIELD_XML))
 
 
 def _set_cell_shading(cell, color_hex: str = "4F81BD"):
@@ -132,9 +166,7 @@ def _set_cell_shading(cell, color_hex: str = "4F81BD"):
     # Remove existing shading if any
     for shd in tc_pr.findall("w:shd", tc_pr.nsmap):
         tc_pr.remove(shd)
-    # Add new shading element
-    shd_elm = parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color_hex}" w:val="clear"/>')
-    tc_pr.append(shd_elm)
+    tc_pr.append(_fragment(_SHADING_XML, fill=color_hex))
 
 
 def _add_bottom_border(cell) -> None:
@@ -142,8 +174,8 @@ def _add_bottom_border(cell) -> None:
     tc_pr = cell._tc.get_or_add_tcPr()
     borders = tc_pr.find(qn("w:tcBorders"))
     if borders is None:
-        borders = OxmlElement("w:tcBorders")
-        tc_pr.append(borders)
+        tc_pr.append(_fragment(_BORDERS_XML))
+        return
     bottom = borders.find(qn("w:bottom"))
     if bottom is None:
         bottom = OxmlElement("w:bottom")
@@ -153,38 +185,20 @@ def _add_bottom_border(cell) -> None:
     bottom.set(qn("w:color"), "auto")
 
 
+def _add_content_control(paragraph, kind: str, text: str) -> None:
+    sdt = _fragment(_CONTENT_CONTROL_XML, kind=kind)
+    sdt.find(".//" + qn("w:t")).text = text
+    paragraph._p.append(sdt)
+
+
 def _add_checkbox(paragraph) -> None:
     """Insert a checkbox content control into *paragraph*."""
-    sdt = OxmlElement("w:sdt")
-    pr = OxmlElement("w:sdtPr")
-    cb = OxmlElement("w14:checkbox")
-    pr.append(cb)
-    content = OxmlElement("w:sdtContent")
-    r = OxmlElement("w:r")
-    t = OxmlElement("w:t")
-    t.text = " "
-    r.append(t)
-    content.append(r)
-    sdt.append(pr)
-    sdt.append(content)
-    paragraph._p.append(sdt)
+    _add_content_control(paragraph, "checkbox", " ")
 
 
 def _add_date_picker(paragraph) -> None:
     """Insert a date picker content control into *paragraph*."""
-    sdt = OxmlElement("w:sdt")
-    pr = OxmlElement("w:sdtPr")
-    dt = OxmlElement("w14:date")
-    pr.append(dt)
-    content = OxmlElement("w:sdtContent")
-    r = OxmlElement("w:r")
-    t = OxmlElement("w:t")
-    t.text = ""
-    r.append(t)
-    content.append(r)
-    sdt.append(pr)
-    sdt.append(content)
-    paragraph._p.append(sdt)
+    _add_content_control(paragraph, "date", "")
 
 
 def _add_underline_entry(paragraph, length: int) -> None:
@@ -205,8 +219,44 @@ def _style_header_cell(cell):
 ###############################################################################
 
 
-def load_ig(ig_path: str) -> pd.DataFrame:
-    """Load and normalise the *Variables* worksheet from a CDASH IG workbook."""
+# Bump when the normalisation in ``_read_ig`` changes so stale caches are ignored.
+IG_CACHE_VERSION = 1
+
+
+def _ig_cache_path(ig_path: str, cache_dir: pathlib.Path) -> pathlib.Path:
+    digest = hashlib.sha256(f"v{IG_CACHE_VERSION}:".encode())
+    with open(ig_path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return cache_dir / f"{digest.hexdigest()}.pkl"
+
+
+def load_ig(
+    ig_path: str, cache_dir: Optional[str | pathlib.Path] = None
+) -> pd.DataFrame:
+    """Load and normalise the *Variables* worksheet from a CDASH IG workbook.
+
+    With *cache_dir*, the normalised frame is pickled under the SHA-256 of the
+    workbook contents and reused until the workbook changes.
+    """
+    if cache_dir is None:
+        return _read_ig(ig_path)
+
+    cache_path = _ig_cache_path(ig_path, pathlib.Path(cache_dir))
+    if cache_path.exists():
+        try:
+            return pd.read_pickle(cache_path)
+        except Exception:  # truncated or written by an incompatible pandas
+            pass
+    ig_df = _read_ig(ig_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    ig_df.to_pickle(tmp)
+    tmp.replace(cache_path)
+    return ig_df
+
+
+def _read_ig(ig_path: str) -> pd.DataFrame:
     ig_df = pd.read_excel(ig_path, sheet_name="Variables", engine="openpyxl")
     ig_df = ig_df[~ig_df["Domain"].isna()].copy()
 
@@ -229,17 +279,121 @@ def load_ig(ig_path: str) -> pd.DataFrame:
 
 
 ###############################################################################
-# Core CRF builder
+# Row preparation
 ###############################################################################
 
+# Implementation notes mentioning these get a cross-domain validation hint.
+_DEPENDENCY_HINT = r"if |derive|origin"
+
+
+def _text(col: pd.Series) -> pd.Series:
+    """``str(value)`` for every cell, as the row loop used to do."""
+    return col.astype(object).map(str)
+
+
+def prepare_ig(ig_df: pd.DataFrame, ct_store=None) -> pd.DataFrame:
+    """Derive the display columns of every IG row in one column-wise pass.
+
+    Adds ``Label``/``Type`` text, ``CTText`` (codelist values, or codes, or
+    the terms of *ct_store* when given), ``CTCell`` with its per-domain
+    ``Legend`` number for long CT text, the ``Entry`` control kind with its
+    ``Choices``/``EntryWidth``, per-domain ``Footnote`` numbers and the
+    ``Instructions`` list, so building a document only emits Word XML.
+    """
+    df = ig_df.copy()
+    empty = pd.Series("", index=df.index)
+
+    df["Label"] = _text(df["Display Label"])
+    df["Type"] = _text(df["Type"]) if "Type" in df else empty
+    codes = df.get("CT Codes", pd.Series(None, index=df.index, dtype=object))
+    values = df.get("CT Values", pd.Series(None, index=df.index, dtype=object))
+    ct = _text(values).where(values.notna(), _text(codes).where(codes.notna(), ""))
+    if ct_store is not None:
+        unique = codes.dropna().astype(str).unique()
+        expanded = {
+            code: "; ".join(t.submission_value for t in ct_store.expand(code))
+            for code in unique
+        }
+        terms = codes.astype(object).map(lambda c: expanded.get(str(c), ""))
+        ct = terms.where(codes.notna() & (terms != ""), ct)
+    df["CTText"] = ct
+
+    long_ct = ct.str.len() > 40
+    df["Legend"] = _number_within_domain(df, ct.where(long_ct))
+    df["CTCell"] = ct.where(~long_ct, "\u2020" + df["Legend"].astype(str))
+
+    label_lower = df["Label"].str.lower()
+    is_date = label_lower.str.contains("date", regex=False) | df[
+        "Variable"
+    ].str.upper().str.endswith(("DT", "DAT"))
+    choices = ct.str.split(";")
+    is_checkbox = (ct != "") & (choices.str.len() <= 4)
+    df["Entry"] = "underline"
+    df.loc[is_checkbox, "Entry"] = "checkbox"
+    df.loc[is_date, "Entry"] = "date"
+    df["Choices"] = [
+        [v.strip() for v in vals] if box else []
+        for vals, box in zip(choices, is_checkbox & ~is_date)
+    ]
+    df["EntryWidth"] = ct.str.len().clip(lower=10)
 
-def build_domain_crf(
-    domain_df: pd.DataFrame, domain: str, out_dir: pathlib.Path
-) -> None:
-    """Build a Word document for a single CDASH *domain* and save it to disk."""
+    crf_instr = df.get(
+        "CRF Instructions", pd.Series(None, index=df.index, dtype=object)
+    )
+    notes = df.get(
+        "Implementation Notes", pd.Series(None, index=df.index, dtype=object)
+    )
+    note_text = _text(notes).where(notes.notna())
+    long_note = note_text.str.len() > 60
+    df["Footnote"] = _number_within_domain(df, note_text.where(long_note))
+    note_cell = note_text.where(~long_note, "[" + df["Footnote"].astype(str) + "]")
+    needs_hint = note_text.str.lower().str.contains(_DEPENDENCY_HINT, na=False)
+
+    df["Instructions"] = [
+        [
+            item
+            for item, keep in (
+                (str(instr), pd.notna(instr)),
+                (cell, isinstance(cell, str)),
+                ("Validate dependencies across domains", hint),
+                ("Format: dd/mm/yyyy", date),
+            )
+            if keep
+        ]
+        for instr, cell, hint, date in zip(crf_instr, note_cell, needs_hint, is_date)
+    ]
+    return df
 
-    category, full_title = get_domain_info(domain)
 
+def _number_within_domain(df: pd.DataFrame, keys: pd.Series) -> pd.Series:
+    """1-based first-appearance number (in ``Order``) of each non-null key per domain, else 0."""
+    ordered = df.sort_values("Order", kind="stable").index
+    numbers = (
+        keys.loc[ordered]
+        .groupby(df.loc[ordered, "Domain"], sort=False)
+        .transform(lambda s: pd.Series(pd.factorize(s)[0] + 1, index=s.index))
+    )
+    return numbers.reindex(df.index).fillna(0).astype(int)
+
+
+def _numbered(domain_df: pd.DataFrame, number_col: str, text_col: str):
+    """``(number, text)`` pairs of a prepared domain, in number order."""
+    rows = domain_df.loc[domain_df[number_col] > 0, [number_col, text_col]]
+    rows = rows.drop_duplicates(number_col).sort_values(number_col)
+    return list(rows.itertuples(index=False, name=None))
+
+
+###############################################################################
+# Document skeleton
+###############################################################################
+
+# Stand-in title of the shared skeleton; lower-casing it yields _TITLE_LOWER.
+_TITLE_SLOT = "%TITLE%"
+_TITLE_LOWER = _TITLE_SLOT.lower()
+
+
+def _build_skeleton(full_title: str):
+    """Build everything of a domain CRF up to the SECTION B header row."""
     # ---------------------------------------------------------------------
     #  Document meta & base formatting
     # ---------------------------------------------------------------------
@@ -357,107 +511,236 @@ def build_domain_crf(
         _set_cell_shading(hdr_cells[idx], "4F81BD")
         _style_header_cell(hdr_cells[idx])
 
-    ct_legend: dict[str, int] = {}
-    footnotes: dict[str, int] = {}
+    return document
 
-    # Data rows ordered by the "Variable Order" column
-    for idx, (_, row) in enumerate(domain_df.sort_values("Order").iterrows(), start=1):
-        cells = var_tbl.add_row().cells
-        # 0 Variable name
-        cells[0].text = row["Variable"]
-
-        # 1 Label / Question
-        cells[1].text = str(row["Display Label"])
-
-        # 2 Data type (where available)
-        cells[2].text = str(row.get("Type", ""))
-
-        # 3 Controlled terminology – prefer values over codes
-        ct_val = row.get("CT Values")
-        ct_code = row.get("CT Codes")
-        ct = (
-            str(ct_val)
-            if pd.notna(ct_val)
-            else str(ct_code) if pd.notna(ct_code) else ""
-        )
-        if len(ct) > 40:
-            idx_ct = ct_legend.setdefault(ct, len(ct_legend) + 1)
-            cells[3].text = f"\u2020{idx_ct}"
-        else:
-            cells[3].text = ct
 
+@lru_cache(maxsize=None)
+def _skeleton_docx() -> bytes:
+    """The domain-independent document, built once per process and saved."""
+    buf = io.BytesIO()
+    _build_skeleton(_TITLE_SLOT).save(buf)
+    return buf.getvalue()
+
+
+def _fill_title(elements, full_title: str) -> None:
+    """Replace the skeleton's title slots within *elements*."""
+    for element in elements:
+        for t in element.iter(qn("w:t")):
+            if t.text and "%" in t.text:
+                t.text = t.text.replace(_TITLE_SLOT, full_title).replace(
+                    _TITLE_LOWER, full_title.lower()
+                )
+
+
+###############################################################################
+# Core CRF builder
+###############################################################################
+
+
+def build_domain_crf(
+    domain_df: pd.DataFrame, domain: str, out_dir: pathlib.Path, ct_store=None
+) -> pathlib.Path:
+    """Build a Word document for a single CDASH *domain* and return its path.
+
+    *domain_df* is normally a slice of :func:`prepare_ig` output; raw
+    :func:`load_ig` rows are prepared here, using *ct_store* if given.
+    """
+    if "Entry" not in domain_df.columns:
+        domain_df = prepare_ig(domain_df, ct_store)
+
+    category, full_title = get_domain_info(domain)
+
+    document = Document(io.BytesIO(_skeleton_docx()))
+    section = document.sections[0]
+    _fill_title(
+        (document.element.body, section.header._element, section.footer._element),
+        full_title,
+    )
+    var_tbl = document.tables[-1]
+
+    _add_domain_rows(document, var_tbl, domain_df)
+    _add_ct_legend(document, _numbered(domain_df, "Legend", "CTText"))
+
+    # ---------------------------------------------------------------------
+    #  Save document
+    # ---------------------------------------------------------------------
+    safe_title = full_title.replace(" / ", "_").replace(" ", "_")
+    out_path = out_dir / f"{domain}_{safe_title}_CRF.docx"
+    document.save(out_path)
+    return out_path
+
+
+def _add_domain_rows(document, var_tbl, domain_df: pd.DataFrame) -> None:
+    """Fill the SECTION B table from a prepared domain and add its footnotes."""
+    # Data rows ordered by the "Variable Order" column
+    rows = list(domain_df.sort_values("Order", kind="stable").itertuples(index=False))
+    # Text columns go into the row XML directly; all rows are appended at once.
+    table_cells = append_rows(
+        var_tbl, ((r.Variable, r.Label, r.Type, r.CTCell) for r in rows)
+    )
+    for idx, (row, cells) in enumerate(zip(rows, table_cells), start=1):
         # 4 Data entry placeholder (smart entry controls)
         entry_para = cells[4].paragraphs[0]
-        label_lower = str(row.get("Display Label", "")).lower()
-        var_upper = row["Variable"].upper()
-        if "date" in label_lower or var_upper.endswith(("DT", "DAT")):
+        if row.Entry == "date":
             _add_date_picker(entry_para)
-        elif ct and len(str(ct).split(";")) <= 4:
-            for i, val in enumerate(str(ct).split(";")):
+        elif row.Entry == "checkbox":
+            for i, val in enumerate(row.Choices):
                 if i:
                     entry_para.add_run(" ")
                 _add_checkbox(entry_para)
-                entry_para.add_run(val.strip())
+                entry_para.add_run(val)
         else:
-            expected = max(len(str(ct)), 10)
-            _add_underline_entry(entry_para, expected)
+            _add_underline_entry(entry_para, row.EntryWidth)
 
         # 5 Instructions (italic, stacked if multiple)
-        instructions = []
-        if pd.notna(row.get("CRF Instructions")):
-            instructions.append(str(row.get("CRF Instructions")))
-        impl_note = row.get("Implementation Notes")
-        if pd.notna(impl_note):
-            impl_note = str(impl_note)
-            if len(impl_note) > 60:
-                fn_idx = footnotes.setdefault(impl_note, len(footnotes) + 1)
-                instructions.append(f"[{fn_idx}]")
-            else:
-                instructions.append(impl_note)
-
-            if any(t in impl_note.lower() for t in ["if ", "derive", "origin"]):
-                instructions.append("Validate dependencies across domains")
-
-        # Auto‑detect date fields and add a formatting hint
-        if "date" in label_lower or var_upper.endswith(("DT", "DAT")):
-            instructions.append("Format: dd/mm/yyyy")
-
         instr_para = cells[5].paragraphs[0]
-        for i_ins, item in enumerate(instructions):
+        for i_ins, item in enumerate(row.Instructions):
             run = instr_para.add_run(item)
             run.italic = True
-            if i_ins < len(instructions) - 1:
+            if i_ins < len(row.Instructions) - 1:
                 instr_para.add_run("\n")
 
         if idx % 3 == 0:
             for c in cells:
                 _add_bottom_border(c)
 
+    footnotes = _numbered(domain_df, "Footnote", "Implementation Notes")
     if footnotes:
         document.add_heading("Footnotes", level=2)
-        for text, num in footnotes.items():
+        for num, text in footnotes:
             p = document.add_paragraph()
             p.add_run(f"[{num}] ").bold = True
             p.add_run(text)
 
+
+def _add_ct_legend(document, ct_legend) -> None:
+    """Append the ``(number, CT text)`` legend on a new page, if any."""
     if ct_legend:
         document.add_page_break()
         document.add_heading("Controlled Terminology legend", level=2)
         legend = document.add_table(rows=len(ct_legend) + 1, cols=2, style="Table Grid")
         legend.cell(0, 0).text = "Symbol"
         legend.cell(0, 1).text = "Controlled Terminology"
-        for ct_text, idx_ct in ct_legend.items():
+        for idx_ct, ct_text in ct_legend:
             row_ct = legend.add_row().cells
             row_ct[0].text = f"\u2020{idx_ct}"
             row_ct[1].text = ct_text
 
-    # ---------------------------------------------------------------------
-    #  Save document
-    # ---------------------------------------------------------------------
-    safe_title = full_title.replace(" / ", "_").replace(" ", "_")
-    out_path = out_dir / f"{domain}_{safe_title}_CRF.docx"
-    document.save(out_path)
-    print(f"\u2713 Saved {out_path.relative_to(out_dir.parent)}")
+
+###############################################################################
+# CRF book
+###############################################################################
+
+_BOOK_MARKER = "%BOOK_BODY%"
+
+
+def build_crf_book(jobs, out_path: pathlib.Path) -> pathlib.Path:
+    """Write all prepared ``(domain_df, domain)`` *jobs* into one document.
+
+    Each domain gets its own section with its title in the header and footer.
+    Long CT texts share one legend at the end, numbered across the book. The
+    body XML of every finished domain is serialised to a temporary file and
+    dropped from the tree, so memory stays bounded by the largest domain; the
+    chunks are spliced into ``word/document.xml`` when the package is saved.
+    """
+    document = Document(io.BytesIO(_skeleton_docx()))
+    body = document.element.body
+    body_sect_pr = body.find(qn("w:sectPr"))
+    # Detach the skeleton's body, header and footer content to clone per domain.
+    body_tpl = [e for e in body if e is not body_sect_pr]
+    for e in body_tpl:
+        body.remove(e)
+    header_tpl = list(document.sections[0].header._element)
+    footer_tpl = list(document.sections[0].footer._element)
+
+    legend: Dict[str, int] = {}
+    with tempfile.TemporaryFile() as chunks:
+        for i, (domain_df, domain) in enumerate(jobs):
+            start = time.perf_counter()
+            _, full_title = get_domain_info(domain)
+            if i:
+                section = document.add_section(WD_SECTION.NEW_PAGE)
+                section.header.is_linked_to_previous = False
+                section.footer.is_linked_to_previous = False
+            section = document.sections[-1]
+            filled = [section.header._element, section.footer._element]
+            for part, template in zip(filled, (header_tpl, footer_tpl)):
+                part.clear()
+                part.extend(deepcopy(e) for e in template)
+            content = [deepcopy(e) for e in body_tpl]
+            body_sect_pr.addprevious(content[0])
+            for prev, e in zip(content, content[1:]):
+                prev.addnext(e)
+            _fill_title(filled + content, full_title)
+
+            domain_df = domain_df.sort_values("Order", kind="stable")
+            long_ct = domain_df["Legend"] > 0
+            numbers = [
+                legend.setdefault(text, len(legend) + 1)
+                for text in domain_df.loc[long_ct, "CTText"]
+            ]
+            domain_df = domain_df.assign(CTCell=domain_df["CTCell"].astype(object))
+            domain_df.loc[long_ct, "CTCell"] = [f"\u2020{n}" for n in numbers]
+            _add_domain_rows(document, Table(content[-1], document._body), domain_df)
+            _flush_body(body, chunks)
+            print(f"\u2713 Added {domain} ({time.perf_counter() - start:.2f}s)")
+
+        _add_ct_legend(document, [(n, text) for text, n in legend.items()])
+        _flush_body(body, chunks)
+        document.add_paragraph(_BOOK_MARKER)
+        _save_book(document, chunks, out_path)
+    return out_path
+
+
+def _flush_body(body, chunks) -> None:
+    """Move all body content except the final ``w:sectPr`` into *chunks*."""
+    for element in list(body):
+        if element.tag != qn("w:sectPr"):
+            chunks.write(
+                etree.tostring(element, encoding="UTF-8", xml_declaration=False)
+            )
+            body.remove(element)
+
+
+def _save_book(document, chunks, out_path: pathlib.Path) -> None:
+    """Save *document* with the marker paragraph replaced by the *chunks* file."""
+    package = io.BytesIO()
+    document.save(package)
+    marker = f"<w:t>{_BOOK_MARKER}</w:t>".encode()
+    with zipfile.ZipFile(package) as src, zipfile.ZipFile(
+        out_path, "w", zipfile.ZIP_DEFLATED
+    ) as dst:
+        for info in src.infolist():
+            data = src.read(info)
+            if info.filename != "word/document.xml":
+                dst.writestr(info, data)
+                continue
+            at = data.index(marker)
+            head, tail = data.rindex(b"<w:p>", 0, at), data.index(b"</w:p>", at) + 6
+            with dst.open(info.filename, "w") as out:
+                out.write(data[:head])
+                chunks.seek(0)
+                shutil.copyfileobj(chunks, out)
+                out.write(data[tail:])
+
+
+###############################################################################
+# Parallel build
+###############################################################################
+
+
+def _timed_build(
+    domain_df: pd.DataFrame, domain: str, out_dir: pathlib.Path
+) -> Tuple[pathlib.Path, float]:
+    start = time.perf_counter()
+    out_path = build_domain_crf(domain_df, domain, out_dir)
+    return out_path, time.perf_counter() - start
+
+
+def _report(results, out_dir: pathlib.Path) -> None:
+    """Print one line per built domain, in request order."""
+    for out_path, elapsed in results:
+        print(f"\u2713 Saved {out_path.relative_to(out_dir.parent)} ({elapsed:.2f}s)")
 
 
 ###############################################################################
@@ -482,20 +765,65 @@ def main() -> None:
         metavar="DOMAIN",
         help="Optional domain whitelist (e.g. AE CM VS)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        help="Cache the parsed IG in this directory and reuse it across runs",
+    )
+    parser.add_argument(
+        "--ct-index",
+        help="CT store from scripts/build_ct_index.py used to list codelist terms",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Build domains in N worker processes (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--book",
+        action="store_true",
+        help="Write all domains into a single CRF_Book.docx instead",
+    )
 
     args = parser.parse_args()
     out_dir = pathlib.Path(args.out)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    ig_df = load_ig(args.ig)
+    ct_store = None
+    if args.ct_index:
+        from crfgen.ctstore import CTStore
+
+        ct_store = CTStore(args.ct_index)
+    ig_df = prepare_ig(load_ig(args.ig, args.cache_dir), ct_store)
 
     target_domains = [d.upper() for d in (args.domains or ig_df["Domain"].unique())]
+    frames = dict(tuple(ig_df.groupby("Domain", sort=False)))
+    jobs = []
     for dom in target_domains:
-        dom_df = ig_df[ig_df["Domain"] == dom]
-        if dom_df.empty:
+        if dom not in frames:
             print(f"\u26a0 Domain {dom} not found in IG – skipped")
             continue
-        build_domain_crf(dom_df, dom, out_dir)
+        jobs.append((frames[dom], dom))
+
+    if args.book:
+        out_path = build_crf_book(jobs, out_dir / "CRF_Book.docx")
+        print(f"\u2713 Saved {out_path.relative_to(out_dir.parent)}")
+        return
+
+    workers = min(args.jobs or os.cpu_count() or 1, max(len(jobs), 1))
+    start = time.perf_counter()
+    if workers > 1:
+        # Workers receive only their domain's rows, never the whole IG frame;
+        # results are collected in submission order so output is deterministic.
+        with ProcessPoolExecutor(workers) as pool:
+            futures = [pool.submit(_timed_build, df, dom, out_dir) for df, dom in jobs]
+            _report((f.result() for f in futures), out_dir)
+    else:
+        _report((_timed_build(df, dom, out_dir) for df, dom in jobs), out_dir)
+    if len(jobs) > 1:
+        elapsed = time.perf_counter() - start
+        print(f"\u2713 {len(jobs)} domains in {elapsed:.2f}s ({workers} jobs)")
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 """
 Generates the Python client for the CDISC Library API.
 """
+import re
 import shutil
 import subprocess
 from pathlib import Path
@@ -15,6 +16,86 @@ GENERATED_CLIENT_DIR = Path("cdisc-library-api-client")
 
 OPENAPI_SPEC = Path("openapi/cdisc-library.json")
 
+LAZY_LOADER = """
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = import_module(module, __name__)
+    if module != f".{name}":
+        value = getattr(value, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
+"""
+
+IMPORT_RE = re.compile(r"^from (\.\w+) import (\w+)$", re.MULTILINE)
+
+
+def lazy_init_source(source: str, submodules: list[str]) -> str:
+    """
+    Rewrite a generated package ``__init__`` so names load on first access.
+
+    ``from .x import Y`` lines become entries of a ``_LAZY`` table resolved by
+    a module ``__getattr__`` (PEP 562), and every module in *submodules* is
+    exposed the same way. Static type checkers still see the real imports.
+    """
+    imports = IMPORT_RE.findall(source)
+    names = {name for _, name in imports}
+    submodules = [m for m in submodules if m not in names]
+    if not imports and not submodules:
+        return source
+
+    docstring, body = source.split("\n", 1)
+    rest = IMPORT_RE.sub("", body).strip()
+    lines = [
+        docstring,
+        "",
+        "from importlib import import_module",
+        "from typing import TYPE_CHECKING, Any",
+        "",
+        "if TYPE_CHECKING:",
+        *(f"    from {module} import {name}" for module, name in imports),
+        *(f"    from . import {name}" for name in submodules),
+        "",
+        "_LAZY = {",
+        *(f'    "{name}": "{module}",' for module, name in imports),
+        *(f'    "{name}": ".{name}",' for name in submodules),
+        "}",
+    ]
+    source = "\n".join(lines) + LAZY_LOADER
+    return source + ("\n\n" + rest + "\n" if rest else "")
+
+
+def make_lazy(package_dir: Path) -> None:
+    """
+    Apply :func:`lazy_init_source` to ``models``, ``api`` and its subpackages.
+
+    Importing one endpoint then only loads the models it references instead of
+    the whole SDK.
+    """
+    api_dir = package_dir / "api"
+    packages = [package_dir / "models", api_dir, *sorted(api_dir.iterdir())]
+    for pkg in packages:
+        init = pkg / "__init__.py"
+        if not init.exists():
+            continue
+        submodules = []
+        if pkg.name != "models":
+            submodules = sorted(
+                p.stem if p.is_file() else p.name
+                for p in pkg.iterdir()
+                if (p.suffix == ".py" and p.stem != "__init__")
+                or (p / "__init__.py").exists()
+            )
+        init.write_text(lazy_init_source(init.read_text(), submodules))
+
 
 def generate_client():
     """
@@ -57,7 +138,10 @@ def generate_client():
     print(f"Moving generated code from {generated_code_dir} to {FINAL_CLIENT_DIR}...")
     shutil.move(str(generated_code_dir), str(FINAL_CLIENT_DIR))
 
-    # 5. Clean up the now-empty generated client directory
+    # 5. Defer model/endpoint imports until they are first used
+    make_lazy(FINAL_CLIENT_DIR)
+
+    # 6. Clean up the now-empty generated client directory
     print(f"Cleaning up {GENERATED_CLIENT_DIR}...")
     shutil.rmtree(GENERATED_CLIENT_DIR)
 
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Serve recorded CDISC Library responses locally for offline load testing.
+"""
+import argparse
+import time
+
+from crfgen.mockserver import MockLibrary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--fixtures",
+        default="tests/fixtures/crawl_fixture.json",
+        help="JSON mapping of Library URLs to recorded payloads",
+    )
+    parser.add_argument(
+        "--spec",
+        default="openapi/cdisc-library.json",
+        help="OpenAPI spec used to synthesise unrecorded paths ('' to disable)",
+    )
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds per response"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Random extra seconds"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Fraction of 503 responses"
+    )
+    parser.add_argument(
+        "--rate-limit", type=float, help="Requests per second before answering 429"
+    )
+    parser.add_argument("--seed", type=int, help="Seed for errors and jitter")
+    args = parser.parse_args()
+
+    server = MockLibrary.from_file(
+        args.fixtures,
+        spec=args.spec or None,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        seed=args.seed,
+        port=args.port,
+    )
+    with server:
+        print(f"[mock] Serving CDISC Library stand-in at {server.base_url}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print(f"[mock] Responses by status: {dict(server.requests)}")
+
+
+if __name__ == "__main__":
+    main()
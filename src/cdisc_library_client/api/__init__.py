@@ -1 +1,47 @@
 """Contains methods for accessing the API"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import analysis_data_model_and_implementation_guide_a_da_m_and_a_da_mig
+    from . import cdash_implementation_guide_cdashig
+    from . import clinical_data_acquisition_standards_harmonization_cdash
+    from . import controlled_terminology_ct
+    from . import default
+    from . import measures
+    from . import sdtm_implementation_guide_sdtmig
+    from . import searches
+    from . import send_implementation_guide_sendig
+    from . import statuses
+    from . import study_data_tabulation_model_sdtm
+
+_LAZY = {
+    "analysis_data_model_and_implementation_guide_a_da_m_and_a_da_mig": ".analysis_data_model_and_implementation_guide_a_da_m_and_a_da_mig",
+    "cdash_implementation_guide_cdashig": ".cdash_implementation_guide_cdashig",
+    "clinical_data_acquisition_standards_harmonization_cdash": ".clinical_data_acquisition_standards_harmonization_cdash",
+    "controlled_terminology_ct": ".controlled_terminology_ct",
+    "default": ".default",
+    "measures": ".measures",
+    "sdtm_implementation_guide_sdtmig": ".sdtm_implementation_guide_sdtmig",
+    "searches": ".searches",
+    "send_implementation_guide_sendig": ".send_implementation_guide_sendig",
+    "statuses": ".statuses",
+    "study_data_tabulation_model_sdtm": ".study_data_tabulation_model_sdtm",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = import_module(module, __name__)
+    if module != f".{name}":
+        value = getattr(value, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
@@ -1 +1,39 @@
 """Contains endpoint functions for accessing the API"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import get_mdr_adam_product
+    from . import get_mdr_adam_product_datastructures
+    from . import get_mdr_adam_product_datastructures_structure
+    from . import get_mdr_adam_product_datastructures_structure_variables
+    from . import get_mdr_adam_product_datastructures_structure_variables_var
+    from . import get_mdr_adam_product_datastructures_structure_varsets
+    from . import get_mdr_adam_product_datastructures_structure_varsets_varset
+
+_LAZY = {
+    "get_mdr_adam_product": ".get_mdr_adam_product",
+    "get_mdr_adam_product_datastructures": ".get_mdr_adam_product_datastructures",
+    "get_mdr_adam_product_datastructures_structure": ".get_mdr_adam_product_datastructures_structure",
+    "get_mdr_adam_product_datastructures_structure_variables": ".get_mdr_adam_product_datastructures_structure_variables",
+    "get_mdr_adam_product_datastructures_structure_variables_var": ".get_mdr_adam_product_datastructures_structure_variables_var",
+    "get_mdr_adam_product_datastructures_structure_varsets": ".get_mdr_adam_product_datastructures_structure_varsets",
+    "get_mdr_adam_product_datastructures_structure_varsets_varset": ".get_mdr_adam_product_datastructures_structure_varsets_varset",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = import_module(module, __name__)
+    if module != f".{name}":
+        value = getattr(value, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
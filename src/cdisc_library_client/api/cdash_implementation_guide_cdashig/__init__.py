@@ -1 +1,55 @@
 """Contains endpoint functions for accessing the API"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import get_mdr_cdashig_version
+    from . import get_mdr_cdashig_version_classes
+    from . import get_mdr_cdashig_version_classes_class
+    from . import get_mdr_cdashig_version_classes_class_domains
+    from . import get_mdr_cdashig_version_classes_class_scenarios
+    from . import get_mdr_cdashig_version_domains
+    from . import get_mdr_cdashig_version_domains_domain
+    from . import get_mdr_cdashig_version_domains_domain_fields
+    from . import get_mdr_cdashig_version_domains_domain_fields_field
+    from . import get_mdr_cdashig_version_scenarios
+    from . import get_mdr_cdashig_version_scenarios_domain_scenario
+    from . import get_mdr_cdashig_version_scenarios_domain_scenario_fields
+    from . import get_mdr_cdashig_version_scenarios_domain_scenario_fields_field
+    from . import get_mdr_root_cdashig_domains_domain_fields_field
+    from . import get_mdr_root_cdashig_scenarios_domain_scenario_fields_field
+
+_LAZY = {
+    "get_mdr_cdashig_version": ".get_mdr_cdashig_version",
+    "get_mdr_cdashig_version_classes": ".get_mdr_cdashig_version_classes",
+    "get_mdr_cdashig_version_classes_class": ".get_mdr_cdashig_version_classes_class",
+    "get_mdr_cdashig_version_classes_class_domains": ".get_mdr_cdashig_version_classes_class_domains",
+    "get_mdr_cdashig_version_classes_class_scenarios": ".get_mdr_cdashig_version_classes_class_scenarios",
+    "get_mdr_cdashig_version_domains": ".get_mdr_cdashig_version_domains",
+    "get_mdr_cdashig_version_domains_domain": ".get_mdr_cdashig_version_domains_domain",
+    "get_mdr_cdashig_version_domains_domain_fields": ".get_mdr_cdashig_version_domains_domain_fields",
+    "get_mdr_cdashig_version_domains_domain_fields_field": ".get_mdr_cdashig_version_domains_domain_fields_field",
+    "get_mdr_cdashig_version_scenarios": ".get_mdr_cdashig_version_scenarios",
+    "get_mdr_cdashig_version_scenarios_domain_scenario": ".get_mdr_cdashig_version_scenarios_domain_scenario",
+    "get_mdr_cdashig_version_scenarios_domain_scenario_fields": ".get_mdr_cdashig_version_scenarios_domain_scenario_fields",
+    "get_mdr_cdashig_version_scenarios_domain_scenario_fields_field": ".get_mdr_cdashig_version_scenarios_domain_scenario_fields_field",
+    "get_mdr_root_cdashig_domains_domain_fields_field": ".get_mdr_root_cdashig_domains_domain_fields_field",
+    "get_mdr_root_cdashig_scenarios_domain_scenario_fields_field": ".get_mdr_root_cdashig_scenarios_domain_scenario_fields_field",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = import_module(module, __name__)
+    if module != f".{name}":
+        value = getattr(value, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
@@ -1 +1,41 @@
 """Contains endpoint functions for accessing the API"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import get_mdr_ct_packages
+    from . import get_mdr_ct_packages_package_codelists
+    from . import get_mdr_ct_packages_package_codelists_codelist
+    from . import get_mdr_ct_packages_package_codelists_codelist_terms
+    from . import get_mdr_ct_packages_package_codelists_codelist_terms_term
+    from . import get_mdr_ct_packages_product
+    from . import get_mdr_root_ct_product_group_codelists_codelist
+    from . import get_mdr_root_ct_product_group_codelists_codelist_terms_term
+
+_LAZY = {
+    "get_mdr_ct_packages": ".get_mdr_ct_packages",
+    "get_mdr_ct_packages_package_codelists": ".get_mdr_ct_packages_package_codelists",
+    "get_mdr_ct_packages_package_codelists_codelist": ".get_mdr_ct_packages_package_codelists_codelist",
+    "get_mdr_ct_packages_package_codelists_codelist_terms": ".get_mdr_ct_packages_package_codelists_codelist_terms",
+    "get_mdr_ct_packages_package_codelists_codelist_terms_term": ".get_mdr_ct_packages_package_codelists_codelist_terms_term",
+    "get_mdr_ct_packages_product": ".get_mdr_ct_packages_product",
+    "get_mdr_root_ct_product_group_codelists_codelist": ".get_mdr_root_ct_product_group_codelists_codelist",
+    "get_mdr_root_ct_product_group_codelists_codelist_terms_term": ".get_mdr_root_ct_product_group_codelists_codelist_terms_term",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = import_module(module, __name__)
+    if module != f".{name}":
+        value = getattr(value, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
@@ -1 +1,41 @@
 """Contains endpoint functions for accessing the API"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import get_mdr_about
+    from . import get_mdr_lastupdated
+    from . import get_mdr_products
+    from . import get_mdr_products_data_analysis
+    from . import get_mdr_products_data_collection
+    from . import get_mdr_products_data_tabulation
+    from . import get_mdr_products_measures
+    from . import get_mdr_products_terminology
+
+_LAZY = {
+    "get_mdr_about": ".get_mdr_about",
+    "get_mdr_lastupdated": ".get_mdr_lastupdated",
+    "get_mdr_products": ".get_mdr_products",
+    "get_mdr_products_data_analysis": ".get_mdr_products_data_analysis",
+    "get_mdr_products_data_collection": ".get_mdr_products_data_collection",
+    "get_mdr_products_data_tabulation": ".get_mdr_products_data_tabulation",
+    "get_mdr_products_measures": ".get_mdr_products_measures",
+    "get_mdr_products_terminology": ".get_mdr_products_terminology",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = import_module(module, __name__)
+    if module != f".{name}":
+        value = getattr(value, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
@@ -1 +1,35 @@
 """Contains endpoint functions for accessing the API"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import get_mdr_qrs_measure_version
+    from . import get_mdr_qrs_measure_version_items
+    from . import get_mdr_qrs_measure_version_items_item
+    from . import get_mdr_qrs_measure_version_responsegroups
+    from . import get_mdr_qrs_measure_version_responsegroups_responsegroup
+
+_LAZY = {
+    "get_mdr_qrs_measure_version": ".get_mdr_qrs_measure_version",
+    "get_mdr_qrs_measure_version_items": ".get_mdr_qrs_measure_version_items",
+    "get_mdr_qrs_measure_version_items_item": ".get_mdr_qrs_measure_version_items_item",
+    "get_mdr_qrs_measure_version_responsegroups": ".get_mdr_qrs_measure_version_responsegroups",
+    "get_mdr_qrs_measure_version_responsegroups_responsegroup": ".get_mdr_qrs_measure_version_responsegroups_responsegroup",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = import_module(module, __name__)
+    if module != f".{name}":
+        value = getattr(value, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
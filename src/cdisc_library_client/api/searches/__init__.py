@@ -1 +1,31 @@
 """Contains endpoint functions for accessing the API"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import get_mdr_search
+    from . import get_mdr_search_scopes
+    from . import get_mdr_search_scopes_scope
+
+_LAZY = {
+    "get_mdr_search": ".get_mdr_search",
+    "get_mdr_search_scopes": ".get_mdr_search_scopes",
+    "get_mdr_search_scopes_scope": ".get_mdr_search_scopes_scope",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = import_module(module, __name__)
+    if module != f".{name}":
+        value = getattr(value, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
@@ -1 +1,49 @@
 """Contains endpoint functions for accessing the API"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import get_mdr_root_sdtm_classes_class_variables_var
+    from . import get_mdr_root_sdtm_datasets_dataset_variables_var
+    from . import get_mdr_sdtm_version
+    from . import get_mdr_sdtm_version_classes
+    from . import get_mdr_sdtm_version_classes_class
+    from . import get_mdr_sdtm_version_classes_class_datasets
+    from . import get_mdr_sdtm_version_classes_class_variables
+    from . import get_mdr_sdtm_version_classes_class_variables_var
+    from . import get_mdr_sdtm_version_datasets
+    from . import get_mdr_sdtm_version_datasets_dataset
+    from . import get_mdr_sdtm_version_datasets_dataset_variables
+    from . import get_mdr_sdtm_version_datasets_dataset_variables_var
+
+_LAZY = {
+    "get_mdr_root_sdtm_classes_class_variables_var": ".get_mdr_root_sdtm_classes_class_variables_var",
+    "get_mdr_root_sdtm_datasets_dataset_variables_var": ".get_mdr_root_sdtm_datasets_dataset_variables_var",
+    "get_mdr_sdtm_version": ".get_mdr_sdtm_version",
+    "get_mdr_sdtm_version_classes": ".get_mdr_sdtm_version_classes",
+    "get_mdr_sdtm_version_classes_class": ".get_mdr_sdtm_version_classes_class",
+    "get_mdr_sdtm_version_classes_class_datasets": ".get_mdr_sdtm_version_classes_class_datasets",
+    "get_mdr_sdtm_version_classes_class_variables": ".get_mdr_sdtm_version_classes_class_variables",
+    "get_mdr_sdtm_version_classes_class_variables_var": ".get_mdr_sdtm_version_classes_class_variables_var",
+    "get_mdr_sdtm_version_datasets": ".get_mdr_sdtm_version_datasets",
+    "get_mdr_sdtm_version_datasets_dataset": ".get_mdr_sdtm_version_datasets_dataset",
+    "get_mdr_sdtm_version_datasets_dataset_variables": ".get_mdr_sdtm_version_datasets_dataset_variables",
+    "get_mdr_sdtm_version_datasets_dataset_variables_var": ".get_mdr_sdtm_version_datasets_dataset_variables_var",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = import_module(module, __name__)
+    if module != f".{name}":
+        value = getattr(value, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
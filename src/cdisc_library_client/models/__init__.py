@@ -1,434 +1,887 @@
 """Contains all the data models used in inputs/outputs"""
 
-from .about import About
-from .about_links import AboutLinks
-from .about_ref import AboutRef
-from .adam_datastructure import AdamDatastructure
-from .adam_datastructure_links import AdamDatastructureLinks
-from .adam_datastructure_ref import AdamDatastructureRef
-from .adam_datastructure_ref_element import AdamDatastructureRefElement
-from .adam_datastructure_variables import AdamDatastructureVariables
-from .adam_datastructure_variables_links import AdamDatastructureVariablesLinks
-from .adam_datastructure_variables_ref import AdamDatastructureVariablesRef
-from .adam_datastructure_varsets import AdamDatastructureVarsets
-from .adam_datastructure_varsets_links import AdamDatastructureVarsetsLinks
-from .adam_datastructure_varsets_ref import AdamDatastructureVarsetsRef
-from .adam_product import AdamProduct
-from .adam_product_datastructures import AdamProductDatastructures
-from .adam_product_datastructures_links import AdamProductDatastructuresLinks
-from .adam_product_datastructures_ref import AdamProductDatastructuresRef
-from .adam_product_links import AdamProductLinks
-from .adam_product_ref import AdamProductRef
-from .adam_product_ref_element import AdamProductRefElement
-from .adam_variable import AdamVariable
-from .adam_variable_links import AdamVariableLinks
-from .adam_variable_ref import AdamVariableRef
-from .adam_variable_ref_element import AdamVariableRefElement
-from .adam_varset import AdamVarset
-from .adam_varset_links import AdamVarsetLinks
-from .adam_varset_ref import AdamVarsetRef
-from .adam_varset_ref_element import AdamVarsetRefElement
-from .cdash_class import CdashClass
-from .cdash_class_domains import CdashClassDomains
-from .cdash_class_domains_links import CdashClassDomainsLinks
-from .cdash_class_domains_ref import CdashClassDomainsRef
-from .cdash_class_field import CdashClassField
-from .cdash_class_field_links import CdashClassFieldLinks
-from .cdash_class_field_ref import CdashClassFieldRef
-from .cdash_class_field_ref_version import CdashClassFieldRefVersion
-from .cdash_class_links import CdashClassLinks
-from .cdash_class_ref import CdashClassRef
-from .cdash_class_ref_element import CdashClassRefElement
-from .cdash_domain import CdashDomain
-from .cdash_domain_field import CdashDomainField
-from .cdash_domain_field_links import CdashDomainFieldLinks
-from .cdash_domain_field_ref import CdashDomainFieldRef
-from .cdash_domain_field_ref_element import CdashDomainFieldRefElement
-from .cdash_domain_field_ref_version import CdashDomainFieldRefVersion
-from .cdash_domain_fields import CdashDomainFields
-from .cdash_domain_fields_links import CdashDomainFieldsLinks
-from .cdash_domain_fields_ref import CdashDomainFieldsRef
-from .cdash_domain_links import CdashDomainLinks
-from .cdash_domain_ref import CdashDomainRef
-from .cdash_domain_ref_element import CdashDomainRefElement
-from .cdash_product import CdashProduct
-from .cdash_product_classes import CdashProductClasses
-from .cdash_product_classes_links import CdashProductClassesLinks
-from .cdash_product_classes_ref import CdashProductClassesRef
-from .cdash_product_domains import CdashProductDomains
-from .cdash_product_domains_links import CdashProductDomainsLinks
-from .cdash_product_domains_ref import CdashProductDomainsRef
-from .cdash_product_links import CdashProductLinks
-from .cdash_product_ref import CdashProductRef
-from .cdash_product_ref_element import CdashProductRefElement
-from .cdashig_class import CdashigClass
-from .cdashig_class_domains import CdashigClassDomains
-from .cdashig_class_domains_links import CdashigClassDomainsLinks
-from .cdashig_class_domains_ref import CdashigClassDomainsRef
-from .cdashig_class_links import CdashigClassLinks
-from .cdashig_class_ref import CdashigClassRef
-from .cdashig_class_ref_element import CdashigClassRefElement
-from .cdashig_class_ref_subclass import CdashigClassRefSubclass
-from .cdashig_class_scenarios import CdashigClassScenarios
-from .cdashig_class_scenarios_links import CdashigClassScenariosLinks
-from .cdashig_class_scenarios_ref import CdashigClassScenariosRef
-from .cdashig_domain import CdashigDomain
-from .cdashig_domain_field import CdashigDomainField
-from .cdashig_domain_field_links import CdashigDomainFieldLinks
-from .cdashig_domain_field_ref import CdashigDomainFieldRef
-from .cdashig_domain_field_ref_element import CdashigDomainFieldRefElement
-from .cdashig_domain_field_ref_version import CdashigDomainFieldRefVersion
-from .cdashig_domain_fields import CdashigDomainFields
-from .cdashig_domain_fields_links import CdashigDomainFieldsLinks
-from .cdashig_domain_fields_ref import CdashigDomainFieldsRef
-from .cdashig_domain_links import CdashigDomainLinks
-from .cdashig_domain_ref import CdashigDomainRef
-from .cdashig_domain_ref_element import CdashigDomainRefElement
-from .cdashig_product import CdashigProduct
-from .cdashig_product_classes import CdashigProductClasses
-from .cdashig_product_classes_links import CdashigProductClassesLinks
-from .cdashig_product_classes_ref import CdashigProductClassesRef
-from .cdashig_product_domains import CdashigProductDomains
-from .cdashig_product_domains_links import CdashigProductDomainsLinks
-from .cdashig_product_domains_ref import CdashigProductDomainsRef
-from .cdashig_product_links import CdashigProductLinks
-from .cdashig_product_ref import CdashigProductRef
-from .cdashig_product_ref_element import CdashigProductRefElement
-from .cdashig_product_scenarios import CdashigProductScenarios
-from .cdashig_product_scenarios_links import CdashigProductScenariosLinks
-from .cdashig_product_scenarios_ref import CdashigProductScenariosRef
-from .cdashig_scenario import CdashigScenario
-from .cdashig_scenario_field import CdashigScenarioField
-from .cdashig_scenario_field_links import CdashigScenarioFieldLinks
-from .cdashig_scenario_field_ref import CdashigScenarioFieldRef
-from .cdashig_scenario_field_ref_element import CdashigScenarioFieldRefElement
-from .cdashig_scenario_field_ref_version import CdashigScenarioFieldRefVersion
-from .cdashig_scenario_fields import CdashigScenarioFields
-from .cdashig_scenario_fields_links import CdashigScenarioFieldsLinks
-from .cdashig_scenario_fields_ref import CdashigScenarioFieldsRef
-from .cdashig_scenario_links import CdashigScenarioLinks
-from .cdashig_scenario_ref import CdashigScenarioRef
-from .cdashig_scenario_ref_element import CdashigScenarioRefElement
-from .ct_codelist import CtCodelist
-from .ct_codelist_links import CtCodelistLinks
-from .ct_codelist_ref import CtCodelistRef
-from .ct_codelist_ref_element import CtCodelistRefElement
-from .ct_codelist_ref_version import CtCodelistRefVersion
-from .ct_codelist_terms import CtCodelistTerms
-from .ct_codelist_terms_links import CtCodelistTermsLinks
-from .ct_codelist_terms_ref import CtCodelistTermsRef
-from .ct_package import CtPackage
-from .ct_package_codelists import CtPackageCodelists
-from .ct_package_codelists_links import CtPackageCodelistsLinks
-from .ct_package_codelists_ref import CtPackageCodelistsRef
-from .ct_package_links import CtPackageLinks
-from .ct_package_ref import CtPackageRef
-from .ct_package_ref_element import CtPackageRefElement
-from .ct_package_term import CtPackageTerm
-from .ct_packages import CtPackages
-from .ct_packages_links import CtPackagesLinks
-from .ct_packages_ref import CtPackagesRef
-from .ct_term import CtTerm
-from .ct_term_links import CtTermLinks
-from .ct_term_ref import CtTermRef
-from .ct_term_ref_element import CtTermRefElement
-from .ct_term_ref_version import CtTermRefVersion
-from .default_error_response import DefaultErrorResponse
-from .default_search_response import DefaultSearchResponse
-from .default_search_response_hits_item import DefaultSearchResponseHitsItem
-from .default_search_scopes import DefaultSearchScopes
-from .export_adam_datastructures_row import ExportAdamDatastructuresRow
-from .export_adam_datastructures_table import ExportAdamDatastructuresTable
-from .export_adam_variables_row import ExportAdamVariablesRow
-from .export_adam_variables_table import ExportAdamVariablesTable
-from .export_adam_workbook import ExportAdamWorkbook
-from .export_cdash_class_variables_row import ExportCdashClassVariablesRow
-from .export_cdash_domain_variables_row import ExportCdashDomainVariablesRow
-from .export_cdash_table import ExportCdashTable
-from .export_cdashig_domain_variables_row import ExportCdashigDomainVariablesRow
-from .export_cdashig_scenario_variables_row import ExportCdashigScenarioVariablesRow
-from .export_cdashig_table import ExportCdashigTable
-from .export_ct_codelist import ExportCtCodelist
-from .export_ct_table import ExportCtTable
-from .export_ct_term import ExportCtTerm
-from .export_qrs_csv_items_row import ExportQrsCsvItemsRow
-from .export_qrs_general import ExportQrsGeneral
-from .export_qrs_items_table import ExportQrsItemsTable
-from .export_qrs_responses import ExportQrsResponses
-from .export_qrs_workbook import ExportQrsWorkbook
-from .export_qrs_workbook_items_row import ExportQrsWorkbookItemsRow
-from .export_sdtm_class_variables_row import ExportSdtmClassVariablesRow
-from .export_sdtm_dataset_variables_row import ExportSdtmDatasetVariablesRow
-from .export_sdtm_datasets_row import ExportSdtmDatasetsRow
-from .export_sdtm_datasets_table import ExportSdtmDatasetsTable
-from .export_sdtm_variables_table import ExportSdtmVariablesTable
-from .export_sdtm_workbook import ExportSdtmWorkbook
-from .export_sdtmig_datasets_row import ExportSdtmigDatasetsRow
-from .export_sdtmig_datasets_table import ExportSdtmigDatasetsTable
-from .export_sdtmig_variables_row import ExportSdtmigVariablesRow
-from .export_sdtmig_variables_table import ExportSdtmigVariablesTable
-from .export_sdtmig_workbook import ExportSdtmigWorkbook
-from .export_sendig_datasets_row import ExportSendigDatasetsRow
-from .export_sendig_datasets_table import ExportSendigDatasetsTable
-from .export_sendig_variables_row import ExportSendigVariablesRow
-from .export_sendig_variables_table import ExportSendigVariablesTable
-from .export_sendig_workbook import ExportSendigWorkbook
-from .get_mdr_search_scopes_response_200 import GetMdrSearchScopesResponse200
-from .health import Health
-from .lastupdated import Lastupdated
-from .lastupdated_links import LastupdatedLinks
-from .lastupdated_ref import LastupdatedRef
-from .maintenance_body import MaintenanceBody
-from .productgroup_data_analysis import ProductgroupDataAnalysis
-from .productgroup_data_analysis_links import ProductgroupDataAnalysisLinks
-from .productgroup_data_collection import ProductgroupDataCollection
-from .productgroup_data_collection_links import ProductgroupDataCollectionLinks
-from .productgroup_data_tabulation import ProductgroupDataTabulation
-from .productgroup_data_tabulation_links import ProductgroupDataTabulationLinks
-from .productgroup_qrs import ProductgroupQrs
-from .productgroup_qrs_links import ProductgroupQrsLinks
-from .productgroup_ref import ProductgroupRef
-from .productgroup_terminology import ProductgroupTerminology
-from .productgroup_terminology_links import ProductgroupTerminologyLinks
-from .products import Products
-from .products_links import ProductsLinks
-from .products_ref import ProductsRef
-from .qrs_item import QrsItem
-from .qrs_item_links import QrsItemLinks
-from .qrs_item_ref_element import QrsItemRefElement
-from .qrs_items import QrsItems
-from .qrs_items_links import QrsItemsLinks
-from .qrs_items_ref import QrsItemsRef
-from .qrs_product import QrsProduct
-from .qrs_product_links import QrsProductLinks
-from .qrs_product_ref import QrsProductRef
-from .qrs_ref_element import QrsRefElement
-from .qrs_response_links import QrsResponseLinks
-from .qrs_responsegroup import QrsResponsegroup
-from .qrs_responsegroup_links import QrsResponsegroupLinks
-from .qrs_responsegroup_ref import QrsResponsegroupRef
-from .qrs_responsegroup_ref_element import QrsResponsegroupRefElement
-from .qrs_responsegroups import QrsResponsegroups
-from .qrs_responsegroups_links import QrsResponsegroupsLinks
-from .qrs_responsegroups_ref import QrsResponsegroupsRef
-from .qrs_responses import QrsResponses
-from .root_cdash_class_field import RootCdashClassField
-from .root_cdash_class_field_links import RootCdashClassFieldLinks
-from .root_cdash_class_field_ref import RootCdashClassFieldRef
-from .root_cdash_domain_field import RootCdashDomainField
-from .root_cdash_domain_field_links import RootCdashDomainFieldLinks
-from .root_cdash_domain_field_ref import RootCdashDomainFieldRef
-from .root_cdashig_domain_field import RootCdashigDomainField
-from .root_cdashig_domain_field_links import RootCdashigDomainFieldLinks
-from .root_cdashig_domain_field_ref import RootCdashigDomainFieldRef
-from .root_cdashig_scenario_field import RootCdashigScenarioField
-from .root_cdashig_scenario_field_links import RootCdashigScenarioFieldLinks
-from .root_cdashig_scenario_field_ref import RootCdashigScenarioFieldRef
-from .root_ct_codelist import RootCtCodelist
-from .root_ct_codelist_links import RootCtCodelistLinks
-from .root_ct_codelist_ref import RootCtCodelistRef
-from .root_ct_codelist_ref_element import RootCtCodelistRefElement
-from .root_ct_term import RootCtTerm
-from .root_ct_term_links import RootCtTermLinks
-from .root_ct_term_ref import RootCtTermRef
-from .root_sdtm_class_variable import RootSdtmClassVariable
-from .root_sdtm_class_variable_links import RootSdtmClassVariableLinks
-from .root_sdtm_class_variable_ref import RootSdtmClassVariableRef
-from .root_sdtm_dataset_variable import RootSdtmDatasetVariable
-from .root_sdtm_dataset_variable_links import RootSdtmDatasetVariableLinks
-from .root_sdtm_dataset_variable_ref import RootSdtmDatasetVariableRef
-from .root_sdtmig_dataset_variable import RootSdtmigDatasetVariable
-from .root_sdtmig_dataset_variable_links import RootSdtmigDatasetVariableLinks
-from .root_sdtmig_dataset_variable_ref import RootSdtmigDatasetVariableRef
-from .root_sendig_dataset_variable import RootSendigDatasetVariable
-from .root_sendig_dataset_variable_links import RootSendigDatasetVariableLinks
-from .root_sendig_dataset_variable_ref import RootSendigDatasetVariableRef
-from .scope_values import ScopeValues
-from .sdtm_class import SdtmClass
-from .sdtm_class_datasets import SdtmClassDatasets
-from .sdtm_class_datasets_links import SdtmClassDatasetsLinks
-from .sdtm_class_datasets_ref import SdtmClassDatasetsRef
-from .sdtm_class_links import SdtmClassLinks
-from .sdtm_class_ref import SdtmClassRef
-from .sdtm_class_ref_element import SdtmClassRefElement
-from .sdtm_class_ref_subclass import SdtmClassRefSubclass
-from .sdtm_class_variable import SdtmClassVariable
-from .sdtm_class_variable_links import SdtmClassVariableLinks
-from .sdtm_class_variable_ref import SdtmClassVariableRef
-from .sdtm_class_variable_ref_element import SdtmClassVariableRefElement
-from .sdtm_class_variable_ref_qualifies import SdtmClassVariableRefQualifies
-from .sdtm_class_variable_ref_target import SdtmClassVariableRefTarget
-from .sdtm_class_variable_ref_version import SdtmClassVariableRefVersion
-from .sdtm_class_variables import SdtmClassVariables
-from .sdtm_class_variables_links import SdtmClassVariablesLinks
-from .sdtm_class_variables_ref import SdtmClassVariablesRef
-from .sdtm_classes import SdtmClasses
-from .sdtm_classes_links import SdtmClassesLinks
-from .sdtm_classes_ref import SdtmClassesRef
-from .sdtm_dataset import SdtmDataset
-from .sdtm_dataset_links import SdtmDatasetLinks
-from .sdtm_dataset_ref import SdtmDatasetRef
-from .sdtm_dataset_ref_element import SdtmDatasetRefElement
-from .sdtm_dataset_variable import SdtmDatasetVariable
-from .sdtm_dataset_variable_links import SdtmDatasetVariableLinks
-from .sdtm_dataset_variable_ref import SdtmDatasetVariableRef
-from .sdtm_dataset_variable_ref_element import SdtmDatasetVariableRefElement
-from .sdtm_dataset_variable_ref_target import SdtmDatasetVariableRefTarget
-from .sdtm_dataset_variable_ref_version import SdtmDatasetVariableRefVersion
-from .sdtm_dataset_variables import SdtmDatasetVariables
-from .sdtm_dataset_variables_links import SdtmDatasetVariablesLinks
-from .sdtm_dataset_variables_ref import SdtmDatasetVariablesRef
-from .sdtm_datasets import SdtmDatasets
-from .sdtm_datasets_links import SdtmDatasetsLinks
-from .sdtm_datasets_ref import SdtmDatasetsRef
-from .sdtm_product import SdtmProduct
-from .sdtm_product_links import SdtmProductLinks
-from .sdtm_product_ref import SdtmProductRef
-from .sdtm_product_ref_element import SdtmProductRefElement
-from .sdtmig_class import SdtmigClass
-from .sdtmig_class_datasets import SdtmigClassDatasets
-from .sdtmig_class_datasets_links import SdtmigClassDatasetsLinks
-from .sdtmig_class_datasets_ref import SdtmigClassDatasetsRef
-from .sdtmig_class_links import SdtmigClassLinks
-from .sdtmig_class_ref import SdtmigClassRef
-from .sdtmig_class_ref_element import SdtmigClassRefElement
-from .sdtmig_class_ref_subclass import SdtmigClassRefSubclass
-from .sdtmig_classes import SdtmigClasses
-from .sdtmig_classes_links import SdtmigClassesLinks
-from .sdtmig_classes_ref import SdtmigClassesRef
-from .sdtmig_dataset import SdtmigDataset
-from .sdtmig_dataset_links import SdtmigDatasetLinks
-from .sdtmig_dataset_ref import SdtmigDatasetRef
-from .sdtmig_dataset_ref_element import SdtmigDatasetRefElement
-from .sdtmig_dataset_variable import SdtmigDatasetVariable
-from .sdtmig_dataset_variable_links import SdtmigDatasetVariableLinks
-from .sdtmig_dataset_variable_ref import SdtmigDatasetVariableRef
-from .sdtmig_dataset_variable_ref_element import SdtmigDatasetVariableRefElement
-from .sdtmig_dataset_variable_ref_target import SdtmigDatasetVariableRefTarget
-from .sdtmig_dataset_variable_ref_version import SdtmigDatasetVariableRefVersion
-from .sdtmig_dataset_variables import SdtmigDatasetVariables
-from .sdtmig_dataset_variables_links import SdtmigDatasetVariablesLinks
-from .sdtmig_dataset_variables_ref import SdtmigDatasetVariablesRef
-from .sdtmig_datasets import SdtmigDatasets
-from .sdtmig_datasets_links import SdtmigDatasetsLinks
-from .sdtmig_datasets_ref import SdtmigDatasetsRef
-from .sdtmig_product import SdtmigProduct
-from .sdtmig_product_links import SdtmigProductLinks
-from .sdtmig_product_ref import SdtmigProductRef
-from .sdtmig_product_ref_element import SdtmigProductRefElement
-from .sendig_class import SendigClass
-from .sendig_class_datasets import SendigClassDatasets
-from .sendig_class_datasets_links import SendigClassDatasetsLinks
-from .sendig_class_datasets_ref import SendigClassDatasetsRef
-from .sendig_class_links import SendigClassLinks
-from .sendig_class_ref import SendigClassRef
-from .sendig_class_ref_element import SendigClassRefElement
-from .sendig_class_ref_subclass import SendigClassRefSubclass
-from .sendig_classes import SendigClasses
-from .sendig_classes_links import SendigClassesLinks
-from .sendig_classes_ref import SendigClassesRef
-from .sendig_dataset import SendigDataset
-from .sendig_dataset_links import SendigDatasetLinks
-from .sendig_dataset_ref import SendigDatasetRef
-from .sendig_dataset_ref_element import SendigDatasetRefElement
-from .sendig_dataset_variable import SendigDatasetVariable
-from .sendig_dataset_variable_links import SendigDatasetVariableLinks
-from .sendig_dataset_variable_ref import SendigDatasetVariableRef
-from .sendig_dataset_variable_ref_element import SendigDatasetVariableRefElement
-from .sendig_dataset_variable_ref_version import SendigDatasetVariableRefVersion
-from .sendig_dataset_variables import SendigDatasetVariables
-from .sendig_dataset_variables_links import SendigDatasetVariablesLinks
-from .sendig_dataset_variables_ref import SendigDatasetVariablesRef
-from .sendig_datasets import SendigDatasets
-from .sendig_datasets_links import SendigDatasetsLinks
-from .sendig_datasets_ref import SendigDatasetsRef
-from .sendig_product import SendigProduct
-from .sendig_product_links import SendigProductLinks
-from .sendig_product_ref import SendigProductRef
-from .sendig_product_ref_element import SendigProductRefElement
-from .xml_about import XmlAbout
-from .xml_adam_datastructure import XmlAdamDatastructure
-from .xml_adam_datastructure_variables import XmlAdamDatastructureVariables
-from .xml_adam_datastructure_varsets import XmlAdamDatastructureVarsets
-from .xml_adam_product import XmlAdamProduct
-from .xml_adam_product_datastructures import XmlAdamProductDatastructures
-from .xml_adam_variable import XmlAdamVariable
-from .xml_adam_varset import XmlAdamVarset
-from .xml_cdash_class import XmlCdashClass
-from .xml_cdash_class_domains import XmlCdashClassDomains
-from .xml_cdash_class_field import XmlCdashClassField
-from .xml_cdash_domain import XmlCdashDomain
-from .xml_cdash_domain_field import XmlCdashDomainField
-from .xml_cdash_domain_fields import XmlCdashDomainFields
-from .xml_cdash_product import XmlCdashProduct
-from .xml_cdash_product_classes import XmlCdashProductClasses
-from .xml_cdash_product_domains import XmlCdashProductDomains
-from .xml_cdashig_class import XmlCdashigClass
-from .xml_cdashig_class_domains import XmlCdashigClassDomains
-from .xml_cdashig_class_scenarios import XmlCdashigClassScenarios
-from .xml_cdashig_domain import XmlCdashigDomain
-from .xml_cdashig_domain_field import XmlCdashigDomainField
-from .xml_cdashig_domain_fields import XmlCdashigDomainFields
-from .xml_cdashig_product import XmlCdashigProduct
-from .xml_cdashig_product_classes import XmlCdashigProductClasses
-from .xml_cdashig_product_domains import XmlCdashigProductDomains
-from .xml_cdashig_product_scenarios import XmlCdashigProductScenarios
-from .xml_cdashig_scenario import XmlCdashigScenario
-from .xml_cdashig_scenario_field import XmlCdashigScenarioField
-from .xml_cdashig_scenario_fields import XmlCdashigScenarioFields
-from .xml_ct_codelist import XmlCtCodelist
-from .xml_ct_codelist_terms import XmlCtCodelistTerms
-from .xml_ct_package import XmlCtPackage
-from .xml_ct_package_codelists import XmlCtPackageCodelists
-from .xml_ct_packages import XmlCtPackages
-from .xml_ct_term import XmlCtTerm
-from .xml_lastupdated import XmlLastupdated
-from .xml_productgroup_data_analysis import XmlProductgroupDataAnalysis
-from .xml_productgroup_data_collection import XmlProductgroupDataCollection
-from .xml_productgroup_data_tabulation import XmlProductgroupDataTabulation
-from .xml_productgroup_terminology import XmlProductgroupTerminology
-from .xml_products import XmlProducts
-from .xml_qrs_item import XmlQrsItem
-from .xml_qrs_items import XmlQrsItems
-from .xml_qrs_product import XmlQrsProduct
-from .xml_qrs_responsegroup import XmlQrsResponsegroup
-from .xml_qrs_responsegroups import XmlQrsResponsegroups
-from .xml_root_cdash_class_field import XmlRootCdashClassField
-from .xml_root_cdash_domain_field import XmlRootCdashDomainField
-from .xml_root_cdashig_domain_field import XmlRootCdashigDomainField
-from .xml_root_cdashig_scenario_field import XmlRootCdashigScenarioField
-from .xml_root_ct_codelist import XmlRootCtCodelist
-from .xml_root_ct_term import XmlRootCtTerm
-from .xml_root_sdtm_class_variable import XmlRootSdtmClassVariable
-from .xml_root_sdtm_dataset_variable import XmlRootSdtmDatasetVariable
-from .xml_root_sdtmig_dataset_variable import XmlRootSdtmigDatasetVariable
-from .xml_root_sendig_dataset_variable import XmlRootSendigDatasetVariable
-from .xml_sdtm_class import XmlSdtmClass
-from .xml_sdtm_class_datasets import XmlSdtmClassDatasets
-from .xml_sdtm_class_variable import XmlSdtmClassVariable
-from .xml_sdtm_class_variables import XmlSdtmClassVariables
-from .xml_sdtm_classes import XmlSdtmClasses
-from .xml_sdtm_dataset import XmlSdtmDataset
-from .xml_sdtm_dataset_variable import XmlSdtmDatasetVariable
-from .xml_sdtm_dataset_variables import XmlSdtmDatasetVariables
-from .xml_sdtm_datasets import XmlSdtmDatasets
-from .xml_sdtm_product import XmlSdtmProduct
-from .xml_sdtmig_class import XmlSdtmigClass
-from .xml_sdtmig_class_datasets import XmlSdtmigClassDatasets
-from .xml_sdtmig_classes import XmlSdtmigClasses
-from .xml_sdtmig_dataset import XmlSdtmigDataset
-from .xml_sdtmig_dataset_variable import XmlSdtmigDatasetVariable
-from .xml_sdtmig_dataset_variables import XmlSdtmigDatasetVariables
-from .xml_sdtmig_datasets import XmlSdtmigDatasets
-from .xml_sdtmig_product import XmlSdtmigProduct
-from .xml_sendig_class import XmlSendigClass
-from .xml_sendig_class_datasets import XmlSendigClassDatasets
-from .xml_sendig_classes import XmlSendigClasses
-from .xml_sendig_dataset import XmlSendigDataset
-from .xml_sendig_dataset_variable import XmlSendigDatasetVariable
-from .xml_sendig_dataset_variables import XmlSendigDatasetVariables
-from .xml_sendig_datasets import XmlSendigDatasets
-from .xml_sendig_product import XmlSendigProduct
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .about import About
+    from .about_links import AboutLinks
+    from .about_ref import AboutRef
+    from .adam_datastructure import AdamDatastructure
+    from .adam_datastructure_links import AdamDatastructureLinks
+    from .adam_datastructure_ref import AdamDatastructureRef
+    from .adam_datastructure_ref_element import AdamDatastructureRefElement
+    from .adam_datastructure_variables import AdamDatastructureVariables
+    from .adam_datastructure_variables_links import AdamDatastructureVariablesLinks
+    from .adam_datastructure_variables_ref import AdamDatastructureVariablesRef
+    from .adam_datastructure_varsets import AdamDatastructureVarsets
+    from .adam_datastructure_varsets_links import AdamDatastructureVarsetsLinks
+    from .adam_datastructure_varsets_ref import AdamDatastructureVarsetsRef
+    from .adam_product import AdamProduct
+    from .adam_product_datastructures import AdamProductDatastructures
+    from .adam_product_datastructures_links import AdamProductDatastructuresLinks
+    from .adam_product_datastructures_ref import AdamProductDatastructuresRef
+    from .adam_product_links import AdamProductLinks
+    from .adam_product_ref import AdamProductRef
+    from .adam_product_ref_element import AdamProductRefElement
+    from .adam_variable import AdamVariable
+    from .adam_variable_links import AdamVariableLinks
+    from .adam_variable_ref import AdamVariableRef
+    from .adam_variable_ref_element import AdamVariableRefElement
+    from .adam_varset import AdamVarset
+    from .adam_varset_links import AdamVarsetLinks
+    from .adam_varset_ref import AdamVarsetRef
+    from .adam_varset_ref_element import AdamVarsetRefElement
+    from .cdash_class import CdashClass
+    from .cdash_class_domains import CdashClassDomains
+    from .cdash_class_domains_links import CdashClassDomainsLinks
+    from .cdash_class_domains_ref import CdashClassDomainsRef
+    from .cdash_class_field import CdashClassField
+    from .cdash_class_field_links import CdashClassFieldLinks
+    from .cdash_class_field_ref import CdashClassFieldRef
+    from .cdash_class_field_ref_version import CdashClassFieldRefVersion
+    from .cdash_class_links import CdashClassLinks
+    from .cdash_class_ref import CdashClassRef
+    from .cdash_class_ref_element import CdashClassRefElement
+    from .cdash_domain import CdashDomain
+    from .cdash_domain_field import CdashDomainField
+    from .cdash_domain_field_links import CdashDomainFieldLinks
+    from .cdash_domain_field_ref import CdashDomainFieldRef
+    from .cdash_domain_field_ref_element import CdashDomainFieldRefElement
+    from .cdash_domain_field_ref_version import CdashDomainFieldRefVersion
+    from .cdash_domain_fields import CdashDomainFields
+    from .cdash_domain_fields_links import CdashDomainFieldsLinks
+    from .cdash_domain_fields_ref import CdashDomainFieldsRef
+    from .cdash_domain_links import CdashDomainLinks
+    from .cdash_domain_ref import CdashDomainRef
+    from .cdash_domain_ref_element import CdashDomainRefElement
+    from .cdash_product import CdashProduct
+    from .cdash_product_classes import CdashProductClasses
+    from .cdash_product_classes_links import CdashProductClassesLinks
+    from .cdash_product_classes_ref import CdashProductClassesRef
+    from .cdash_product_domains import CdashProductDomains
+    from .cdash_product_domains_links import CdashProductDomainsLinks
+    from .cdash_product_domains_ref import CdashProductDomainsRef
+    from .cdash_product_links import CdashProductLinks
+    from .cdash_product_ref import CdashProductRef
+    from .cdash_product_ref_element import CdashProductRefElement
+    from .cdashig_class import CdashigClass
+    from .cdashig_class_domains import CdashigClassDomains
+    from .cdashig_class_domains_links import CdashigClassDomainsLinks
+    from .cdashig_class_domains_ref import CdashigClassDomainsRef
+    from .cdashig_class_links import CdashigClassLinks
+    from .cdashig_class_ref import CdashigClassRef
+    from .cdashig_class_ref_element import CdashigClassRefElement
+    from .cdashig_class_ref_subclass import CdashigClassRefSubclass
+    from .cdashig_class_scenarios import CdashigClassScenarios
+    from .cdashig_class_scenarios_links import CdashigClassScenariosLinks
+    from .cdashig_class_scenarios_ref import CdashigClassScenariosRef
+    from .cdashig_domain import CdashigDomain
+    from .cdashig_domain_field import CdashigDomainField
+    from .cdashig_domain_field_links import CdashigDomainFieldLinks
+    from .cdashig_domain_field_ref import CdashigDomainFieldRef
+    from .cdashig_domain_field_ref_element import CdashigDomainFieldRefElement
+    from .cdashig_domain_field_ref_version import CdashigDomainFieldRefVersion
+    from .cdashig_domain_fields import CdashigDomainFields
+    from .cdashig_domain_fields_links import CdashigDomainFieldsLinks
+    from .cdashig_domain_fields_ref import CdashigDomainFieldsRef
+    from .cdashig_domain_links import CdashigDomainLinks
+    from .cdashig_domain_ref import CdashigDomainRef
+    from .cdashig_domain_ref_element import CdashigDomainRefElement
+    from .cdashig_product import CdashigProduct
+    from .cdashig_product_classes import CdashigProductClasses
+    from .cdashig_product_classes_links import CdashigProductClassesLinks
+    from .cdashig_product_classes_ref import CdashigProductClassesRef
+    from .cdashig_product_domains import CdashigProductDomains
+    from .cdashig_product_domains_links import CdashigProductDomainsLinks
+    from .cdashig_product_domains_ref import CdashigProductDomainsRef
+    from .cdashig_product_links import CdashigProductLinks
+    from .cdashig_product_ref import CdashigProductRef
+    from .cdashig_product_ref_element import CdashigProductRefElement
+    from .cdashig_product_scenarios import CdashigProductScenarios
+    from .cdashig_product_scenarios_links import CdashigProductScenariosLinks
+    from .cdashig_product_scenarios_ref import CdashigProductScenariosRef
+    from .cdashig_scenario import CdashigScenario
+    from .cdashig_scenario_field import CdashigScenarioField
+    from .cdashig_scenario_field_links import CdashigScenarioFieldLinks
+    from .cdashig_scenario_field_ref import CdashigScenarioFieldRef
+    from .cdashig_scenario_field_ref_element import CdashigScenarioFieldRefElement
+    from .cdashig_scenario_field_ref_version import CdashigScenarioFieldRefVersion
+    from .cdashig_scenario_fields import CdashigScenarioFields
+    from .cdashig_scenario_fields_links import CdashigScenarioFieldsLinks
+    from .cdashig_scenario_fields_ref import CdashigScenarioFieldsRef
+    from .cdashig_scenario_links import CdashigScenarioLinks
+    from .cdashig_scenario_ref import CdashigScenarioRef
+    from .cdashig_scenario_ref_element import CdashigScenarioRefElement
+    from .ct_codelist import CtCodelist
+    from .ct_codelist_links import CtCodelistLinks
+    from .ct_codelist_ref import CtCodelistRef
+    from .ct_codelist_ref_element import CtCodelistRefElement
+    from .ct_codelist_ref_version import CtCodelistRefVersion
+    from .ct_codelist_terms import CtCodelistTerms
+    from .ct_codelist_terms_links import CtCodelistTermsLinks
+    from .ct_codelist_terms_ref import CtCodelistTermsRef
+    from .ct_package import CtPackage
+    from .ct_package_codelists import CtPackageCodelists
+    from .ct_package_codelists_links import CtPackageCodelistsLinks
+    from .ct_package_codelists_ref import CtPackageCodelistsRef
+    from .ct_package_links import CtPackageLinks
+    from .ct_package_ref import CtPackageRef
+    from .ct_package_ref_element import CtPackageRefElement
+    from .ct_package_term import CtPackageTerm
+    from .ct_packages import CtPackages
+    from .ct_packages_links import CtPackagesLinks
+    from .ct_packages_ref import CtPackagesRef
+    from .ct_term import CtTerm
+    from .ct_term_links import CtTermLinks
+    from .ct_term_ref import CtTermRef
+    from .ct_term_ref_element import CtTermRefElement
+    from .ct_term_ref_version import CtTermRefVersion
+    from .default_error_response import DefaultErrorResponse
+    from .default_search_response import DefaultSearchResponse
+    from .default_search_response_hits_item import DefaultSearchResponseHitsItem
+    from .default_search_scopes import DefaultSearchScopes
+    from .export_adam_datastructures_row import ExportAdamDatastructuresRow
+    from .export_adam_datastructures_table import ExportAdamDatastructuresTable
+    from .export_adam_variables_row import ExportAdamVariablesRow
+    from .export_adam_variables_table import ExportAdamVariablesTable
+    from .export_adam_workbook import ExportAdamWorkbook
+    from .export_cdash_class_variables_row import ExportCdashClassVariablesRow
+    from .export_cdash_domain_variables_row import ExportCdashDomainVariablesRow
+    from .export_cdash_table import ExportCdashTable
+    from .export_cdashig_domain_variables_row import ExportCdashigDomainVariablesRow
+    from .export_cdashig_scenario_variables_row import ExportCdashigScenarioVariablesRow
+    from .export_cdashig_table import ExportCdashigTable
+    from .export_ct_codelist import ExportCtCodelist
+    from .export_ct_table import ExportCtTable
+    from .export_ct_term import ExportCtTerm
+    from .export_qrs_csv_items_row import ExportQrsCsvItemsRow
+    from .export_qrs_general import ExportQrsGeneral
+    from .export_qrs_items_table import ExportQrsItemsTable
+    from .export_qrs_responses import ExportQrsResponses
+    from .export_qrs_workbook import ExportQrsWorkbook
+    from .export_qrs_workbook_items_row import ExportQrsWorkbookItemsRow
+    from .export_sdtm_class_variables_row import ExportSdtmClassVariablesRow
+    from .export_sdtm_dataset_variables_row import ExportSdtmDatasetVariablesRow
+    from .export_sdtm_datasets_row import ExportSdtmDatasetsRow
+    from .export_sdtm_datasets_table import ExportSdtmDatasetsTable
+    from .export_sdtm_variables_table import ExportSdtmVariablesTable
+    from .export_sdtm_workbook import ExportSdtmWorkbook
+    from .export_sdtmig_datasets_row import ExportSdtmigDatasetsRow
+    from .export_sdtmig_datasets_table import ExportSdtmigDatasetsTable
+    from .export_sdtmig_variables_row import ExportSdtmigVariablesRow
+    from .export_sdtmig_variables_table import ExportSdtmigVariablesTable
+    from .export_sdtmig_workbook import ExportSdtmigWorkbook
+    from .export_sendig_datasets_row import ExportSendigDatasetsRow
+    from .export_sendig_datasets_table import ExportSendigDatasetsTable
+    from .export_sendig_variables_row import ExportSendigVariablesRow
+    from .export_sendig_variables_table import ExportSendigVariablesTable
+    from .export_sendig_workbook import ExportSendigWorkbook
+    from .get_mdr_search_scopes_response_200 import GetMdrSearchScopesResponse200
+    from .health import Health
+    from .lastupdated import Lastupdated
+    from .lastupdated_links import LastupdatedLinks
+    from .lastupdated_ref import LastupdatedRef
+    from .maintenance_body import MaintenanceBody
+    from .productgroup_data_analysis import ProductgroupDataAnalysis
+    from .productgroup_data_analysis_links import ProductgroupDataAnalysisLinks
+    from .productgroup_data_collection import ProductgroupDataCollection
+    from .productgroup_data_collection_links import ProductgroupDataCollectionLinks
+    from .productgroup_data_tabulation import ProductgroupDataTabulation
+    from .productgroup_data_tabulation_links import ProductgroupDataTabulationLinks
+    from .productgroup_qrs import ProductgroupQrs
+    from .productgroup_qrs_links import ProductgroupQrsLinks
+    from .productgroup_ref import ProductgroupRef
+    from .productgroup_terminology import ProductgroupTerminology
+    from .productgroup_terminology_links import ProductgroupTerminologyLinks
+    from .products import Products
+    from .products_links import ProductsLinks
+    from .products_ref import ProductsRef
+    from .qrs_item import QrsItem
+    from .qrs_item_links import QrsItemLinks
+    from .qrs_item_ref_element import QrsItemRefElement
+    from .qrs_items import QrsItems
+    from .qrs_items_links import QrsItemsLinks
+    from .qrs_items_ref import QrsItemsRef
+    from .qrs_product import QrsProduct
+    from .qrs_product_links import QrsProductLinks
+    from .qrs_product_ref import QrsProductRef
+    from .qrs_ref_element import QrsRefElement
+    from .qrs_response_links import QrsResponseLinks
+    from .qrs_responsegroup import QrsResponsegroup
+    from .qrs_responsegroup_links import QrsResponsegroupLinks
+    from .qrs_responsegroup_ref import QrsResponsegroupRef
+    from .qrs_responsegroup_ref_element import QrsResponsegroupRefElement
+    from .qrs_responsegroups import QrsResponsegroups
+    from .qrs_responsegroups_links import QrsResponsegroupsLinks
+    from .qrs_responsegroups_ref import QrsResponsegroupsRef
+    from .qrs_responses import QrsResponses
+    from .root_cdash_class_field import RootCdashClassField
+    from .root_cdash_class_field_links import RootCdashClassFieldLinks
+    from .root_cdash_class_field_ref import RootCdashClassFieldRef
+    from .root_cdash_domain_field import RootCdashDomainField
+    from .root_cdash_domain_field_links import RootCdashDomainFieldLinks
+    from .root_cdash_domain_field_ref import RootCdashDomainFieldRef
+    from .root_cdashig_domain_field import RootCdashigDomainField
+    from .root_cdashig_domain_field_links import RootCdashigDomainFieldLinks
+    from .root_cdashig_domain_field_ref import RootCdashigDomainFieldRef
+    from .root_cdashig_scenario_field import RootCdashigScenarioField
+    from .root_cdashig_scenario_field_links import RootCdashigScenarioFieldLinks
+    from .root_cdashig_scenario_field_ref import RootCdashigScenarioFieldRef
+    from .root_ct_codelist import RootCtCodelist
+    from .root_ct_codelist_links import RootCtCodelistLinks
+    from .root_ct_codelist_ref import RootCtCodelistRef
+    from .root_ct_codelist_ref_element import RootCtCodelistRefElement
+    from .root_ct_term import RootCtTerm
+    from .root_ct_term_links import RootCtTermLinks
+    from .root_ct_term_ref import RootCtTermRef
+    from .root_sdtm_class_variable import RootSdtmClassVariable
+    from .root_sdtm_class_variable_links import RootSdtmClassVariableLinks
+    from .root_sdtm_class_variable_ref import RootSdtmClassVariableRef
+    from .root_sdtm_dataset_variable import RootSdtmDatasetVariable
+    from .root_sdtm_dataset_variable_links import RootSdtmDatasetVariableLinks
+    from .root_sdtm_dataset_variable_ref import RootSdtmDatasetVariableRef
+    from .root_sdtmig_dataset_variable import RootSdtmigDatasetVariable
+    from .root_sdtmig_dataset_variable_links import RootSdtmigDatasetVariableLinks
+    from .root_sdtmig_dataset_variable_ref import RootSdtmigDatasetVariableRef
+    from .root_sendig_dataset_variable import RootSendigDatasetVariable
+    from .root_sendig_dataset_variable_links import RootSendigDatasetVariableLinks
+    from .root_sendig_dataset_variable_ref import RootSendigDatasetVariableRef
+    from .scope_values import ScopeValues
+    from .sdtm_class import SdtmClass
+    from .sdtm_class_datasets import SdtmClassDatasets
+    from .sdtm_class_datasets_links import SdtmClassDatasetsLinks
+    from .sdtm_class_datasets_ref import SdtmClassDatasetsRef
+    from .sdtm_class_links import SdtmClassLinks
+    from .sdtm_class_ref import SdtmClassRef
+    from .sdtm_class_ref_element import SdtmClassRefElement
+    from .sdtm_class_ref_subclass import SdtmClassRefSubclass
+    from .sdtm_class_variable import SdtmClassVariable
+    from .sdtm_class_variable_links import SdtmClassVariableLinks
+    from .sdtm_class_variable_ref import SdtmClassVariableRef
+    from .sdtm_class_variable_ref_element import SdtmClassVariableRefElement
+    from .sdtm_class_variable_ref_qualifies import SdtmClassVariableRefQualifies
+    from .sdtm_class_variable_ref_target import SdtmClassVariableRefTarget
+    from .sdtm_class_variable_ref_version import SdtmClassVariableRefVersion
+    from .sdtm_class_variables import SdtmClassVariables
+    from .sdtm_class_variables_links import SdtmClassVariablesLinks
+    from .sdtm_class_variables_ref import SdtmClassVariablesRef
+    from .sdtm_classes import SdtmClasses
+    from .sdtm_classes_links import SdtmClassesLinks
+    from .sdtm_classes_ref import SdtmClassesRef
+    from .sdtm_dataset import SdtmDataset
+    from .sdtm_dataset_links import SdtmDatasetLinks
+    from .sdtm_dataset_ref import SdtmDatasetRef
+    from .sdtm_dataset_ref_element import SdtmDatasetRefElement
+    from .sdtm_dataset_variable import SdtmDatasetVariable
+    from .sdtm_dataset_variable_links import SdtmDatasetVariableLinks
+    from .sdtm_dataset_variable_ref import SdtmDatasetVariableRef
+    from .sdtm_dataset_variable_ref_element import SdtmDatasetVariableRefElement
+    from .sdtm_dataset_variable_ref_target import SdtmDatasetVariableRefTarget
+    from .sdtm_dataset_variable_ref_version import SdtmDatasetVariableRefVersion
+    from .sdtm_dataset_variables import SdtmDatasetVariables
+    from .sdtm_dataset_variables_links import SdtmDatasetVariablesLinks
+    from .sdtm_dataset_variables_ref import SdtmDatasetVariablesRef
+    from .sdtm_datasets import SdtmDatasets
+    from .sdtm_datasets_links import SdtmDatasetsLinks
+    from .sdtm_datasets_ref import SdtmDatasetsRef
+    from .sdtm_product import SdtmProduct
+    from .sdtm_product_links import SdtmProductLinks
+    from .sdtm_product_ref import SdtmProductRef
+    from .sdtm_product_ref_element import SdtmProductRefElement
+    from .sdtmig_class import SdtmigClass
+    from .sdtmig_class_datasets import SdtmigClassDatasets
+    from .sdtmig_class_datasets_links import SdtmigClassDatasetsLinks
+    from .sdtmig_class_datasets_ref import SdtmigClassDatasetsRef
+    from .sdtmig_class_links import SdtmigClassLinks
+    from .sdtmig_class_ref import SdtmigClassRef
+    from .sdtmig_class_ref_element import SdtmigClassRefElement
+    from .sdtmig_class_ref_subclass import SdtmigClassRefSubclass
+    from .sdtmig_classes import SdtmigClasses
+    from .sdtmig_classes_links import SdtmigClassesLinks
+    from .sdtmig_classes_ref import SdtmigClassesRef
+    from .sdtmig_dataset import SdtmigDataset
+    from .sdtmig_dataset_links import SdtmigDatasetLinks
+    from .sdtmig_dataset_ref import SdtmigDatasetRef
+    from .sdtmig_dataset_ref_element import SdtmigDatasetRefElement
+    from .sdtmig_dataset_variable import SdtmigDatasetVariable
+    from .sdtmig_dataset_variable_links import SdtmigDatasetVariableLinks
+    from .sdtmig_dataset_variable_ref import SdtmigDatasetVariableRef
+    from .sdtmig_dataset_variable_ref_element import SdtmigDatasetVariableRefElement
+    from .sdtmig_dataset_variable_ref_target import SdtmigDatasetVariableRefTarget
+    from .sdtmig_dataset_variable_ref_version import SdtmigDatasetVariableRefVersion
+    from .sdtmig_dataset_variables import SdtmigDatasetVariables
+    from .sdtmig_dataset_variables_links import SdtmigDatasetVariablesLinks
+    from .sdtmig_dataset_variables_ref import SdtmigDatasetVariablesRef
+    from .sdtmig_datasets import SdtmigDatasets
+    from .sdtmig_datasets_links import SdtmigDatasetsLinks
+    from .sdtmig_datasets_ref import SdtmigDatasetsRef
+    from .sdtmig_product import SdtmigProduct
+    from .sdtmig_product_links import SdtmigProductLinks
+    from .sdtmig_product_ref import SdtmigProductRef
+    from .sdtmig_product_ref_element import SdtmigProductRefElement
+    from .sendig_class import SendigClass
+    from .sendig_class_datasets import SendigClassDatasets
+    from .sendig_class_datasets_links import SendigClassDatasetsLinks
+    from .sendig_class_datasets_ref import SendigClassDatasetsRef
+    from .sendig_class_links import SendigClassLinks
+    from .sendig_class_ref import SendigClassRef
+    from .sendig_class_ref_element import SendigClassRefElement
+    from .sendig_class_ref_subclass import SendigClassRefSubclass
+    from .sendig_classes import SendigClasses
+    from .sendig_classes_links import SendigClassesLinks
+    from .sendig_classes_ref import SendigClassesRef
+    from .sendig_dataset import SendigDataset
+    from .sendig_dataset_links import SendigDatasetLinks
+    from .sendig_dataset_ref import SendigDatasetRef
+    from .sendig_dataset_ref_element import SendigDatasetRefElement
+    from .sendig_dataset_variable import SendigDatasetVariable
+    from .sendig_dataset_variable_links import SendigDatasetVariableLinks
+    from .sendig_dataset_variable_ref import SendigDatasetVariableRef
+    from .sendig_dataset_variable_ref_element import SendigDatasetVariableRefElement
+    from .sendig_dataset_variable_ref_version import SendigDatasetVariableRefVersion
+    from .sendig_dataset_variables import SendigDatasetVariables
+    from .sendig_dataset_variables_links import SendigDatasetVariablesLinks
+    from .sendig_dataset_variables_ref import SendigDatasetVariablesRef
+    from .sendig_datasets import SendigDatasets
+    from .sendig_datasets_links import SendigDatasetsLinks
+    from .sendig_datasets_ref import SendigDatasetsRef
+    from .sendig_product import SendigProduct
+    from .sendig_product_links import SendigProductLinks
+    from .sendig_product_ref import SendigProductRef
+    from .sendig_product_ref_element import SendigProductRefElement
+    from .xml_about import XmlAbout
+    from .xml_adam_datastructure import XmlAdamDatastructure
+    from .xml_adam_datastructure_variables import XmlAdamDatastructureVariables
+    from .xml_adam_datastructure_varsets import XmlAdamDatastructureVarsets
+    from .xml_adam_product import XmlAdamProduct
+    from .xml_adam_product_datastructures import XmlAdamProductDatastructures
+    from .xml_adam_variable import XmlAdamVariable
+    from .xml_adam_varset import XmlAdamVarset
+    from .xml_cdash_class import XmlCdashClass
+    from .xml_cdash_class_domains import XmlCdashClassDomains
+    from .xml_cdash_class_field import XmlCdashClassField
+    from .xml_cdash_domain import XmlCdashDomain
+    from .xml_cdash_domain_field import XmlCdashDomainField
+    from .xml_cdash_domain_fields import XmlCdashDomainFields
+    from .xml_cdash_product import XmlCdashProduct
+    from .xml_cdash_product_classes import XmlCdashProductClasses
+    from .xml_cdash_product_domains import XmlCdashProductDomains
+    from .xml_cdashig_class import XmlCdashigClass
+    from .xml_cdashig_class_domains import XmlCdashigClassDomains
+    from .xml_cdashig_class_scenarios import XmlCdashigClassScenarios
+    from .xml_cdashig_domain import XmlCdashigDomain
+    from .xml_cdashig_domain_field import XmlCdashigDomainField
+    from .xml_cdashig_domain_fields import XmlCdashigDomainFields
+    from .xml_cdashig_product import XmlCdashigProduct
+    from .xml_cdashig_product_classes import XmlCdashigProductClasses
+    from .xml_cdashig_product_domains import XmlCdashigProductDomains
+    from .xml_cdashig_product_scenarios import XmlCdashigProductScenarios
+    from .xml_cdashig_scenario import XmlCdashigScenario
+    from .xml_cdashig_scenario_field import XmlCdashigScenarioField
+    from .xml_cdashig_scenario_fields import XmlCdashigScenarioFields
+    from .xml_ct_codelist import XmlCtCodelist
+    from .xml_ct_codelist_terms import XmlCtCodelistTerms
+    from .xml_ct_package import XmlCtPackage
+    from .xml_ct_package_codelists import XmlCtPackageCodelists
+    from .xml_ct_packages import XmlCtPackages
+    from .xml_ct_term import XmlCtTerm
+    from .xml_lastupdated import XmlLastupdated
+    from .xml_productgroup_data_analysis import XmlProductgroupDataAnalysis
+    from .xml_productgroup_data_collection import XmlProductgroupDataCollection
+    from .xml_productgroup_data_tabulation import XmlProductgroupDataTabulation
+    from .xml_productgroup_terminology import XmlProductgroupTerminology
+    from .xml_products import XmlProducts
+    from .xml_qrs_item import XmlQrsItem
+    from .xml_qrs_items import XmlQrsItems
+    from .xml_qrs_product import XmlQrsProduct
+    from .xml_qrs_responsegroup import XmlQrsResponsegroup
+    from .xml_qrs_responsegroups import XmlQrsResponsegroups
+    from .xml_root_cdash_class_field import XmlRootCdashClassField
+    from .xml_root_cdash_domain_field import XmlRootCdashDomainField
+    from .xml_root_cdashig_domain_field import XmlRootCdashigDomainField
+    from .xml_root_cdashig_scenario_field import XmlRootCdashigScenarioField
+    from .xml_root_ct_codelist import XmlRootCtCodelist
+    from .xml_root_ct_term import XmlRootCtTerm
+    from .xml_root_sdtm_class_variable import XmlRootSdtmClassVariable
+    from .xml_root_sdtm_dataset_variable import XmlRootSdtmDatasetVariable
+    from .xml_root_sdtmig_dataset_variable import XmlRootSdtmigDatasetVariable
+    from .xml_root_sendig_dataset_variable import XmlRootSendigDatasetVariable
+    from .xml_sdtm_class import XmlSdtmClass
+    from .xml_sdtm_class_datasets import XmlSdtmClassDatasets
+    from .xml_sdtm_class_variable import XmlSdtmClassVariable
+    from .xml_sdtm_class_variables import XmlSdtmClassVariables
+    from .xml_sdtm_classes import XmlSdtmClasses
+    from .xml_sdtm_dataset import XmlSdtmDataset
+    from .xml_sdtm_dataset_variable import XmlSdtmDatasetVariable
+    from .xml_sdtm_dataset_variables import XmlSdtmDatasetVariables
+    from .xml_sdtm_datasets import XmlSdtmDatasets
+    from .xml_sdtm_product import XmlSdtmProduct
+    from .xml_sdtmig_class import XmlSdtmigClass
+    from .xml_sdtmig_class_datasets import XmlSdtmigClassDatasets
+    from .xml_sdtmig_classes import XmlSdtmigClasses
+    from .xml_sdtmig_dataset import XmlSdtmigDataset
+    from .xml_sdtmig_dataset_variable import XmlSdtmigDatasetVariable
+    from .xml_sdtmig_dataset_variables import XmlSdtmigDatasetVariables
+    from .xml_sdtmig_datasets import XmlSdtmigDatasets
+    from .xml_sdtmig_product import XmlSdtmigProduct
+    from .xml_sendig_class import XmlSendigClass
+    from .xml_sendig_class_datasets import XmlSendigClassDatasets
+    from .xml_sendig_classes import XmlSendigClasses
+    from .xml_sendig_dataset import XmlSendigDataset
+    from .xml_sendig_dataset_variable import XmlSendigDatasetVariable
+    from .xml_sendig_dataset_variables import XmlSendigDatasetVariables
+    from .xml_sendig_datasets import XmlSendigDatasets
+    from .xml_sendig_product import XmlSendigProduct
+
+_LAZY = {
+    "About": ".about",
+    "AboutLinks": ".about_links",
+    "AboutRef": ".about_ref",
+    "AdamDatastructure": ".adam_datastructure",
+    "AdamDatastructureLinks": ".adam_datastructure_links",
+    "AdamDatastructureRef": ".adam_datastructure_ref",
+    "AdamDatastructureRefElement": ".adam_datastructure_ref_element",
+    "AdamDatastructureVariables": ".adam_datastructure_variables",
+    "AdamDatastructureVariablesLinks": ".adam_datastructure_variables_links",
+    "AdamDatastructureVariablesRef": ".adam_datastructure_variables_ref",
+    "AdamDatastructureVarsets": ".adam_datastructure_varsets",
+    "AdamDatastructureVarsetsLinks": ".adam_datastructure_varsets_links",
+    "AdamDatastructureVarsetsRef": ".adam_datastructure_varsets_ref",
+    "AdamProduct": ".adam_product",
+    "AdamProductDatastructures": ".adam_product_datastructures",
+    "AdamProductDatastructuresLinks": ".adam_product_datastructures_links",
+    "AdamProductDatastructuresRef": ".adam_product_datastructures_ref",
+    "AdamProductLinks": ".adam_product_links",
+    "AdamProductRef": ".adam_product_ref",
+    "AdamProductRefElement": ".adam_product_ref_element",
+    "AdamVariable": ".adam_variable",
+    "AdamVariableLinks": ".adam_variable_links",
+    "AdamVariableRef": ".adam_variable_ref",
+    "AdamVariableRefElement": ".adam_variable_ref_element",
+    "AdamVarset": ".adam_varset",
+    "AdamVarsetLinks": ".adam_varset_links",
+    "AdamVarsetRef": ".adam_varset_ref",
+    "AdamVarsetRefElement": ".adam_varset_ref_element",
+    "CdashClass": ".cdash_class",
+    "CdashClassDomains": ".cdash_class_domains",
+    "CdashClassDomainsLinks": ".cdash_class_domains_links",
+    "CdashClassDomainsRef": ".cdash_class_domains_ref",
+    "CdashClassField": ".cdash_class_field",
+    "CdashClassFieldLinks": ".cdash_class_field_links",
+    "CdashClassFieldRef": ".cdash_class_field_ref",
+    "CdashClassFieldRefVersion": ".cdash_class_field_ref_version",
+    "CdashClassLinks": ".cdash_class_links",
+    "CdashClassRef": ".cdash_class_ref",
+    "CdashClassRefElement": ".cdash_class_ref_element",
+    "CdashDomain": ".cdash_domain",
+    "CdashDomainField": ".cdash_domain_field",
+    "CdashDomainFieldLinks": ".cdash_domain_field_links",
+    "CdashDomainFieldRef": ".cdash_domain_field_ref",
+    "CdashDomainFieldRefElement": ".cdash_domain_field_ref_element",
+    "CdashDomainFieldRefVersion": ".cdash_domain_field_ref_version",
+    "CdashDomainFields": ".cdash_domain_fields",
+    "CdashDomainFieldsLinks": ".cdash_domain_fields_links",
+    "CdashDomainFieldsRef": ".cdash_domain_fields_ref",
+    "CdashDomainLinks": ".cdash_domain_links",
+    "CdashDomainRef": ".cdash_domain_ref",
+    "CdashDomainRefElement": ".cdash_domain_ref_element",
+    "CdashProduct": ".cdash_product",
+    "CdashProductClasses": ".cdash_product_classes",
+    "CdashProductClassesLinks": ".cdash_product_classes_links",
+    "CdashProductClassesRef": ".cdash_product_classes_ref",
+    "CdashProductDomains": ".cdash_product_domains",
+    "CdashProductDomainsLinks": ".cdash_product_domains_links",
+    "CdashProductDomainsRef": ".cdash_product_domains_ref",
+    "CdashProductLinks": ".cdash_product_links",
+    "CdashProductRef": ".cdash_product_ref",
+    "CdashProductRefElement": ".cdash_product_ref_element",
+    "CdashigClass": ".cdashig_class",
+    "CdashigClassDomains": ".cdashig_class_domains",
+    "CdashigClassDomainsLinks": ".cdashig_class_domains_links",
+    "CdashigClassDomainsRef": ".cdashig_class_domains_ref",
+    "CdashigClassLinks": ".cdashig_class_links",
+    "CdashigClassRef": ".cdashig_class_ref",
+    "CdashigClassRefElement": ".cdashig_class_ref_element",
+    "CdashigClassRefSubclass": ".cdashig_class_ref_subclass",
+    "CdashigClassScenarios": ".cdashig_class_scenarios",
+    "CdashigClassScenariosLinks": ".cdashig_class_scenarios_links",
+    "CdashigClassScenariosRef": ".cdashig_class_scenarios_ref",
+    "CdashigDomain": ".cdashig_domain",
+    "CdashigDomainField": ".cdashig_domain_field",
+    "CdashigDomainFieldLinks": ".cdashig_domain_field_links",
+    "CdashigDomainFieldRef": ".cdashig_domain_field_ref",
+    "CdashigDomainFieldRefElement": ".cdashig_domain_field_ref_element",
+    "CdashigDomainFieldRefVersion": ".cdashig_domain_field_ref_version",
+    "CdashigDomainFields": ".cdashig_domain_fields",
+    "CdashigDomainFieldsLinks": ".cdashig_domain_fields_links",
+    "CdashigDomainFieldsRef": ".cdashig_domain_fields_ref",
+    "CdashigDomainLinks": ".cdashig_domain_links",
+    "CdashigDomainRef": ".cdashig_domain_ref",
+    "CdashigDomainRefElement": ".cdashig_domain_ref_element",
+    "CdashigProduct": ".cdashig_product",
+    "CdashigProductClasses": ".cdashig_product_classes",
+    "CdashigProductClassesLinks": ".cdashig_product_classes_links",
+    "CdashigProductClassesRef": ".cdashig_product_classes_ref",
+    "CdashigProductDomains": ".cdashig_product_domains",
+    "CdashigProductDomainsLinks": ".cdashig_product_domains_links",
+    "CdashigProductDomainsRef": ".cdashig_product_domains_ref",
+    "CdashigProductLinks": ".cdashig_product_links",
+    "CdashigProductRef": ".cdashig_product_ref",
+    "CdashigProductRefElement": ".cdashig_product_ref_element",
+    "CdashigProductScenarios": ".cdashig_product_scenarios",
+    "CdashigProductScenariosLinks": ".cdashig_product_scenarios_links",
+    "CdashigProductScenariosRef": ".cdashig_product_scenarios_ref",
+    "CdashigScenario": ".cdashig_scenario",
+    "CdashigScenarioField": ".cdashig_scenario_field",
+    "CdashigScenarioFieldLinks": ".cdashig_scenario_field_links",
+    "CdashigScenarioFieldRef": ".cdashig_scenario_field_ref",
+    "CdashigScenarioFieldRefElement": ".cdashig_scenario_field_ref_element",
+    "CdashigScenarioFieldRefVersion": ".cdashig_scenario_field_ref_version",
+    "CdashigScenarioFields": ".cdashig_scenario_fields",
+    "CdashigScenarioFieldsLinks": ".cdashig_scenario_fields_links",
+    "CdashigScenarioFieldsRef": ".cdashig_scenario_fields_ref",
+    "CdashigScenarioLinks": ".cdashig_scenario_links",
+    "CdashigScenarioRef": ".cdashig_scenario_ref",
+    "CdashigScenarioRefElement": ".cdashig_scenario_ref_element",
+    "CtCodelist": ".ct_codelist",
+    "CtCodelistLinks": ".ct_codelist_links",
+    "CtCodelistRef": ".ct_codelist_ref",
+    "CtCodelistRefElement": ".ct_codelist_ref_element",
+    "CtCodelistRefVersion": ".ct_codelist_ref_version",
+    "CtCodelistTerms": ".ct_codelist_terms",
+    "CtCodelistTermsLinks": ".ct_codelist_terms_links",
+    "CtCodelistTermsRef": ".ct_codelist_terms_ref",
+    "CtPackage": ".ct_package",
+    "CtPackageCodelists": ".ct_package_codelists",
+    "CtPackageCodelistsLinks": ".ct_package_codelists_links",
+    "CtPackageCodelistsRef": ".ct_package_codelists_ref",
+    "CtPackageLinks": ".ct_package_links",
+    "CtPackageRef": ".ct_package_ref",
+    "CtPackageRefElement": ".ct_package_ref_element",
+    "CtPackageTerm": ".ct_package_term",
+    "CtPackages": ".ct_packages",
+    "CtPackagesLinks": ".ct_packages_links",
+    "CtPackagesRef": ".ct_packages_ref",
+    "CtTerm": ".ct_term",
+    "CtTermLinks": ".ct_term_links",
+    "CtTermRef": ".ct_term_ref",
+    "CtTermRefElement": ".ct_term_ref_element",
+    "CtTermRefVersion": ".ct_term_ref_version",
+    "DefaultErrorResponse": ".default_error_response",
+    "DefaultSearchResponse": ".default_search_response",
+    "DefaultSearchResponseHitsItem": ".default_search_response_hits_item",
+    "DefaultSearchScopes": ".default_search_scopes",
+    "ExportAdamDatastructuresRow": ".export_adam_datastructures_row",
+    "ExportAdamDatastructuresTable": ".export_adam_datastructures_table",
+    "ExportAdamVariablesRow": ".export_adam_variables_row",
+    "ExportAdamVariablesTable": ".export_adam_variables_table",
+    "ExportAdamWorkbook": ".export_adam_workbook",
+    "ExportCdashClassVariablesRow": ".export_cdash_class_variables_row",
+    "ExportCdashDomainVariablesRow": ".export_cdash_domain_variables_row",
+    "ExportCdashTable": ".export_cdash_table",
+    "ExportCdashigDomainVariablesRow": ".export_cdashig_domain_variables_row",
+    "ExportCdashigScenarioVariablesRow": ".export_cdashig_scenario_variables_row",
+    "ExportCdashigTable": ".export_cdashig_table",
+    "ExportCtCodelist": ".export_ct_codelist",
+    "ExportCtTable": ".export_ct_table",
+    "ExportCtTerm": ".export_ct_term",
+    "ExportQrsCsvItemsRow": ".export_qrs_csv_items_row",
+    "ExportQrsGeneral": ".export_qrs_general",
+    "ExportQrsItemsTable": ".export_qrs_items_table",
+    "ExportQrsResponses": ".export_qrs_responses",
+    "ExportQrsWorkbook": ".export_qrs_workbook",
+    "ExportQrsWorkbookItemsRow": ".export_qrs_workbook_items_row",
+    "ExportSdtmClassVariablesRow": ".export_sdtm_class_variables_row",
+    "ExportSdtmDatasetVariablesRow": ".export_sdtm_dataset_variables_row",
+    "ExportSdtmDatasetsRow": ".export_sdtm_datasets_row",
+    "ExportSdtmDatasetsTable": ".export_sdtm_datasets_table",
+    "ExportSdtmVariablesTable": ".export_sdtm_variables_table",
+    "ExportSdtmWorkbook": ".export_sdtm_workbook",
+    "ExportSdtmigDatasetsRow": ".export_sdtmig_datasets_row",
+    "ExportSdtmigDatasetsTable": ".export_sdtmig_datasets_table",
+    "ExportSdtmigVariablesRow": ".export_sdtmig_variables_row",
+    "ExportSdtmigVariablesTable": ".export_sdtmig_variables_table",
+    "ExportSdtmigWorkbook": ".export_sdtmig_workbook",
+    "ExportSendigDatasetsRow": ".export_sendig_datasets_row",
+    "ExportSendigDatasetsTable": ".export_sendig_datasets_table",
+    "ExportSendigVariablesRow": ".export_sendig_variables_row",
+    "ExportSendigVariablesTable": ".export_sendig_variables_table",
+    "ExportSendigWorkbook": ".export_sendig_workbook",
+    "GetMdrSearchScopesResponse200": ".get_mdr_search_scopes_response_200",
+    "Health": ".health",
+    "Lastupdated": ".lastupdated",
+    "LastupdatedLinks": ".lastupdated_links",
+    "LastupdatedRef": ".lastupdated_ref",
+    "MaintenanceBody": ".maintenance_body",
+    "ProductgroupDataAnalysis": ".productgroup_data_analysis",
+    "ProductgroupDataAnalysisLinks": ".productgroup_data_analysis_links",
+    "ProductgroupDataCollection": ".productgroup_data_collection",
+    "ProductgroupDataCollectionLinks": ".productgroup_data_collection_links",
+    "ProductgroupDataTabulation": ".productgroup_data_tabulation",
+    "ProductgroupDataTabulationLinks": ".productgroup_data_tabulation_links",
+    "ProductgroupQrs": ".productgroup_qrs",
+    "ProductgroupQrsLinks": ".productgroup_qrs_links",
+    "ProductgroupRef": ".productgroup_ref",
+    "ProductgroupTerminology": ".productgroup_terminology",
+    "ProductgroupTerminologyLinks": ".productgroup_terminology_links",
+    "Products": ".products",
+    "ProductsLinks": ".products_links",
+    "ProductsRef": ".products_ref",
+    "QrsItem": ".qrs_item",
+    "QrsItemLinks": ".qrs_item_links",
+    "QrsItemRefElement": ".qrs_item_ref_element",
+    "QrsItems": ".qrs_items",
+    "QrsItemsLinks": ".qrs_items_links",
+    "QrsItemsRef": ".qrs_items_ref",
+    "QrsProduct": ".qrs_product",
+    "QrsProductLinks": ".qrs_product_links",
+    "QrsProductRef": ".qrs_product_ref",
+    "QrsRefElement": ".qrs_ref_element",
+    "QrsResponseLinks": ".qrs_response_links",
+    "QrsResponsegroup": ".qrs_responsegroup",
+    "QrsResponsegroupLinks": ".qrs_responsegroup_links",
+    "QrsResponsegroupRef": ".qrs_responsegroup_ref",
+    "QrsResponsegroupRefElement": ".qrs_responsegroup_ref_element",
+    "QrsResponsegroups": ".qrs_responsegroups",
+    "QrsResponsegroupsLinks": ".qrs_responsegroups_links",
+    "QrsResponsegroupsRef": ".qrs_responsegroups_ref",
+    "QrsResponses": ".qrs_responses",
+    "RootCdashClassField": ".root_cdash_class_field",
+    "RootCdashClassFieldLinks": ".root_cdash_class_field_links",
+    "RootCdashClassFieldRef": ".root_cdash_class_field_ref",
+    "RootCdashDomainField": ".root_cdash_domain_field",
+    "RootCdashDomainFieldLinks": ".root_cdash_domain_field_links",
+    "RootCdashDomainFieldRef": ".root_cdash_domain_field_ref",
+    "RootCdashigDomainField": ".root_cdashig_domain_field",
+    "RootCdashigDomainFieldLinks": ".root_cdashig_domain_field_links",
+    "RootCdashigDomainFieldRef": ".root_cdashig_domain_field_ref",
+    "RootCdashigScenarioField": ".root_cdashig_scenario_field",
+    "RootCdashigScenarioFieldLinks": ".root_cdashig_scenario_field_links",
+    "RootCdashigScenarioFieldRef": ".root_cdashig_scenario_field_ref",
+    "RootCtCodelist": ".root_ct_codelist",
+    "RootCtCodelistLinks": ".root_ct_codelist_links",
+    "RootCtCodelistRef": ".root_ct_codelist_ref",
+    "RootCtCodelistRefElement": ".root_ct_codelist_ref_element",
+    "RootCtTerm": ".root_ct_term",
+    "RootCtTermLinks": ".root_ct_term_links",
+    "RootCtTermRef": ".root_ct_term_ref",
+    "RootSdtmClassVariable": ".root_sdtm_class_variable",
+    "RootSdtmClassVariableLinks": ".root_sdtm_class_variable_links",
+    "RootSdtmClassVariableRef": ".root_sdtm_class_variable_ref",
+    "RootSdtmDatasetVariable": ".root_sdtm_dataset_variable",
+    "RootSdtmDatasetVariableLinks": ".root_sdtm_dataset_variable_links",
+    "RootSdtmDatasetVariableRef": ".root_sdtm_dataset_variable_ref",
+    "RootSdtmigDatasetVariable": ".root_sdtmig_dataset_variable",
+    "RootSdtmigDatasetVariableLinks": ".root_sdtmig_dataset_variable_links",
+    "RootSdtmigDatasetVariableRef": ".root_sdtmig_dataset_variable_ref",
+    "RootSendigDatasetVariable": ".root_sendig_dataset_variable",
+    "RootSendigDatasetVariableLinks": ".root_sendig_dataset_variable_links",
+    "RootSendigDatasetVariableRef": ".root_sendig_dataset_variable_ref",
+    "ScopeValues": ".scope_values",
+    "SdtmClass": ".sdtm_class",
+    "SdtmClassDatasets": ".sdtm_class_datasets",
+    "SdtmClassDatasetsLinks": ".sdtm_class_datasets_links",
+    "SdtmClassDatasetsRef": ".sdtm_class_datasets_ref",
+    "SdtmClassLinks": ".sdtm_class_links",
+    "SdtmClassRef": ".sdtm_class_ref",
+    "SdtmClassRefElement": ".sdtm_class_ref_element",
+    "SdtmClassRefSubclass": ".sdtm_class_ref_subclass",
+    "SdtmClassVariable": ".sdtm_class_variable",
+    "SdtmClassVariableLinks": ".sdtm_class_variable_links",
+    "SdtmClassVariableRef": ".sdtm_class_variable_ref",
+    "SdtmClassVariableRefElement": ".sdtm_class_variable_ref_element",
+    "SdtmClassVariableRefQualifies": ".sdtm_class_variable_ref_qualifies",
+    "SdtmClassVariableRefTarget": ".sdtm_class_variable_ref_target",
+    "SdtmClassVariableRefVersion": ".sdtm_class_variable_ref_version",
+    "SdtmClassVariables": ".sdtm_class_variables",
+    "SdtmClassVariablesLinks": ".sdtm_class_variables_links",
+    "SdtmClassVariablesRef": ".sdtm_class_variables_ref",
+    "SdtmClasses": ".sdtm_classes",
+    "SdtmClassesLinks": ".sdtm_classes_links",
+    "SdtmClassesRef": ".sdtm_classes_ref",
+    "SdtmDataset": ".sdtm_dataset",
+    "SdtmDatasetLinks": ".sdtm_dataset_links",
+    "SdtmDatasetRef": ".sdtm_dataset_ref",
+    "SdtmDatasetRefElement": ".sdtm_dataset_ref_element",
+    "SdtmDatasetVariable": ".sdtm_dataset_variable",
+    "SdtmDatasetVariableLinks": ".sdtm_dataset_variable_links",
+    "SdtmDatasetVariableRef": ".sdtm_dataset_variable_ref",
+    "SdtmDatasetVariableRefElement": ".sdtm_dataset_variable_ref_element",
+    "SdtmDatasetVariableRefTarget": ".sdtm_dataset_variable_ref_target",
+    "SdtmDatasetVariableRefVersion": ".sdtm_dataset_variable_ref_version",
+    "SdtmDatasetVariables": ".sdtm_dataset_variables",
+    "SdtmDatasetVariablesLinks": ".sdtm_dataset_variables_links",
+    "SdtmDatasetVariablesRef": ".sdtm_dataset_variables_ref",
+    "SdtmDatasets": ".sdtm_datasets",
+    "SdtmDatasetsLinks": ".sdtm_datasets_links",
+    "SdtmDatasetsRef": ".sdtm_datasets_ref",
+    "SdtmProduct": ".sdtm_product",
+    "SdtmProductLinks": ".sdtm_product_links",
+    "SdtmProductRef": ".sdtm_product_ref",
+    "SdtmProductRefElement": ".sdtm_product_ref_element",
+    "SdtmigClass": ".sdtmig_class",
+    "SdtmigClassDatasets": ".sdtmig_class_datasets",
+    "SdtmigClassDatasetsLinks": ".sdtmig_class_datasets_links",
+    "SdtmigClassDatasetsRef": ".sdtmig_class_datasets_ref",
+    "SdtmigClassLinks": ".sdtmig_class_links",
+    "SdtmigClassRef": ".sdtmig_class_ref",
+    "SdtmigClassRefElement": ".sdtmig_class_ref_element",
+    "SdtmigClassRefSubclass": ".sdtmig_class_ref_subclass",
+    "SdtmigClasses": ".sdtmig_classes",
+    "SdtmigClassesLinks": ".sdtmig_classes_links",
+    "SdtmigClassesRef": ".sdtmig_classes_ref",
+    "SdtmigDataset": ".sdtmig_dataset",
+    "SdtmigDatasetLinks": ".sdtmig_dataset_links",
+    "SdtmigDatasetRef": ".sdtmig_dataset_ref",
+    "SdtmigDatasetRefElement": ".sdtmig_dataset_ref_element",
+    "SdtmigDatasetVariable": ".sdtmig_dataset_variable",
+    "SdtmigDatasetVariableLinks": ".sdtmig_dataset_variable_links",
+    "SdtmigDatasetVariableRef": ".sdtmig_dataset_variable_ref",
+    "SdtmigDatasetVariableRefElement": ".sdtmig_dataset_variable_ref_element",
+    "SdtmigDatasetVariableRefTarget": ".sdtmig_dataset_variable_ref_target",
+    "SdtmigDatasetVariableRefVersion": ".sdtmig_dataset_variable_ref_version",
+    "SdtmigDatasetVariables": ".sdtmig_dataset_variables",
+    "SdtmigDatasetVariablesLinks": ".sdtmig_dataset_variables_links",
+    "SdtmigDatasetVariablesRef": ".sdtmig_dataset_variables_ref",
+    "SdtmigDatasets": ".sdtmig_datasets",
+    "SdtmigDatasetsLinks": ".sdtmig_datasets_links",
+    "SdtmigDatasetsRef": ".sdtmig_datasets_ref",
+    "SdtmigProduct": ".sdtmig_product",
+    "SdtmigProductLinks": ".sdtmig_product_links",
+    "SdtmigProductRef": ".sdtmig_product_ref",
+    "SdtmigProductRefElement": ".sdtmig_product_ref_element",
+    "SendigClass": ".sendig_class",
+    "SendigClassDatasets": ".sendig_class_datasets",
+    "SendigClassDatasetsLinks": ".sendig_class_datasets_links",
+    "SendigClassDatasetsRef": ".sendig_class_datasets_ref",
+    "SendigClassLinks": ".sendig_class_links",
+    "SendigClassRef": ".sendig_class_ref",
+    "SendigClassRefElement": ".sendig_class_ref_element",
+    "SendigClassRefSubclass": ".sendig_class_ref_subclass",
+    "SendigClasses": ".sendig_classes",
+    "SendigClassesLinks": ".sendig_classes_links",
+    "SendigClassesRef": ".sendig_classes_ref",
+    "SendigDataset": ".sendig_dataset",
+    "SendigDatasetLinks": ".sendig_dataset_links",
+    "SendigDatasetRef": ".sendig_dataset_ref",
+    "SendigDatasetRefElement": ".sendig_dataset_ref_element",
+    "SendigDatasetVariable": ".sendig_dataset_variable",
+    "SendigDatasetVariableLinks": ".sendig_dataset_variable_links",
+    "SendigDatasetVariableRef": ".sendig_dataset_variable_ref",
+    "SendigDatasetVariableRefElement": ".sendig_dataset_variable_ref_element",
+    "SendigDatasetVariableRefVersion": ".sendig_dataset_variable_ref_version",
+    "SendigDatasetVariables": ".sendig_dataset_variables",
+    "SendigDatasetVariablesLinks": ".sendig_dataset_variables_links",
+    "SendigDatasetVariablesRef": ".sendig_dataset_variables_ref",
+    "SendigDatasets": ".sendig_datasets",
+    "SendigDatasetsLinks": ".sendig_datasets_links",
+    "SendigDatasetsRef": ".sendig_datasets_ref",
+    "SendigProduct": ".sendig_product",
+    "SendigProductLinks": ".sendig_product_links",
+    "SendigProductRef": ".sendig_product_ref",
+    "SendigProductRefElement": ".sendig_product_ref_element",
+    "XmlAbout": ".xml_about",
+    "XmlAdamDatastructure": ".xml_adam_datastructure",
+    "XmlAdamDatastructureVariables": ".xml_adam_datastructure_variables",
+    "XmlAdamDatastructureVarsets": ".xml_adam_datastructure_varsets",
+    "XmlAdamProduct": ".xml_adam_product",
+    "XmlAdamProductDatastructures": ".xml_adam_product_datastructures",
+    "XmlAdamVariable": ".xml_adam_variable",
+    "XmlAdamVarset": ".xml_adam_varset",
+    "XmlCdashClass": ".xml_cdash_class",
+    "XmlCdashClassDomains": ".xml_cdash_class_domains",
+    "XmlCdashClassField": ".xml_cdash_class_field",
+    "XmlCdashDomain": ".xml_cdash_domain",
+    "XmlCdashDomainField": ".xml_cdash_domain_field",
+    "XmlCdashDomainFields": ".xml_cdash_domain_fields",
+    "XmlCdashProduct": ".xml_cdash_product",
+    "XmlCdashProductClasses": ".xml_cdash_product_classes",
+    "XmlCdashProductDomains": ".xml_cdash_product_domains",
+    "XmlCdashigClass": ".xml_cdashig_class",
+    "XmlCdashigClassDomains": ".xml_cdashig_class_domains",
+    "XmlCdashigClassScenarios": ".xml_cdashig_class_scenarios",
+    "XmlCdashigDomain": ".xml_cdashig_domain",
+    "XmlCdashigDomainField": ".xml_cdashig_domain_field",
+    "XmlCdashigDomainFields": ".xml_cdashig_domain_fields",
+    "XmlCdashigProduct": ".xml_cdashig_product",
+    "XmlCdashigProductClasses": ".xml_cdashig_product_classes",
+    "XmlCdashigProductDomains": ".xml_cdashig_product_domains",
+    "XmlCdashigProductScenarios": ".xml_cdashig_product_scenarios",
+    "XmlCdashigScenario": ".xml_cdashig_scenario",
+    "XmlCdashigScenarioField": ".xml_cdashig_scenario_field",
+    "XmlCdashigScenarioFields": ".xml_cdashig_scenario_fields",
+    "XmlCtCodelist": ".xml_ct_codelist",
+    "XmlCtCodelistTerms": ".xml_ct_codelist_terms",
+    "XmlCtPackage": ".xml_ct_package",
+    "XmlCtPackageCodelists": ".xml_ct_package_codelists",
+    "XmlCtPackages": ".xml_ct_packages",
+    "XmlCtTerm": ".xml_ct_term",
+    "XmlLastupdated": ".xml_lastupdated",
+    "XmlProductgroupDataAnalysis": ".xml_productgroup_data_analysis",
+    "XmlProductgroupDataCollection": ".xml_productgroup_data_collection",
+    "XmlProductgroupDataTabulation": ".xml_productgroup_data_tabulation",
+    "XmlProductgroupTerminology": ".xml_productgroup_terminology",
+    "XmlProducts": ".xml_products",
+    "XmlQrsItem": ".xml_qrs_item",
+    "XmlQrsItems": ".xml_qrs_items",
+    "XmlQrsProduct": ".xml_qrs_product",
+    "XmlQrsResponsegroup": ".xml_qrs_responsegroup",
+    "XmlQrsResponsegroups": ".xml_qrs_responsegroups",
+    "XmlRootCdashClassField": ".xml_root_cdash_class_field",
+    "XmlRootCdashDomainField": ".xml_root_cdash_domain_field",
+    "XmlRootCdashigDomainField": ".xml_root_cdashig_domain_field",
+    "XmlRootCdashigScenarioField": ".xml_root_cdashig_scenario_field",
+    "XmlRootCtCodelist": ".xml_root_ct_codelist",
+    "XmlRootCtTerm": ".xml_root_ct_term",
+    "XmlRootSdtmClassVariable": ".xml_root_sdtm_class_variable",
+    "XmlRootSdtmDatasetVariable": ".xml_root_sdtm_dataset_variable",
+    "XmlRootSdtmigDatasetVariable": ".xml_root_sdtmig_dataset_variable",
+    "XmlRootSendigDatasetVariable": ".xml_root_sendig_dataset_variable",
+    "XmlSdtmClass": ".xml_sdtm_class",
+    "XmlSdtmClassDatasets": ".xml_sdtm_class_datasets",
+    "XmlSdtmClassVariable": ".xml_sdtm_class_variable",
+    "XmlSdtmClassVariables": ".xml_sdtm_class_variables",
+    "XmlSdtmClasses": ".xml_sdtm_classes",
+    "XmlSdtmDataset": ".xml_sdtm_dataset",
+    "XmlSdtmDatasetVariable": ".xml_sdtm_dataset_variable",
+    "XmlSdtmDatasetVariables": ".xml_sdtm_dataset_variables",
+    "XmlSdtmDatasets": ".xml_sdtm_datasets",
+    "XmlSdtmProduct": ".xml_sdtm_product",
+    "XmlSdtmigClass": ".xml_sdtmig_class",
+    "XmlSdtmigClassDatasets": ".xml_sdtmig_class_datasets",
+    "XmlSdtmigClasses": ".xml_sdtmig_classes",
+    "XmlSdtmigDataset": ".xml_sdtmig_dataset",
+    "XmlSdtmigDatasetVariable": ".xml_sdtmig_dataset_variable",
+    "XmlSdtmigDatasetVariables": ".xml_sdtmig_dataset_variables",
+    "XmlSdtmigDatasets": ".xml_sdtmig_datasets",
+    "XmlSdtmigProduct": ".xml_sdtmig_product",
+    "XmlSendigClass": ".xml_sendig_class",
+    "XmlSendigClassDatasets": ".xml_sendig_class_datasets",
+    "XmlSendigClasses": ".xml_sendig_classes",
+    "XmlSendigDataset": ".xml_sendig_dataset",
+    "XmlSendigDatasetVariable": ".xml_sendig_dataset_variable",
+    "XmlSendigDatasetVariables": ".xml_sendig_dataset_variables",
+    "XmlSendigDatasets": ".xml_sendig_datasets",
+    "XmlSendigProduct": ".xml_sendig_product",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = import_module(module, __name__)
+    if module != f".{name}":
+        value = getattr(value, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
+
 
 __all__ = (
     "About",
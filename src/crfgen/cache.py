@@ -0,0 +1,300 @@
+"""
+On-disk HTTP response cache for the CDISC Library client.
+
+The cache plugs into :class:`cdisc_library_client.AuthenticatedClient` as an
+httpx transport wrapper::
+
+    cache = ResponseCache(".cache/library")
+    transport = CacheTransport(httpx.HTTPTransport(retries=5), cache)
+    client = AuthenticatedClient(..., httpx_args={"transport": transport})
+
+Entries are keyed by method + URL. Entries younger than ``max_age`` are served
+without a request; older ones are revalidated with ``If-None-Match`` /
+``If-Modified-Since`` and a ``304`` answer is served from disk. A request sent
+with ``Cache-Control: no-cache`` always revalidates.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pathlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+CACHEABLE_METHODS = {"GET", "HEAD"}
+
+
+@dataclass
+class CacheStats:
+    """Request outcomes: served locally, fetched, or confirmed by a ``304``."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of requests answered without contacting the server."""
+        total = self.hits + self.misses + self.revalidated
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class CacheEntry:
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+    stored_at: float
+
+    @property
+    def validators(self) -> dict[str, str]:
+        headers = httpx.Headers(self.headers)
+        out = {}
+        if "etag" in headers:
+            out["If-None-Match"] = headers["etag"]
+        if "last-modified" in headers:
+            out["If-Modified-Since"] = headers["last-modified"]
+        return out
+
+
+class ResponseCache:
+    """Size-bounded LRU store of raw HTTP responses on disk.
+
+    Bodies are kept exactly as received (still content-encoded) so a cached
+    response decodes the same way as the original one.
+
+    Args:
+        directory: Where ``<key>.json`` / ``<key>.bin`` pairs are stored.
+        max_bytes: Evict least recently used entries beyond this total size.
+        max_age: Serve entries younger than this many seconds without
+            contacting the server. ``0`` always revalidates.
+    """
+
+    def __init__(
+        self,
+        directory: str | pathlib.Path,
+        max_bytes: int = 512 * 1024 * 1024,
+        max_age: float = 0,
+    ):
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.stats = CacheStats()
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self._load_index()
+
+    @staticmethod
+    def key(method: str, url: str) -> str:
+        return hashlib.sha256(f"{method.upper()} {url}".encode()).hexdigest()
+
+    @property
+    def size(self) -> int:
+        return sum(self._index.values())
+
+    def _paths(self, key: str) -> tuple[pathlib.Path, pathlib.Path]:
+        return self.directory / f"{key}.json", self.directory / f"{key}.bin"
+
+    def _load_index(self) -> None:
+        entries = []
+        for meta in self.directory.glob("*.json"):
+            body = meta.with_suffix(".bin")
+            if not body.exists():
+                meta.unlink()
+                continue
+            st = meta.stat()
+            entries.append((st.st_mtime, meta.stem, st.st_size + body.stat().st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        if key not in self._index:
+            return None
+        meta_path, body_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text())
+            content = body_path.read_bytes()
+        except (OSError, ValueError):
+            self.delete(key)
+            return None
+        return CacheEntry(
+            status_code=meta["status_code"],
+            headers=[tuple(h) for h in meta["headers"]],
+            content=content,
+            stored_at=meta["stored_at"],
+        )
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        meta_path, body_path = self._paths(key)
+        meta = json.dumps(
+            {
+                "status_code": entry.status_code,
+                "headers": entry.headers,
+                "stored_at": entry.stored_at,
+            }
+        )
+        body_path.write_bytes(entry.content)
+        meta_path.write_text(meta)
+        self._index[key] = len(entry.content) + len(meta.encode())
+        self._index.move_to_end(key)
+        self._evict()
+
+    def touch(self, key: str) -> None:
+        """Mark *key* as most recently used."""
+        self._index.move_to_end(key)
+        meta_path, _ = self._paths(key)
+        os.utime(meta_path)
+
+    def delete(self, key: str) -> None:
+        self._index.pop(key, None)
+        for path in self._paths(key):
+            path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for key in list(self._index):
+            self.delete(key)
+
+    def _evict(self) -> None:
+        total = self.size
+        while total > self.max_bytes and len(self._index) > 1:
+            key, size = next(iter(self._index.items()))
+            self.delete(key)
+            total -= size
+
+    # ------------------------------------------------------------------
+    # Shared request/response logic for the sync and async transports
+    # ------------------------------------------------------------------
+
+    def lookup(self, request: httpx.Request) -> tuple[str, Optional[CacheEntry]]:
+        if request.method not in CACHEABLE_METHODS:
+            return "", None
+        key = self.key(request.method, str(request.url))
+        return key, self.get(key)
+
+    def is_fresh(self, request: httpx.Request, entry: CacheEntry) -> bool:
+        if "no-cache" in request.headers.get("cache-control", ""):
+            return False
+        return time.time() - entry.stored_at < self.max_age
+
+    def conditional(self, request: httpx.Request, entry: CacheEntry) -> None:
+        for name, value in entry.validators.items():
+            request.headers.setdefault(name, value)
+
+    @staticmethod
+    def _response(entry: CacheEntry, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            entry.status_code,
+            headers=entry.headers,
+            content=entry.content,
+            request=request,
+        )
+
+    def serve(
+        self, key: str, entry: CacheEntry, request: httpx.Request
+    ) -> httpx.Response:
+        """Answer *request* from a fresh *entry* without contacting the server."""
+        self.stats.hits += 1
+        self.touch(key)
+        return self._response(entry, request)
+
+    def store(
+        self, key: str, request: httpx.Request, response: httpx.Response, raw: bytes
+    ) -> httpx.Response:
+        if not key:
+            return httpx.Response(
+                response.status_code,
+                headers=response.headers,
+                content=raw,
+                request=request,
+            )
+        self.stats.misses += 1
+        if response.status_code == 200:
+            self.put(
+                key,
+                CacheEntry(
+                    status_code=response.status_code,
+                    headers=response.headers.multi_items(),
+                    content=raw,
+                    stored_at=time.time(),
+                ),
+            )
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            content=raw,
+            request=request,
+            extensions=response.extensions,
+        )
+
+    def refresh(
+        self, key: str, entry: CacheEntry, request: httpx.Request
+    ) -> httpx.Response:
+        """Restart the freshness clock of *entry* after a ``304`` and answer with it."""
+        self.stats.revalidated += 1
+        entry.stored_at = time.time()
+        self.put(key, entry)
+        return self._response(entry, request)
+
+
+class CacheTransport(httpx.BaseTransport):
+    """Synchronous httpx transport that consults a :class:`ResponseCache`."""
+
+    def __init__(self, transport: httpx.BaseTransport, cache: ResponseCache):
+        self.transport = transport
+        self.cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key, entry = self.cache.lookup(request)
+        if entry is not None:
+            if self.cache.is_fresh(request, entry):
+                return self.cache.serve(key, entry, request)
+            self.cache.conditional(request, entry)
+
+        response = self.transport.handle_request(request)
+        if entry is not None and response.status_code == 304:
+            response.close()
+            return self.cache.refresh(key, entry, request)
+
+        try:
+            raw = b"".join(response.stream)
+        finally:
+            response.close()
+        return self.cache.store(key, request, response, raw)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncCacheTransport(httpx.AsyncBaseTransport):
+    """Asynchronous counterpart of :class:`CacheTransport`."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: ResponseCache):
+        self.transport = transport
+        self.cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key, entry = self.cache.lookup(request)
+        if entry is not None:
+            if self.cache.is_fresh(request, entry):
+                return self.cache.serve(key, entry, request)
+            self.cache.conditional(request, entry)
+
+        response = await self.transport.handle_async_request(request)
+        if entry is not None and response.status_code == 304:
+            await response.aclose()
+            return self.cache.refresh(key, entry, request)
+
+        try:
+            raw = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        return self.cache.store(key, request, response, raw)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,179 @@
+"""
+Record/replay ("cassette") transports for the CDISC Library client.
+
+In ``record`` mode every response passing through :class:`CassetteTransport`
+is captured; :meth:`Cassette.save` writes them to a gzip-compressed NDJSON
+archive. In ``replay`` mode the same transport answers from the archive
+without touching the network, returning the recorded bytes unchanged::
+
+    with Cassette("cdashig.cassette", mode="record") as cassette:
+        CrfGen(api_key, cassette=cassette).harvest()
+
+    CrfGen("offline", cassette=Cassette("cdashig.cassette")).harvest()
+
+Interactions are keyed by method and path + query, so a recording can be
+replayed against any base URL. Request headers (and with them the API key)
+are never stored.
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import pathlib
+from collections import defaultdict, deque
+from typing import Any, Literal, Optional
+
+import httpx
+
+Mode = Literal["record", "replay"]
+
+
+class CassetteMiss(LookupError):
+    """Raised in replay mode for a request that was never recorded."""
+
+
+def _key(request: httpx.Request) -> tuple[str, str]:
+    return request.method, request.url.raw_path.decode()
+
+
+class Cassette:
+    """An ordered collection of recorded HTTP interactions.
+
+    Repeated requests replay their recorded responses in order; once those
+    are used up the last one is repeated.
+    """
+
+    def __init__(self, path: str | pathlib.Path, mode: Mode = "replay"):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = pathlib.Path(path)
+        self.mode = mode
+        self.interactions: list[dict[str, Any]] = []
+        self._tapes: dict[tuple[str, str], deque] = defaultdict(deque)
+        if mode == "replay":
+            self.load()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def __enter__(self) -> "Cassette":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        if self.mode == "record":
+            self.save()
+
+    def load(self) -> None:
+        with gzip.open(self.path, "rt") as fh:
+            self.interactions = [json.loads(line) for line in fh if line.strip()]
+        self._tapes.clear()
+        for item in self.interactions:
+            self._tapes[(item["method"], item["url"])].append(item)
+
+    def save(self) -> None:
+        with gzip.open(self.path, "wt") as fh:
+            for item in self.interactions:
+                fh.write(json.dumps(item) + "\n")
+
+    def record(
+        self, request: httpx.Request, response: httpx.Response, raw: bytes
+    ) -> None:
+        method, url = _key(request)
+        self.interactions.append(
+            {
+                "method": method,
+                "url": url,
+                "status": response.status_code,
+                "headers": response.headers.multi_items(),
+                "body": base64.b64encode(raw).decode(),
+            }
+        )
+
+    def play(self, request: httpx.Request) -> httpx.Response:
+        tape = self._tapes.get(_key(request))
+        if not tape:
+            raise CassetteMiss(
+                f"No recorded response for {request.method} {request.url}"
+            )
+        item = tape.popleft() if len(tape) > 1 else tape[0]
+        return httpx.Response(
+            item["status"],
+            headers=[tuple(h) for h in item["headers"]],
+            content=base64.b64decode(item["body"]),
+            request=request,
+        )
+
+    def capture(
+        self, request: httpx.Request, response: httpx.Response, raw: bytes
+    ) -> httpx.Response:
+        self.record(request, response, raw)
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            content=raw,
+            request=request,
+            extensions=response.extensions,
+        )
+
+
+class CassetteTransport(httpx.BaseTransport):
+    """Synchronous transport recording to, or replaying from, a :class:`Cassette`.
+
+    *transport* performs the real requests while recording and is not
+    needed for replay. Install the cassette outside any retrying or caching
+    transports, so it records one final response per request.
+    """
+
+    def __init__(
+        self, cassette: Cassette, transport: Optional[httpx.BaseTransport] = None
+    ):
+        if not cassette.replaying and transport is None:
+            raise ValueError("recording needs a transport to send requests with")
+        self.cassette = cassette
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self.cassette.replaying:
+            return self.cassette.play(request)
+        response = self.transport.handle_request(request)
+        try:
+            raw = b"".join(response.stream)
+        finally:
+            response.close()
+        return self.cassette.capture(request, response, raw)
+
+    def close(self) -> None:
+        if self.transport is not None:
+            self.transport.close()
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    """Asynchronous counterpart of :class:`CassetteTransport`."""
+
+    def __init__(
+        self, cassette: Cassette, transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        if not cassette.replaying and transport is None:
+            raise ValueError("recording needs a transport to send requests with")
+        self.cassette = cassette
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self.cassette.replaying:
+            return self.cassette.play(request)
+        response = await self.transport.handle_async_request(request)
+        try:
+            raw = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        return self.cassette.capture(request, response, raw)
+
+    async def aclose(self) -> None:
+        if self.transport is not None:
+            await self.transport.aclose()
@@ -0,0 +1,133 @@
+"""
+Append-only checkpoint journal for resumable harvests.
+
+Each converted form is appended to the journal as soon as it is produced,
+keyed by its ``(version, domain, scenario)`` unit (``scenario`` is ``None``
+for the domain form itself). A harvest that is interrupted and restarted
+with the same journal replays completed units from disk and only fetches
+what is missing. Once the harvest output is written the journal is cleared,
+so the next run starts from scratch.
+
+The journal also coordinates parallel workers: a worker appends a *claim*
+for a ``(version, domain)`` before crawling it, and the first live claim in
+file order wins. Lines are written with single ``O_APPEND`` writes, so
+several processes can share one journal file.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from crfgen.schema import Form
+
+Unit = tuple[str, str, Optional[str]]
+
+
+@dataclass
+class Entry:
+    form: Form
+    children: list[str] = field(default_factory=list)
+
+
+class Journal:
+    """NDJSON journal of completed harvest units and worker claims.
+
+    Args:
+        path: Journal file; created on first write.
+        lease: Seconds after which another worker may take over a claim.
+    """
+
+    def __init__(self, path: str | pathlib.Path, lease: float = 600.0):
+        self.path = pathlib.Path(path)
+        self.lease = lease
+        self._done: dict[Unit, Entry] = {}
+        self._claims: dict[tuple[str, str], list[tuple[str, float]]] = {}
+        self._offset = 0
+        self.refresh()
+
+    def __contains__(self, unit: Unit) -> bool:
+        return unit in self._done
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def get(self, unit: Unit) -> Optional[Entry]:
+        return self._done.get(unit)
+
+    def refresh(self) -> None:
+        """Read records appended since the last call (by any process)."""
+        if not self.path.exists():
+            return
+        with self.path.open("rb") as fh:
+            fh.seek(self._offset)
+            data = fh.read()
+        # A trailing line without newline is still being written; leave it.
+        complete = data[: data.rfind(b"\n") + 1]
+        self._offset += len(complete)
+        for line in complete.splitlines():
+            try:
+                self._apply(json.loads(line))
+            except ValueError:
+                continue  # torn write from a crashed process
+
+    def _apply(self, record: dict) -> None:
+        if "unit" in record:
+            unit = tuple(record["unit"])
+            self._done[unit] = Entry(
+                form=Form.model_validate(record["form"]),
+                children=record.get("children", []),
+            )
+        elif "claim" in record:
+            key = tuple(record["claim"])
+            self._claims.setdefault(key, []).append((record["worker"], record["at"]))
+
+    def _append(self, record: dict) -> None:
+        line = (json.dumps(record) + "\n").encode()
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+
+    def record(
+        self, unit: Unit, form: Form, children: Optional[list[str]] = None
+    ) -> None:
+        """Mark *unit* as completed with its converted *form*."""
+        record = {"unit": list(unit), "form": form.model_dump(mode="json")}
+        if children is not None:
+            record["children"] = children
+        self._append(record)
+        self._done[unit] = Entry(form=form, children=children or [])
+
+    def clear(self) -> None:
+        """Delete the journal once its forms have been written out.
+
+        A later run with the same path then crawls afresh instead of
+        replaying the finished harvest.
+        """
+        self.path.unlink(missing_ok=True)
+        self._done.clear()
+        self._claims.clear()
+        self._offset = 0
+
+    def owner(self, version: str, domain: str) -> Optional[str]:
+        """Worker currently holding the claim on a domain, if any."""
+        now = time.time()
+        for worker, at in self._claims.get((version, domain), []):
+            if at + self.lease > now:
+                return worker
+        return None
+
+    def claim(self, version: str, domain: str, worker: str) -> bool:
+        """Try to claim a domain for *worker*; return True if it won."""
+        self.refresh()
+        if self.owner(version, domain) not in (None, worker):
+            return False
+        self._append({"claim": [version, domain], "worker": worker, "at": time.time()})
+        self.refresh()
+        return self.owner(version, domain) == worker
@@ -1,12 +1,137 @@
 from __future__ import annotations
 
-from typing import List
+import json
+import pathlib
+from typing import Iterator, List, Optional
 
+from crfgen.cache import ResponseCache
+from crfgen.cassette import Cassette
+from crfgen.checkpoint import Journal
 from crfgen.crfgen import CrfGen
-from crfgen.schema import Form
+from crfgen.ratelimit import AdaptiveRateLimiter
+from crfgen.schema import Form, dump_forms, dump_forms_ndjson
+from crfgen.traverse import LinkCrawler
 
 
-def harvest(api_key: str, ig_filter: str | None = None) -> List[Form]:
+def harvest(
+    api_key: str,
+    ig_filter: str | None = None,
+    cache: ResponseCache | None = None,
+    limiter: AdaptiveRateLimiter | None = None,
+) -> List[Form]:
     """Pull CDASH IG -> domains -> scenarios and convert to Form objects."""
-    crfgen = CrfGen(api_key, ig_filter)
+    crfgen = CrfGen(api_key, ig_filter, cache=cache, limiter=limiter)
     return crfgen.harvest()
+
+
+def iter_harvest(
+    api_key: str,
+    ig_filter: str | None = None,
+    cache: ResponseCache | None = None,
+    limiter: AdaptiveRateLimiter | None = None,
+    journal: Journal | None = None,
+    worker: str | None = None,
+    cassette: Cassette | None = None,
+) -> Iterator[Form]:
+    """Like :func:`harvest` but yield forms while the crawl is running.
+
+    Pass a *journal* to make the crawl resumable, and a *worker* name to only
+    crawl the domains this process claims in it. A *cassette* records the
+    Library traffic, or replays a recording instead of going online.
+    """
+    crfgen = CrfGen(api_key, ig_filter, cache=cache, limiter=limiter, cassette=cassette)
+    yield from crfgen.iter_harvest(journal=journal, worker=worker)
+
+
+def async_harvest(
+    api_key: str,
+    ig_filter: str | None = None,
+    concurrency: int = 8,
+    cache: ResponseCache | None = None,
+    limiter: AdaptiveRateLimiter | None = None,
+) -> List[Form]:
+    """Like :func:`harvest` but issues domain/scenario requests concurrently."""
+    crfgen = CrfGen(api_key, ig_filter, cache=cache, limiter=limiter)
+    return crfgen.async_harvest(concurrency)
+
+
+def search_harvest(
+    api_key: str,
+    ig_filter: str | None = None,
+    prefetch: int = 4,
+    cache: ResponseCache | None = None,
+    limiter: AdaptiveRateLimiter | None = None,
+) -> List[Form]:
+    """Like :func:`harvest` but built from paginated /mdr/search results."""
+    crfgen = CrfGen(api_key, ig_filter, cache=cache, limiter=limiter)
+    return crfgen.search_harvest(prefetch)
+
+
+def crawl_links(
+    api_key: str,
+    *roots: str,
+    max_depth: int | None = None,
+    prefixes: tuple[str, ...] = (),
+    cache: ResponseCache | None = None,
+    limiter: AdaptiveRateLimiter | None = None,
+    cassette: Cassette | None = None,
+) -> dict[str, dict]:
+    """Fetch every Library resource reachable from *roots* exactly once.
+
+    *roots* are hrefs or standard names such as ``"cdashig"``, ``"sdtmig"``,
+    ``"adam"`` or ``"ct"``.
+    """
+    crfgen = CrfGen(api_key, cache=cache, limiter=limiter, cassette=cassette)
+    crawler = LinkCrawler(crfgen.client, prefixes=prefixes, max_depth=max_depth)
+    return dict(crawler.crawl(*roots))
+
+
+def state_path(out: str | pathlib.Path) -> pathlib.Path:
+    """Location of the last-updated record kept next to *out*."""
+    out = pathlib.Path(out)
+    return out.with_name(out.name + ".lastupdated.json")
+
+
+def changed_groups(previous: dict, current: dict) -> set[str]:
+    """Product groups whose last-updated date differs between two records."""
+    return {
+        g for g in current.keys() | previous.keys() if previous.get(g) != current.get(g)
+    }
+
+
+def harvest_if_changed(
+    api_key: str,
+    out: str | pathlib.Path,
+    ig_filter: str | None = None,
+    cache: ResponseCache | None = None,
+    limiter: AdaptiveRateLimiter | None = None,
+) -> Optional[List[Form]]:
+    """Re-harvest into *out* only if the Library changed since the last run.
+
+    The /mdr/lastupdated dates seen on the previous run are stored beside
+    *out*. When none of the product groups feeding the crawl moved (and the
+    IG filter is unchanged) the crawl is skipped and ``None`` is returned.
+    An *out* with a ``.ndjson`` suffix is written one form per line.
+    """
+    crfgen = CrfGen(api_key, ig_filter, cache=cache, limiter=limiter)
+    current = crfgen.last_updated()
+    record = state_path(out)
+    previous = json.loads(record.read_text()) if record.exists() else {}
+
+    stale = changed_groups(previous.get("lastupdated", {}), current)
+    if (
+        pathlib.Path(out).exists()
+        and previous.get("ig_filter") == ig_filter
+        and not stale.intersection(CrfGen.PRODUCT_GROUPS)
+    ):
+        return None
+
+    forms = crfgen.harvest()
+    if pathlib.Path(out).suffix == ".ndjson":
+        dump_forms_ndjson(forms, out)
+    else:
+        dump_forms(forms, out)
+    record.write_text(
+        json.dumps({"ig_filter": ig_filter, "lastupdated": current}, indent=2)
+    )
+    return forms
@@ -1,35 +1,102 @@
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 import httpx
-from cdisc_library_client.client import AuthenticatedClient
+from attrs import evolve
+
 from cdisc_library_client.api.cdash_implementation_guide_cdashig import (
     get_mdr_cdashig_version,
-    get_mdr_cdashig_version_domains,
-    get_mdr_cdashig_version_scenarios,
+    get_mdr_cdashig_version_domains_domain,
+    get_mdr_cdashig_version_scenarios_domain_scenario,
 )
-from cdisc_library_client.api.default import get_mdr_products_data_collection
-
+from cdisc_library_client.api.default import (
+    get_mdr_lastupdated,
+    get_mdr_products_data_collection,
+)
+from cdisc_library_client.client import AuthenticatedClient
+from cdisc_library_client.models.lastupdated import Lastupdated
+from crfgen.cache import AsyncCacheTransport, CacheTransport, ResponseCache
+from crfgen.cassette import AsyncCassetteTransport, Cassette, CassetteTransport
+from crfgen.checkpoint import Journal
+from crfgen.ratelimit import (
+    AdaptiveRateLimiter,
+    AsyncRateLimitTransport,
+    RateLimitTransport,
+)
+from crfgen.raw import RawEndpoint
 from crfgen.schema import Form
+from crfgen.search import SearchHarvester, field_from_payload
+from crfgen.traverse import last_segment
+
+# The harvest only reads plain dicts, so bypass the attrs model layer.
+get_mdr_products_data_collection = RawEndpoint(get_mdr_products_data_collection)
+get_mdr_cdashig_version = RawEndpoint(get_mdr_cdashig_version)
+get_mdr_cdashig_version_domains_domain = RawEndpoint(
+    get_mdr_cdashig_version_domains_domain
+)
+get_mdr_cdashig_version_scenarios_domain_scenario = RawEndpoint(
+    get_mdr_cdashig_version_scenarios_domain_scenario
+)
+
+
+def _scenario_names(dom: dict) -> list[str]:
+    """Scenario names of a domain payload: ``.../scenarios/VS.Generic`` -> ``Generic``."""
+    links = dom["_links"].get("scenarios") or []
+    return [last_segment(link).partition(".")[2] for link in links]
 
 
 class CrfGen:
-    def __init__(self, api_key: str, ig_filter: Optional[str] = None):
+    # /mdr/lastupdated product groups whose content feeds :meth:`harvest`
+    PRODUCT_GROUPS = ("data-collection",)
+
+    def __init__(
+        self,
+        api_key: str,
+        ig_filter: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+        base_url: str = "https://library.cdisc.org/api",
+        cassette: Optional[Cassette] = None,
+    ):
         self.api_key = api_key
+        self.base_url = base_url
         self.ig_filter = ig_filter
+        self.cache = cache
+        self.cassette = cassette
+        # Optional; when given, one limiter paces both the sync and the async
+        # client and retries throttled requests.
+        self.limiter = limiter
         self.client = self._get_client()
 
     def _get_client(self) -> AuthenticatedClient:
         """
         Get an authenticated client for the CDISC Library API.
         """
-        transport = httpx.HTTPTransport(retries=5)
+        if self.cassette is not None and self.cassette.replaying:
+            # Replays never reach the Library, so they are neither paced nor cached.
+            transport = CassetteTransport(self.cassette)
+        else:
+            transport = httpx.HTTPTransport(retries=5)
+            if self.limiter is not None:
+                transport = RateLimitTransport(transport, self.limiter)
+            if self.cache is not None:
+                transport = CacheTransport(transport, self.cache)
+            if self.cassette is not None:
+                # Outermost, so only the final response of each request is
+                # recorded: no throttled retries or cache revalidations.
+                transport = CassetteTransport(self.cassette, transport)
+        headers = {"Accept": "application/json"}
+        if self.cache is None:
+            # Without a local cache always ask for current content; with one,
+            # the cache's max_age decides when to revalidate.
+            headers["Cache-Control"] = "no-cache"
         client = AuthenticatedClient(
-            base_url="https://library.cdisc.org/api",
+            base_url=self.base_url,
             token=self.api_key,
-            headers={"Accept": "application/json", "Cache-Control": "no-cache"},
+            headers=headers,
             auth_header_name="api-key",
             prefix="",
             timeout=30.0,
@@ -37,42 +104,201 @@ class CrfGen:
         )
         return client
 
+    def _get_async_client(self) -> AuthenticatedClient:
+        """
+        Get a copy of :attr:`client` wired to an async transport.
+        """
+        if self.cassette is not None and self.cassette.replaying:
+            transport = AsyncCassetteTransport(self.cassette)
+        else:
+            transport = httpx.AsyncHTTPTransport(retries=5)
+            if self.limiter is not None:
+                transport = AsyncRateLimitTransport(transport, self.limiter)
+            if self.cache is not None:
+                transport = AsyncCacheTransport(transport, self.cache)
+            if self.cassette is not None:
+                transport = AsyncCassetteTransport(self.cassette, transport)
+        return evolve(self.client, httpx_args={"transport": transport})
+
+    def last_updated(self) -> dict[str, str]:
+        """Return the /mdr/lastupdated dates keyed by product group."""
+        resp = get_mdr_lastupdated.sync(client=self.client)
+        if not isinstance(resp, Lastupdated):
+            raise RuntimeError(f"Unable to read /mdr/lastupdated: {resp!r}")
+        stamps = resp.to_dict()
+        stamps.pop("_links", None)
+        return stamps
+
     def harvest(self) -> List[Form]:
         """Pull CDASH IG -> domains -> scenarios and convert to Form objects."""
+        return list(self.iter_harvest())
+
+    def iter_harvest(
+        self, journal: Optional[Journal] = None, worker: Optional[str] = None
+    ) -> Iterator[Form]:
+        """Like :meth:`harvest` but yield each Form as soon as it is converted.
+
+        With a *journal*, completed units are replayed from it instead of
+        being fetched again and new ones are appended to it. With a *worker*
+        name as well, only domains this worker manages to claim are crawled.
+        A failed request raises
+        :class:`~cdisc_library_client.errors.UnexpectedStatus` before its
+        unit is journaled, so a resumed run fetches it again.
+        """
+        if worker is not None and journal is None:
+            raise ValueError("worker mode needs a journal to claim units from")
         products = get_mdr_products_data_collection.sync(client=self.client)
-        cdashig_links = products.additional_properties["_links"]["cdashig"]
-        forms: list[Form] = []
-        for ver_link in cdashig_links:
+        for ver_link in products["_links"]["cdashig"]:
             if self.ig_filter and self.ig_filter not in ver_link["title"]:
                 continue
-            ig = get_mdr_cdashig_version.sync(client=self.client, version=ver_link["title"])
+            version = last_segment(ver_link)
+            ig = get_mdr_cdashig_version.sync(client=self.client, version=version)
             for dom_link in ig["_links"].get("domains", []):
-                dom = get_mdr_cdashig_version_domains.sync(client=self.client, version=ver_link["title"], domain=dom_link["title"])
-                scenarios = dom["_links"].get("scenarios") or []
-                payloads = [dom] + [
-                    get_mdr_cdashig_version_scenarios.sync(client=self.client, version=ver_link["title"], domain=dom_link["title"], scenario=s["title"])
-                    for s in scenarios
-                ]
-                for p in payloads:
-                    forms.append(self._form_from_api(p))
-        return forms
-
-    def _form_from_api(self, data: dict) -> Form:
-        """Convert a CDISC Library API response into a Form object."""
+                domain = last_segment(dom_link)
+                if worker is not None and not journal.claim(version, domain, worker):
+                    continue
+                yield from self._harvest_domain(
+                    version, domain, dom_link.get("title"), journal
+                )
+
+    def _harvest_domain(
+        self,
+        version: str,
+        domain: str,
+        title: Optional[str],
+        journal: Optional[Journal],
+    ) -> Iterator[Form]:
+        entry = journal.get((version, domain, None)) if journal else None
+        if entry is not None:
+            scenarios = entry.children
+            yield entry.form
+        else:
+            dom = get_mdr_cdashig_version_domains_domain.sync(
+                client=self.client, version=version, domain=domain
+            )
+            scenarios = _scenario_names(dom)
+            form = self._form_from_api(dom, domain, title=title)
+            if journal is not None:
+                journal.record((version, domain, None), form, scenarios)
+            yield form
+        for scenario in scenarios:
+            entry = journal.get((version, domain, scenario)) if journal else None
+            if entry is not None:
+                yield entry.form
+                continue
+            payload = get_mdr_cdashig_version_scenarios_domain_scenario.sync(
+                client=self.client, version=version, domain=domain, scenario=scenario
+            )
+            form = self._form_from_api(payload, domain, scenario)
+            if journal is not None:
+                journal.record((version, domain, scenario), form)
+            yield form
+
+    def async_harvest(self, concurrency: int = 8) -> List[Form]:
+        """Concurrent variant of :meth:`harvest`.
+
+        Domain and scenario requests are fanned out over the async httpx
+        client with at most *concurrency* requests in flight. Forms are
+        returned in the same order as :meth:`harvest` would produce them.
+        """
+        return asyncio.run(self._async_harvest(concurrency))
+
+    async def _async_harvest(self, concurrency: int) -> List[Form]:
+        async with self._get_async_client() as client:
+            return await self._async_crawl(client, asyncio.Semaphore(concurrency))
+
+    async def _async_crawl(
+        self, client: AuthenticatedClient, limit: asyncio.Semaphore
+    ) -> List[Form]:
+        async def fetch(endpoint, **kwargs):
+            async with limit:
+                return await endpoint.asyncio(client=client, **kwargs)
+
+        async def domain_forms(version: str, dom_link: dict) -> List[Form]:
+            domain = last_segment(dom_link)
+            dom = await fetch(
+                get_mdr_cdashig_version_domains_domain, version=version, domain=domain
+            )
+            scenarios = _scenario_names(dom)
+            payloads = await asyncio.gather(
+                *(
+                    fetch(
+                        get_mdr_cdashig_version_scenarios_domain_scenario,
+                        version=version,
+                        domain=domain,
+                        scenario=scenario,
+                    )
+                    for scenario in scenarios
+                )
+            )
+            return [
+                self._form_from_api(dom, domain, title=dom_link.get("title")),
+                *(
+                    self._form_from_api(payload, domain, scenario)
+                    for scenario, payload in zip(scenarios, payloads)
+                ),
+            ]
+
+        products = await fetch(get_mdr_products_data_collection)
+        versions = [
+            last_segment(ver_link)
+            for ver_link in products["_links"]["cdashig"]
+            if not self.ig_filter or self.ig_filter in ver_link["title"]
+        ]
+        igs = await asyncio.gather(
+            *(fetch(get_mdr_cdashig_version, version=v) for v in versions)
+        )
+        # gather() keeps submission order, so the result is deterministic
+        # regardless of which responses arrive first.
+        groups = await asyncio.gather(
+            *(
+                domain_forms(version, dom_link)
+                for version, ig in zip(versions, igs)
+                for dom_link in ig["_links"].get("domains", [])
+            )
+        )
+        return [form for forms in groups for form in forms]
+
+    def search_harvest(self, prefetch: int = 4, page_size: int = 100) -> List[Form]:
+        """Harvest from paginated /mdr/search results instead of per-resource requests.
+
+        See :class:`~crfgen.search.SearchHarvester`; at most *prefetch*
+        requests are in flight.
+        """
+        return asyncio.run(self._search_harvest(prefetch, page_size))
+
+    async def _search_harvest(self, prefetch: int, page_size: int) -> List[Form]:
+        async with self._get_async_client() as client:
+            harvester = SearchHarvester(client, prefetch=prefetch, page_size=page_size)
+            products = await get_mdr_products_data_collection.asyncio(client=client)
+            forms: List[Form] = []
+            for ver_link in products["_links"]["cdashig"]:
+                if self.ig_filter and self.ig_filter not in ver_link["title"]:
+                    continue
+                version = last_segment(ver_link)
+                forms += await harvester.harvest(version)
+            return forms
+
+    def _form_from_api(
+        self,
+        data: dict,
+        domain: str,
+        scenario: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> Form:
+        """Convert a CDASHIG domain or scenario payload into a Form object.
+
+        Domain forms are titled with the *title* of the IG's link to them, as
+        in :meth:`search_harvest`, which never fetches the domain payload.
+        Fields without a prompt or datatype are skipped.
+        """
         return Form(
-            name=data.get("name"),
-            ig_name=data.get("igName"),
-            ig_version=data.get("igVersion"),
-            domain=data.get("domain"),
-            scenario=data.get("scenario"),
+            title=title or domain if scenario is None else f"{domain}.{scenario}",
+            domain=domain,
+            scenario=scenario,
             fields=[
-                {
-                    "name": f.get("name"),
-                    "label": f.get("label"),
-                    "field_type": f.get("fieldType"),
-                    "terminology": f.get("terminology"),
-                    "instructions": f.get("instructions"),
-                }
-                for f in data.get("fields", [])
+                field
+                for field in map(field_from_payload, data.get("fields") or [])
+                if field is not None
             ],
         )
@@ -0,0 +1,277 @@
+"""
+Bulk Controlled Terminology loader and in-process codelist index.
+
+Resolving each :class:`~crfgen.schema.Codelist` through the per-codelist
+endpoints costs one request per codelist per form. :class:`CTLoader` instead
+downloads whole CT packages concurrently (``/mdr/ct/packages/{package}``
+embeds every codelist and term) into a :class:`CTIndex`, which answers
+lookups from dictionaries keyed by package and NCI code. Published packages
+never change, so an index saved to disk is only topped up with new ones::
+
+    index = CTIndex.load("ct/")
+    asyncio.run(CTLoader(client).load(["sdtmct-2025-03-28"], index))
+    index.save("ct/")
+    index.term("C66769", "MILD").code  # 'C41338'
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import pathlib
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Any, Iterable, Optional
+
+from cdisc_library_client.api.controlled_terminology_ct import (
+    get_mdr_ct_packages,
+    get_mdr_ct_packages_package_codelists,
+    get_mdr_ct_packages_package_codelists_codelist,
+    get_mdr_ct_packages_product,
+)
+from cdisc_library_client.client import AuthenticatedClient
+from crfgen.raw import RawEndpoint
+from crfgen.traverse import last_segment
+
+get_mdr_ct_packages = RawEndpoint(get_mdr_ct_packages)
+get_mdr_ct_packages_product = RawEndpoint(get_mdr_ct_packages_product)
+get_mdr_ct_packages_package_codelists = RawEndpoint(
+    get_mdr_ct_packages_package_codelists
+)
+get_mdr_ct_packages_package_codelists_codelist = RawEndpoint(
+    get_mdr_ct_packages_package_codelists_codelist
+)
+
+# "sdtmct-2025-03-28" -> product "sdtmct", date "2025-03-28"
+PACKAGE_NAME = re.compile(r"^(?P<product>[a-z0-9]+)-(?P<date>\d{4}-\d{2}-\d{2})$")
+
+
+def package_date(name: str) -> str:
+    match = PACKAGE_NAME.match(name)
+    if match is None:
+        raise ValueError(f"Not a CT package name: {name}")
+    return match["date"]
+
+
+@dataclass(frozen=True)
+class Term:
+    code: str
+    submission_value: str
+    preferred_term: str = ""
+    definition: str = ""
+    synonyms: tuple[str, ...] = ()
+
+
+@dataclass
+class CodelistTerms:
+    code: str
+    submission_value: str
+    name: str = ""
+    extensible: bool = False
+    terms: list[Term] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self._by_key = {}
+        for term in self.terms:
+            self._by_key.setdefault(term.code, term)
+            self._by_key.setdefault(term.submission_value, term)
+
+    def get(self, key: str) -> Optional[Term]:
+        """Term by NCI code or submission value."""
+        return self._by_key.get(key)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CodelistTerms":
+        """Inverse of :func:`dataclasses.asdict`."""
+        terms = [Term(**{**t, "synonyms": tuple(t["synonyms"])}) for t in data["terms"]]
+        return cls(**{**data, "terms": terms})
+
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> "CodelistTerms":
+        return cls(
+            code=data["conceptId"],
+            submission_value=data.get("submissionValue", ""),
+            name=data.get("name", ""),
+            extensible=str(data.get("extensible", "")).lower() == "true",
+            terms=[
+                Term(
+                    code=t["conceptId"],
+                    submission_value=t.get("submissionValue", ""),
+                    preferred_term=t.get("preferredTerm", ""),
+                    definition=t.get("definition", ""),
+                    synonyms=tuple(t.get("synonyms") or ()),
+                )
+                for t in data.get("terms") or []
+            ],
+        )
+
+
+class CTIndex:
+    """Codelists of one or more CT packages, keyed by package and NCI code.
+
+    Lookups without a *package* use the newest loaded package containing the
+    codelist; *package* may be a full name (``"sdtmct-2025-03-28"``) or just
+    a date, which matches any product published that day.
+    """
+
+    def __init__(self) -> None:
+        self._packages: dict[str, dict[str, CodelistTerms]] = {}
+        # code -> ((date, package), codelist) of the newest package
+        self._latest: dict[str, tuple[tuple[str, str], CodelistTerms]] = {}
+        # (date, code) -> (package, codelist) of the first package that day
+        self._by_date: dict[tuple[str, str], tuple[str, CodelistTerms]] = {}
+
+    def __contains__(self, package: str) -> bool:
+        return package in self._packages
+
+    def __len__(self) -> int:
+        return len(self._packages)
+
+    @property
+    def packages(self) -> list[str]:
+        return sorted(self._packages, key=lambda name: (package_date(name), name))
+
+    def add(self, package: str, codelists: Iterable[CodelistTerms]) -> None:
+        replacing = package in self._packages
+        self._packages[package] = {cl.code: cl for cl in codelists}
+        if replacing:
+            self._reindex()
+        else:
+            self._index(package)
+
+    def _index(self, name: str) -> None:
+        """Merge package *name* into the lookup tables, in any insertion order."""
+        rank = (package_date(name), name)
+        for code, codelist in self._packages[name].items():
+            latest = self._latest.get(code)
+            if latest is None or latest[0] < rank:
+                self._latest[code] = (rank, codelist)
+            same_day = self._by_date.get((rank[0], code))
+            if same_day is None or name < same_day[0]:
+                self._by_date[(rank[0], code)] = (name, codelist)
+
+    def _reindex(self) -> None:
+        self._latest.clear()
+        self._by_date.clear()
+        for name in self._packages:
+            self._index(name)
+
+    def codelist(
+        self, code: str, package: Optional[str] = None
+    ) -> Optional[CodelistTerms]:
+        if package is None:
+            found = self._latest.get(code)
+        elif package in self._packages:
+            return self._packages[package].get(code)
+        else:
+            found = self._by_date.get((package, code))
+        return found[1] if found is not None else None
+
+    def terms(self, code: str, package: Optional[str] = None) -> list[Term]:
+        codelist = self.codelist(code, package)
+        return codelist.terms if codelist is not None else []
+
+    def term(
+        self, code: str, key: str, package: Optional[str] = None
+    ) -> Optional[Term]:
+        """Term of codelist *code* by NCI code or submission value."""
+        codelist = self.codelist(code, package)
+        return codelist.get(key) if codelist is not None else None
+
+    def save(self, directory: str | pathlib.Path) -> None:
+        """Write one ``<package>.json`` per package into *directory*."""
+        directory = pathlib.Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, codelists in self._packages.items():
+            path = directory / f"{name}.json"
+            if not path.exists():
+                data = [asdict(cl) for cl in codelists.values()]
+                path.write_text(json.dumps(data))
+
+    @classmethod
+    def load(cls, directory: str | pathlib.Path) -> "CTIndex":
+        index = cls()
+        for path in sorted(pathlib.Path(directory).glob("*.json")):
+            codelists = map(CodelistTerms.from_dict, json.loads(path.read_text()))
+            index._packages[path.stem] = {cl.code: cl for cl in codelists}
+        index._reindex()
+        return index
+
+
+def select_packages(
+    names: Iterable[str], products: Iterable[str] = (), latest: bool = False
+) -> list[str]:
+    """Filter package names by product and optionally keep the newest per product."""
+    wanted = set(products)
+    chosen: dict[str, list[str]] = {}
+    for name in names:
+        match = PACKAGE_NAME.match(name)
+        if match and (not wanted or match["product"] in wanted):
+            chosen.setdefault(match["product"], []).append(name)
+    if latest:
+        chosen = {
+            product: [max(found, key=package_date)] for product, found in chosen.items()
+        }
+    return sorted(
+        (name for found in chosen.values() for name in found),
+        key=lambda name: (package_date(name), name),
+    )
+
+
+class CTLoader:
+    """Download CT packages concurrently into a :class:`CTIndex`.
+
+    Args:
+        client: Client whose async httpx client performs the requests.
+        concurrency: Maximum requests in flight.
+    """
+
+    def __init__(self, client: AuthenticatedClient, concurrency: int = 8):
+        self.client = client
+        self.requests = 0
+        self._limit = asyncio.Semaphore(concurrency)
+
+    async def _fetch(self, endpoint: RawEndpoint, **kwargs: Any) -> Any:
+        async with self._limit:
+            payload = await endpoint.asyncio(client=self.client, **kwargs)
+        self.requests += 1
+        if not isinstance(payload, dict) or "_links" not in payload:
+            raise RuntimeError(f"Unexpected CT response for {kwargs}: {payload!r}")
+        return payload
+
+    async def available(self) -> list[str]:
+        """Names of all packages published in the Library."""
+        listing = await self._fetch(get_mdr_ct_packages)
+        return [last_segment(ref) for ref in listing["_links"].get("packages") or []]
+
+    async def package(self, name: str) -> list[CodelistTerms]:
+        """All codelists of package *name* with their terms."""
+        payload = await self._fetch(get_mdr_ct_packages_product, product=name)
+        if "codelists" in payload:
+            return [CodelistTerms.from_api(cl) for cl in payload["codelists"]]
+        # Package without embedded codelists: list them, then fetch each.
+        listing = await self._fetch(get_mdr_ct_packages_package_codelists, package=name)
+        codes = [last_segment(ref) for ref in listing["_links"].get("codelists") or []]
+        payloads = await asyncio.gather(
+            *(
+                self._fetch(
+                    get_mdr_ct_packages_package_codelists_codelist,
+                    package=name,
+                    codelist=code,
+                )
+                for code in codes
+            )
+        )
+        return [CodelistTerms.from_api(p) for p in payloads]
+
+    async def load(
+        self, names: Iterable[str], index: Optional[CTIndex] = None
+    ) -> CTIndex:
+        """Add packages *names* missing from *index* (a new one by default)."""
+        index = index if index is not None else CTIndex()
+        todo = [n for n in dict.fromkeys(names) if n not in index]
+        for name, codelists in zip(
+            todo, await asyncio.gather(*map(self.package, todo))
+        ):
+            index.add(name, codelists)
+        return index
@@ -0,0 +1,279 @@
+"""
+Offline Controlled Terminology store built from the CDISC CT workbooks.
+
+The ``*_CT_<date>.xlsx`` workbooks under ``data_standards/terminology`` are
+parsed once (streaming, with openpyxl - no pandas) into a SQLite file with
+indexed codelist, term and submission-value lookups. :class:`CTStore` opens
+that file read-only and memory-mapped, so startup costs no parsing; a
+codelist is read with one indexed query and then served from memory::
+
+    build_ct_store(sorted(pathlib.Path("data_standards/terminology").glob("*.xlsx")),
+                   "ct.sqlite")
+    store = CTStore("ct.sqlite")
+    [t.submission_value for t in store.expand("C66742")]  # ['N', 'NA', 'U', 'Y']
+"""
+
+from __future__ import annotations
+
+import pathlib
+import re
+import sqlite3
+from typing import Iterable, Iterator, Optional
+
+from crfgen.ct import CodelistTerms, Term
+
+SHEET = "Terminology"
+MMAP_BYTES = 256 * 1024 * 1024
+SYNONYM_SEP = "; "
+
+SCHEMA = """
+CREATE TABLE codelist (
+    code TEXT PRIMARY KEY,
+    submission_value TEXT NOT NULL,
+    name TEXT NOT NULL,
+    extensible INTEGER NOT NULL,
+    standard TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE term (
+    codelist TEXT NOT NULL,
+    code TEXT NOT NULL,
+    submission_value TEXT NOT NULL,
+    preferred_term TEXT NOT NULL,
+    definition TEXT NOT NULL,
+    synonyms TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (codelist, code)
+) WITHOUT ROWID;
+CREATE INDEX term_value ON term (submission_value, codelist);
+CREATE INDEX term_order ON term (codelist, position);
+"""
+
+# "C66726; C78418" / "C66742, C66789" -> ["C66726", "C78418"]
+CODE = re.compile(r"C\d+")
+
+COLUMNS = {
+    "Code": "code",
+    "Codelist Code": "codelist",
+    "Codelist Extensible (Yes/No)": "extensible",
+    "Codelist Name": "name",
+    "CDISC Submission Value": "submission_value",
+    "CDISC Synonym(s)": "synonyms",
+    "CDISC Definition": "definition",
+    "NCI Preferred Term": "preferred_term",
+    "Standard and Date": "standard",
+}
+
+
+def read_workbook(path: str | pathlib.Path) -> Iterator[dict[str, str]]:
+    """Yield the rows of the ``Terminology`` sheet keyed by :data:`COLUMNS`."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook[SHEET].iter_rows(values_only=True)
+        header = [COLUMNS.get(str(cell).strip()) for cell in next(rows)]
+        for values in rows:
+            row = {
+                key: "" if value is None else str(value).strip()
+                for key, value in zip(header, values)
+                if key is not None
+            }
+            if row.get("code"):
+                yield row
+    finally:
+        workbook.close()
+
+
+def build_ct_store(
+    workbooks: Iterable[str | pathlib.Path], path: str | pathlib.Path
+) -> dict[str, int]:
+    """Parse *workbooks* into a fresh SQLite store at *path*.
+
+    Codelists shared between packages (SDTM and SEND, say) are stored once;
+    the first workbook listing a codelist wins, and the terms later
+    workbooks list for it are ignored rather than merged in.
+
+    Returns:
+        Counts of stored codelists and terms.
+    """
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    conn = sqlite3.connect(tmp)
+    try:
+        conn.executescript(SCHEMA)
+        for workbook in workbooks:
+            loaded = {code for (code,) in conn.execute("SELECT code FROM codelist")}
+            codelists, terms = [], []
+            for row in read_workbook(workbook):
+                if not row.get("codelist"):
+                    codelists.append(
+                        (
+                            row["code"],
+                            row.get("submission_value", ""),
+                            row.get("name", ""),
+                            int(row.get("extensible", "").lower() == "yes"),
+                            row.get("standard", ""),
+                        )
+                    )
+                    continue
+                if row["codelist"] in loaded:
+                    continue
+                terms.append(
+                    (
+                        row["codelist"],
+                        row["code"],
+                        row.get("submission_value", ""),
+                        row.get("preferred_term", ""),
+                        row.get("definition", ""),
+                        row.get("synonyms", ""),
+                        len(terms),
+                    )
+                )
+            conn.executemany(
+                "INSERT OR IGNORE INTO codelist VALUES (?, ?, ?, ?, ?)", codelists
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO term VALUES (?, ?, ?, ?, ?, ?, ?)", terms
+            )
+        conn.commit()
+        counts = {
+            "codelists": conn.execute("SELECT count(*) FROM codelist").fetchone()[0],
+            "terms": conn.execute("SELECT count(*) FROM term").fetchone()[0],
+        }
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    tmp.replace(path)
+    return counts
+
+
+def _term(row: tuple) -> Term:
+    code, value, preferred, definition, synonyms = row
+    return Term(
+        code=code,
+        submission_value=value,
+        preferred_term=preferred,
+        definition=definition,
+        synonyms=tuple(synonyms.split(SYNONYM_SEP)) if synonyms else (),
+    )
+
+
+class CTStore:
+    """Read-only, memory-mapped view of a store written by :func:`build_ct_store`.
+
+    Args:
+        path: SQLite file to open.
+        mmap_bytes: Size of the SQLite memory map.
+    """
+
+    _TERM = (
+        "SELECT code, submission_value, preferred_term, definition, synonyms FROM term"
+    )
+
+    def __init__(self, path: str | pathlib.Path, mmap_bytes: int = MMAP_BYTES):
+        self.path = pathlib.Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(self.path)
+        self._conn = sqlite3.connect(
+            f"{self.path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._conn.execute(f"PRAGMA mmap_size = {int(mmap_bytes)}")
+        self._terms: dict[str, list[Term]] = {}
+        self._keys: dict[str, dict[str, Term]] = {}
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "CTStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __contains__(self, code: str) -> bool:
+        query = "SELECT 1 FROM codelist WHERE code = ?"
+        return self._conn.execute(query, (code,)).fetchone() is not None
+
+    def terms(self, code: str) -> list[Term]:
+        """Terms of codelist *code* in workbook order (memoised)."""
+        found = self._terms.get(code)
+        if found is None:
+            query = f"{self._TERM} WHERE codelist = ? ORDER BY position"
+            found = self._terms[code] = list(
+                map(_term, self._conn.execute(query, (code,)))
+            )
+        return found
+
+    def codelist(self, code: str) -> Optional[CodelistTerms]:
+        query = "SELECT submission_value, name, extensible FROM codelist WHERE code = ?"
+        row = self._conn.execute(query, (code,)).fetchone()
+        if row is None:
+            return None
+        value, name, extensible = row
+        return CodelistTerms(
+            code=code,
+            submission_value=value,
+            name=name,
+            extensible=bool(extensible),
+            terms=self.terms(code),
+        )
+
+    def term(self, codelist: str, key: str) -> Optional[Term]:
+        """Term of *codelist* by NCI code, submission value or CDISC synonym.
+
+        Codes and submission values take precedence over synonyms.
+        """
+        keys = self._keys.get(codelist)
+        if keys is None:
+            keys = self._keys[codelist] = {}
+            terms = self.terms(codelist)
+            for term in terms:
+                keys.setdefault(term.code, term)
+                keys.setdefault(term.submission_value, term)
+            for term in terms:
+                for synonym in term.synonyms:
+                    keys.setdefault(synonym, term)
+        return keys.get(key)
+
+    def code(
+        self, submission_value: str, codelist: Optional[str] = None
+    ) -> Optional[str]:
+        """NCI code of the term submitted as *submission_value*.
+
+        Without *codelist* the first match in any codelist is returned.
+        """
+        if codelist is not None:
+            term = self.term(codelist, submission_value)
+            return term.code if term is not None else None
+        query = "SELECT code FROM term WHERE submission_value = ? LIMIT 1"
+        row = self._conn.execute(query, (submission_value,)).fetchone()
+        return row[0] if row is not None else None
+
+    def expand(self, ct_codes: str) -> list[Term]:
+        """Terms of the codelists in a ``CT Codes`` cell such as ``"C66726; C78418"``.
+
+        A cell may name a parent codelist with its CDASH subset (``UNIT;
+        CMDOSU``); a listed codelist is then skipped when another listed one
+        holds a subset of its terms, so only the subset is offered. Of two
+        codelists with the same terms (``--TEST; --TESTCD``) the first wins.
+        Unrelated codelists are merged in cell order.
+        """
+        codes = list(dict.fromkeys(CODE.findall(ct_codes or "")))
+        members = {code: {t.code for t in self.terms(code)} for code in codes}
+        seen: dict[str, Term] = {}
+        for i, code in enumerate(codes):
+            if any(
+                members[other]
+                and (
+                    members[other] < members[code]
+                    or (members[other] == members[code] and j < i)
+                )
+                for j, other in enumerate(codes)
+                if j != i
+            ):
+                continue
+            for term in self.terms(code):
+                seen.setdefault(term.code, term)
+        return list(seen.values())
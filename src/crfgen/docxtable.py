@@ -0,0 +1,54 @@
+"""
+Bulk row construction for python-docx tables.
+
+``Table.add_row()`` followed by ``row.cells`` builds each ``w:tc`` through the
+oxml element API and re-derives the row's cells from the layout grid on every
+call. :func:`append_rows` instead clones one prebuilt ``w:tr`` per row, fills
+the cell text directly and appends all rows to the ``w:tbl`` at once::
+
+    rows = append_rows(table, ([v.name, v.label] for v in variables))
+    rows[0][1].paragraphs[0].add_run(" (required)").bold = True
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import Iterable, Optional, Sequence
+
+from docx.oxml.ns import qn
+from docx.oxml.table import CT_Row
+from docx.table import Table, _Cell
+
+
+def row_template(table: Table) -> CT_Row:
+    """Empty ``w:tr`` with one ``w:tc`` per grid column, sized like ``add_row``."""
+    tr = table._tbl._new_tr()
+    for grid_col in table._tbl.tblGrid.gridCol_lst:
+        tc = tr.add_tc()
+        if grid_col.w is not None:
+            tc.width = grid_col.w
+    return tr
+
+
+def append_rows(
+    table: Table, rows: Iterable[Sequence[Optional[str]]]
+) -> list[tuple[_Cell, ...]]:
+    """Append one row per item of *rows* to *table* and return the new cells.
+
+    Each item holds the cell texts in column order. ``""`` writes an empty
+    run, as ``cell.text = ""`` does; ``None`` or a missing trailing value
+    leaves the cell with just its empty paragraph. The returned cells wrap
+    the new ``w:tc`` elements, so runs and content controls can be added
+    to their paragraphs afterwards.
+    """
+    template = row_template(table)
+    p_tag = qn("w:p")
+    new_rows = []
+    for texts in rows:
+        tr = deepcopy(template)
+        for tc, text in zip(tr.tc_lst, texts):
+            if text is not None:
+                tc.find(p_tag).add_r().text = text
+        new_rows.append(tr)
+    table._tbl.extend(new_rows)
+    return [tuple(_Cell(tc, table) for tc in tr.tc_lst) for tr in new_rows]
@@ -7,7 +7,7 @@ from crfgen.schema import Form
 from .registry import register
 
 
-@register("csv")
+@register("csv", outputs=["forms.csv"])
 def export_csv(forms: Sequence[Form], outdir: Path) -> None:
     path = outdir / "forms.csv"
     with path.open("w", newline="") as fh:
@@ -8,7 +8,7 @@ from crfgen.schema import Form
 from .registry import register
 
 
-@register("docx")
+@register("docx", outputs=["forms.docx"])
 def export_docx(forms: Sequence[Form], outdir: Path) -> None:
     doc = docx.Document()
     for form in forms:
@@ -6,10 +6,17 @@ from jinja2 import Environment, FileSystemLoader
 from ..schema import Form
 from .registry import register
 
-env = Environment(loader=FileSystemLoader(Path(__file__).parent.parent / "templates"))
+TEMPLATES = Path(__file__).parent.parent / "templates"
 
+env = Environment(loader=FileSystemLoader(TEMPLATES))
 
-@register("tex")
+
+@register(
+    "tex",
+    per_form=True,
+    templates=[TEMPLATES / "latex.j2"],
+    outputs=["{domain}.tex"],
+)
 def render_tex(forms: Sequence[Form], out_dir: Path):
     out_dir.mkdir(exist_ok=True, parents=True)
     tpl = env.get_template("latex.j2")
@@ -6,13 +6,20 @@ from jinja2 import Environment, FileSystemLoader, select_autoescape
 from ..schema import Form
 from .registry import register
 
+TEMPLATES = Path(__file__).parent.parent / "templates"
+
 env = Environment(
-    loader=FileSystemLoader(Path(__file__).parent.parent / "templates"),
+    loader=FileSystemLoader(TEMPLATES),
     autoescape=select_autoescape(),
 )
 
 
-@register("md")
+@register(
+    "md",
+    per_form=True,
+    templates=[TEMPLATES / "markdown.j2"],
+    outputs=["{domain}.md"],
+)
 def render_md(forms: Sequence[Form], out_dir: Path):
     tpl = env.get_template("markdown.j2")
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -7,7 +7,7 @@ from ..schema import Form
 from .registry import register
 
 
-@register("odm")
+@register("odm", outputs=["forms.odm.xml"])
 def render_odm(forms: Sequence[Form], out_dir: Path):
     """Render a list of forms to ODM-XML."""
     root = ODM.ODM(
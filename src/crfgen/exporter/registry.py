@@ -1,17 +1,76 @@
+"""
+Exporter registry with lazy plugin discovery.
+
+Exporter names are known up front, mapped to the module that registers them:
+the built-in ones below and third-party ones declared as entry points in the
+``crfgen.exporters`` group (``name = "package.module:function"``). A module is
+only imported when :func:`get` first asks for one of its exporters, so a
+``csv``-only build never loads python-docx, openpyxl, odmlib or Jinja.
+"""
+
+from __future__ import annotations
+
+import importlib
+from importlib.metadata import entry_points
+
+ENTRY_POINT_GROUP = "crfgen.exporters"
+
+BUILTIN = {
+    "csv": "crfgen.exporter.csv",
+    "docx": "crfgen.exporter.docx",
+    "md": "crfgen.exporter.markdown",
+    "odm": "crfgen.exporter.odm",
+    "tex": "crfgen.exporter.latex",
+    "xlsx": "crfgen.exporter.xlsx",
+}
+
 _registry = {}
+_plugins = None
 
 
-def register(name: str):
+def register(name: str, *, per_form: bool = False, templates=(), outputs=()):
+    """Register an exporter under *name*.
+
+    ``per_form`` exporters write one output per domain and may be called with
+    just the forms that changed; ``templates`` are files whose contents are
+    part of the exporter's version for incremental builds. ``outputs`` names
+    the files written into the output directory (``"{domain}.md"`` for
+    per-form exporters) so incremental builds can recreate deleted ones.
+    """
+
     def decorator(fn):
+        fn.per_form = per_form
+        fn.templates = tuple(templates)
+        fn.outputs = tuple(outputs)
         _registry[name] = fn
         return fn
 
     return decorator
 
 
+def _entry_points() -> dict:
+    global _plugins
+    if _plugins is None:
+        _plugins = {ep.name: ep for ep in entry_points(group=ENTRY_POINT_GROUP)}
+    return _plugins
+
+
 def get(name: str):
+    """Exporter *name*, importing its module on first use.
+
+    Raises:
+        KeyError: No exporter of that name is registered or discoverable.
+    """
+    if name not in _registry:
+        if name in BUILTIN:
+            importlib.import_module(BUILTIN[name])
+        elif name in _entry_points():
+            fn = _entry_points()[name].load()
+            if name not in _registry:  # plain function, not decorated
+                register(name)(fn)
     return _registry[name]
 
 
 def formats():
-    return list(_registry.keys())
+    """Names of all known exporters, without importing them."""
+    return list(dict.fromkeys([*BUILTIN, *_entry_points(), *_registry]))
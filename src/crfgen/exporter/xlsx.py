@@ -8,7 +8,7 @@ from crfgen.schema import Form
 from .registry import register
 
 
-@register("xlsx")
+@register("xlsx", outputs=["forms.xlsx"])
 def export_xlsx(forms: Sequence[Form], outdir: Path) -> None:
     path = outdir / "forms.xlsx"
     wb = openpyxl.Workbook()
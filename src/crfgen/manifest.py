@@ -0,0 +1,148 @@
+"""
+Build manifest for incremental exporter runs.
+
+``scripts/build.py`` keeps ``.build-manifest.json`` in the output directory.
+For every format it records the exporter version (a hash of the exporter's
+module and templates) and a content hash per input unit:
+
+* per-form exporters (``md``, ``tex``) write one file per domain, so their
+  units are domains and only domains whose forms changed are re-rendered;
+* aggregate exporters have a single unit covering all forms and are rebuilt
+  only when any form changed.
+
+The files each unit produced are recorded too; a unit whose output has
+been deleted is stale. A new exporter version invalidates every unit of that
+format::
+
+    manifest = BuildManifest.load(outdir)
+    todo = manifest.stale("md", forms, version, per_form=True)
+    render_md([forms[i] for i in todo], outdir)
+    manifest.record("md", forms, version, per_form=True, outputs=["{domain}.md"])
+    manifest.save()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import pathlib
+from typing import Callable, Iterable, Sequence
+
+from crfgen.schema import Form
+
+MANIFEST_NAME = ".build-manifest.json"
+FORMAT_VERSION = 2
+ALL_FORMS = "*"
+
+
+def form_hash(form: Form) -> str:
+    """Stable hash of a form's canonical JSON."""
+    data = json.dumps(
+        form.model_dump(mode="json"), sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def exporter_version(fn: Callable, templates: Iterable[str | pathlib.Path] = ()) -> str:
+    """Hash of the module defining *fn* plus the given template files."""
+    digest = hashlib.sha256()
+    for path in [inspect.getsourcefile(fn), *templates]:
+        digest.update(pathlib.Path(path).read_bytes())
+    return digest.hexdigest()
+
+
+def unit_outputs(
+    forms: Sequence[Form], per_form: bool, outputs: Iterable[str]
+) -> dict[str, list[str]]:
+    """Output file names per unit; per-form names are formatted with ``domain``."""
+    outputs = list(outputs)
+    if not per_form:
+        return {ALL_FORMS: outputs} if forms else {}
+    domains = dict.fromkeys(form.domain for form in forms)
+    return {d: [name.format(domain=d) for name in outputs] for d in domains}
+
+
+def unit_hashes(forms: Sequence[Form], per_form: bool) -> dict[str, str]:
+    """Hash per output unit: per domain, or one for all *forms*."""
+    groups: dict[str, list[str]] = {}
+    for form in forms:
+        groups.setdefault(form.domain if per_form else ALL_FORMS, []).append(
+            form_hash(form)
+        )
+    return {
+        unit: hashlib.sha256("".join(hashes).encode()).hexdigest()
+        for unit, hashes in groups.items()
+    }
+
+
+class BuildManifest:
+    """Per-format exporter versions and unit hashes of the last successful build."""
+
+    def __init__(self, path: str | pathlib.Path, data: dict | None = None):
+        self.path = pathlib.Path(path)
+        self.formats: dict[str, dict] = (data or {}).get("formats", {})
+
+    @classmethod
+    def load(cls, outdir: str | pathlib.Path) -> "BuildManifest":
+        """Read the manifest of *outdir*; a missing or unreadable one is empty."""
+        path = pathlib.Path(outdir) / MANIFEST_NAME
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            data = None
+        if not isinstance(data, dict) or data.get("version") != FORMAT_VERSION:
+            data = None
+        return cls(path, data)
+
+    def _missing(self, entry: dict) -> set[str]:
+        """Units of a format entry with a recorded output file that is gone."""
+        outdir = self.path.parent
+        return {
+            unit
+            for unit, names in entry.get("outputs", {}).items()
+            if not all((outdir / name).exists() for name in names)
+        }
+
+    def stale(
+        self, fmt: str, forms: Sequence[Form], version: str, per_form: bool
+    ) -> list[int]:
+        """Indices of the *forms* to render for *fmt*; empty when up to date."""
+        everything = list(range(len(forms)))
+        entry = self.formats.get(fmt)
+        if entry is None or entry.get("version") != version:
+            return everything
+        current = unit_hashes(forms, per_form)
+        recorded = entry.get("units", {})
+        missing = self._missing(entry)
+        if not per_form:
+            return everything if current != recorded or missing else []
+        changed = {unit for unit, h in current.items() if recorded.get(unit) != h}
+        changed |= missing
+        return [i for i, f in enumerate(forms) if f.domain in changed]
+
+    def record(
+        self,
+        fmt: str,
+        forms: Sequence[Form],
+        version: str,
+        per_form: bool,
+        outputs: Iterable[str] = (),
+    ) -> None:
+        """Note a successful render of *forms* writing *outputs* (file names)."""
+        self.formats[fmt] = {
+            "version": version,
+            "units": unit_hashes(forms, per_form),
+            "outputs": unit_outputs(forms, per_form, outputs),
+        }
+
+    def forget(self, fmt: str) -> None:
+        self.formats.pop(fmt, None)
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        data = {"version": FORMAT_VERSION, "formats": self.formats}
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, indent=2, sort_keys=True))
+        tmp.replace(self.path)
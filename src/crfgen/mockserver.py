@@ -0,0 +1,241 @@
+"""
+Local stand-in for the CDISC Library API.
+
+:class:`MockLibrary` serves recorded payloads (the ``url -> JSON`` mapping used
+by ``tests/fixtures/crawl_fixture.json``) over HTTP on localhost. Paths that
+are not recorded can be synthesised from the examples in the OpenAPI spec.
+Latency, random server errors and throttling are configurable, so crawler
+concurrency, caching and retry behaviour can be measured without network
+access::
+
+    with MockLibrary(fixtures, latency=0.05, rate_limit=20) as server:
+        client = AuthenticatedClient(base_url=server.base_url, token="x")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import pathlib
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+LIBRARY_URL = "https://library.cdisc.org/api"
+
+
+def _resolve(spec: dict, schema: dict) -> dict:
+    while "$ref" in schema:
+        node: Any = spec
+        for part in schema["$ref"].lstrip("#/").split("/"):
+            node = node[part]
+        schema = node
+    return schema
+
+
+def example_from_schema(spec: dict, schema: dict, depth: int = 0) -> Any:
+    """Build a sample document from the ``example`` values of *schema*."""
+    schema = _resolve(spec, schema)
+    if "example" in schema:
+        return schema["example"]
+    kind = schema.get("type", "object" if "properties" in schema else None)
+    if kind == "array":
+        return (
+            [] if depth > 6 else [example_from_schema(spec, schema["items"], depth + 1)]
+        )
+    if kind == "object":
+        if depth > 6:
+            return {}
+        return {
+            name: example_from_schema(spec, sub, depth + 1)
+            for name, sub in schema.get("properties", {}).items()
+        }
+    return {"integer": 0, "number": 0, "boolean": False}.get(kind, "")
+
+
+class OpenApiExamples:
+    """Answer GET requests for any templated path of an OpenAPI document."""
+
+    def __init__(self, spec_path: str | pathlib.Path):
+        self.spec = json.loads(pathlib.Path(spec_path).read_text())
+        self.routes = []
+        for template, item in self.spec["paths"].items():
+            try:
+                schema = item["get"]["responses"]["200"]["content"]["application/json"][
+                    "schema"
+                ]
+            except KeyError:
+                continue
+            pattern = re.sub(r"\\\{\w+\\\}", "[^/]+?", re.escape(template))
+            self.routes.append((re.compile(f"^{pattern}$"), schema))
+        self._examples: dict[int, Any] = {}
+
+    def get(self, path: str) -> Optional[Any]:
+        for pattern, schema in self.routes:
+            if pattern.match(path):
+                key = id(schema)
+                if key not in self._examples:
+                    self._examples[key] = example_from_schema(self.spec, schema)
+                return self._examples[key]
+        return None
+
+
+class MockLibrary:
+    """Threaded HTTP server imitating the CDISC Library API.
+
+    Args:
+        fixtures: ``url or /mdr path -> payload`` mapping of recorded responses.
+        spec: OpenAPI JSON used to synthesise responses for unrecorded paths.
+        latency: Seconds added to every response.
+        jitter: Extra random latency, uniformly drawn from ``[0, jitter)``.
+        error_rate: Fraction of requests answered with ``503``.
+        rate_limit: Requests per second served before answering ``429``.
+        api_key: Reject requests whose ``api-key`` header differs.
+        seed: Seed for the error/jitter random generator.
+        host, port: Bind address; port ``0`` picks a free port.
+    """
+
+    def __init__(
+        self,
+        fixtures: Optional[dict[str, Any]] = None,
+        spec: Optional[str | pathlib.Path] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: Optional[float] = None,
+        api_key: Optional[str] = None,
+        seed: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.fixtures = {
+            self._path(url): body for url, body in (fixtures or {}).items()
+        }
+        self.examples = OpenApiExamples(spec) if spec else None
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.api_key = api_key
+        self.requests: Counter[int] = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = rate_limit or 0.0
+        self._refilled = time.monotonic()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_file(cls, path: str | pathlib.Path, **kwargs: Any) -> "MockLibrary":
+        return cls(json.loads(pathlib.Path(path).read_text()), **kwargs)
+
+    @staticmethod
+    def _path(url: str) -> str:
+        if url.startswith(LIBRARY_URL):
+            url = url[len(LIBRARY_URL) :]
+        return url.rstrip("/") or "/"
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self) -> "MockLibrary":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockLibrary":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def _throttle(self) -> Optional[float]:
+        """Return seconds to wait if the request exceeds the rate limit."""
+        if not self.rate_limit:
+            return None
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.rate_limit, self._tokens + (now - self._refilled) * self.rate_limit
+            )
+            self._refilled = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return None
+            return (1 - self._tokens) / self.rate_limit
+
+    def respond(
+        self, path: str, headers: dict[str, str]
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Compute ``(status, headers, body)`` for a GET of *path*."""
+        with self._lock:
+            delay = self.latency + self._random.random() * self.jitter
+            failed = self._random.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+
+        if self.api_key is not None and headers.get("api-key") != self.api_key:
+            return 401, {}, b'{"message": "Invalid API key"}'
+        wait = self._throttle()
+        if wait is not None:
+            return (
+                429,
+                {"Retry-After": str(math.ceil(wait))},
+                b'{"message": "Too many requests"}',
+            )
+        if failed:
+            return 503, {}, b'{"message": "Service unavailable"}'
+
+        path = path.split("?", 1)[0]
+        if path.startswith("/api/"):
+            path = path[len("/api") :]
+        path = path.rstrip("/") or "/"
+        payload = self.fixtures.get(path)
+        if payload is None and self.examples is not None:
+            payload = self.examples.get(path)
+        if payload is None:
+            return 404, {}, b'{"message": "Not found"}'
+
+        base = self.base_url
+        body = json.dumps(payload).replace(LIBRARY_URL, base).encode()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if headers.get("if-none-match") == etag:
+            return 304, {"ETag": etag}, b""
+        return 200, {"ETag": etag, "Content-Type": "application/json"}, body
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                headers = {k.lower(): v for k, v in self.headers.items()}
+                status, extra, body = server.respond(self.path, headers)
+                with server._lock:
+                    server.requests[status] += 1
+                self.send_response(status)
+                for name, value in extra.items():
+                    self.send_header(name, value)
+                if status != 304:
+                    self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
@@ -0,0 +1,151 @@
+"""
+Concurrent pagination over ``start``/``pageSize`` endpoints.
+
+:class:`Paginator` walks every page of an endpoint such as ``/mdr/search``
+while keeping up to *prefetch* page requests in flight, and yields items in
+page order as soon as their page arrives. Iteration can stop at any point;
+outstanding requests are then cancelled::
+
+    hits = Paginator(RawEndpoint(get_mdr_search), client, q="AE", prefetch=4)
+    for hit in hits:  # or: async for hit in hits
+        ...
+
+The first page is fetched on its own; if it reports a total, exactly the
+remaining pages are requested, otherwise pages are requested speculatively
+until one comes back short.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
+from cdisc_library_client.client import AuthenticatedClient
+
+
+def search_hits(page: Any) -> list:
+    return page["hits"]
+
+
+def total_hits(page: Any) -> Optional[int]:
+    total = page.get("totalHits")
+    return None if total is None else int(total)
+
+
+class Paginator:
+    """Iterate the items of every page of *endpoint*, sync or async.
+
+    Args:
+        endpoint: Object with ``sync``/``asyncio`` accepting ``start`` and
+            ``page_size`` (a generated module or a :class:`~crfgen.raw.RawEndpoint`).
+        client: Client passed to every call.
+        page_size: Items requested per page.
+        prefetch: Maximum page requests in flight.
+        items: Extracts the item list from a page.
+        total: Extracts the total item count from a page, or returns None.
+        **params: Further endpoint arguments, e.g. search filters.
+    """
+
+    def __init__(
+        self,
+        endpoint: Any,
+        client: AuthenticatedClient,
+        page_size: int = 100,
+        prefetch: int = 4,
+        items: Callable[[Any], list] = search_hits,
+        total: Callable[[Any], Optional[int]] = total_hits,
+        **params: Any,
+    ):
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+        self.endpoint = endpoint
+        self.client = client
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self.items = items
+        self.total = total
+        self.params = params
+        self.pages = 0
+
+    def _kwargs(self, start: int) -> dict[str, Any]:
+        return dict(
+            self.params, client=self.client, start=start, page_size=self.page_size
+        )
+
+    def _items(self, page: Any) -> list:
+        self.pages += 1
+        try:
+            return self.items(page)
+        except (KeyError, TypeError) as e:
+            raise RuntimeError(f"Unexpected page: {page!r}") from e
+
+    def _starts(self, first: Any) -> Iterator[int]:
+        """Offsets of the pages after the first one."""
+        total = self.total(first)
+        start = self.page_size
+        while total is None or start < total:
+            yield start
+            start += self.page_size
+
+    def __iter__(self) -> Iterator[Any]:
+        first = self.endpoint.sync(**self._kwargs(0))
+        items = self._items(first)
+        yield from items
+        if len(items) < self.page_size and self.total(first) is None:
+            return
+        starts = self._starts(first)
+        pool = ThreadPoolExecutor(self.prefetch)
+        pending: deque = deque()
+        try:
+            while True:
+                for start in starts:
+                    pending.append(
+                        pool.submit(self.endpoint.sync, **self._kwargs(start))
+                    )
+                    if len(pending) >= self.prefetch:
+                        break
+                if not pending:
+                    return
+                items = self._items(pending.popleft().result())
+                yield from items
+                if len(items) < self.page_size:
+                    return
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _aiter(self) -> AsyncIterator[Any]:
+        first = await self.endpoint.asyncio(**self._kwargs(0))
+        items = self._items(first)
+        for item in items:
+            yield item
+        if len(items) < self.page_size and self.total(first) is None:
+            return
+        starts = self._starts(first)
+        pending: deque[asyncio.Task] = deque()
+        try:
+            while True:
+                for start in starts:
+                    pending.append(
+                        asyncio.ensure_future(
+                            self.endpoint.asyncio(**self._kwargs(start))
+                        )
+                    )
+                    if len(pending) >= self.prefetch:
+                        break
+                if not pending:
+                    return
+                items = self._items(await pending.popleft())
+                for item in items:
+                    yield item
+                if len(items) < self.page_size:
+                    return
+        finally:
+            # The consumer may stop early; do not leave prefetches running.
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._aiter()
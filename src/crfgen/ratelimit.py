@@ -0,0 +1,282 @@
+"""
+Adaptive client-side rate limiting for CDISC Library requests.
+
+One :class:`AdaptiveRateLimiter` is shared by the sync and async clients of a
+crawl. It paces requests with a token bucket whose rate follows AIMD
+(additive increase on success, multiplicative decrease on ``429``/``503``) and
+pauses all callers for the duration of a ``Retry-After`` header. The
+transports below wrap any httpx transport and retry throttled requests::
+
+    limiter = AdaptiveRateLimiter(rate=10)
+    transport = RateLimitTransport(httpx.HTTPTransport(retries=5), limiter)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+THROTTLE_STATUSES = {429, 503}
+
+
+@dataclass
+class RateLimiterStats:
+    rate: float
+    queue_depth: int
+    in_flight: int
+    throttled: int
+    retries: int
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[float] = None
+) -> Optional[float]:
+    """Return the delay in seconds encoded in a ``Retry-After`` header."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = time.time() if now is None else now
+    return max(0.0, when.timestamp() - now)
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose refill rate adapts to server throttling.
+
+    Args:
+        rate: Initial requests per second.
+        burst: Requests that may be sent back to back before pacing starts.
+        min_rate: Lower bound for the adapted rate.
+        max_rate: Upper bound for the adapted rate.
+        increase: Requests/second added after each successful response.
+        decrease: Factor applied to the rate after a throttled response.
+        max_retries: Throttled attempts retried by the transports.
+        backoff: Base delay (seconds) when the server sends no ``Retry-After``.
+        max_backoff: Cap for the exponential backoff delay.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 1,
+        min_rate: float = 0.5,
+        max_rate: float = 50.0,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        max_retries: int = 5,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._tat = 0.0  # theoretical arrival time of the next request
+        self._blocked_until = 0.0
+        self._epoch = 0  # bumped by every rate decrease
+        self._waiting = 0
+        self._in_flight = 0
+        self._throttled = 0
+        self._retries = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return self._waiting
+
+    def stats(self) -> RateLimiterStats:
+        with self._lock:
+            return RateLimiterStats(
+                rate=self.rate,
+                queue_depth=self._waiting,
+                in_flight=self._in_flight,
+                throttled=self._throttled,
+                retries=self._retries,
+            )
+
+    def _book(self, now: float) -> float:
+        """Book the next send slot at the current rate; the lock must be held."""
+        interval = 1.0 / self.rate
+        tat = max(self._tat, now)
+        slot = max(now, tat - (self.burst - 1) * interval, self._blocked_until)
+        self._tat = max(tat, slot) + interval
+        return slot
+
+    def _reserve(self) -> tuple[float, int]:
+        """Queue the caller and return its send slot and the current epoch."""
+        with self._lock:
+            self._waiting += 1
+            return self._book(time.monotonic()), self._epoch
+
+    def _start(self, slot: float, epoch: int) -> Optional[tuple[float, int]]:
+        """Start the request booked for *slot* in *epoch*, or book a new slot.
+
+        A throttle after booking may have pushed ``_blocked_until`` past the
+        slot or lowered the rate it was booked at; such callers queue again
+        instead of sending inside the ``Retry-After`` window.
+        """
+        with self._lock:
+            if epoch != self._epoch or slot < self._blocked_until:
+                return self._book(time.monotonic()), self._epoch
+            self._waiting -= 1
+            self._in_flight += 1
+            return None
+
+    def _cancel(self) -> None:
+        with self._lock:
+            self._waiting -= 1
+
+    def acquire(self) -> int:
+        """Block until the calling thread may send a request.
+
+        Returns the epoch to pass to :meth:`on_response` for that request.
+        """
+        slot, epoch = self._reserve()
+        try:
+            while True:
+                time.sleep(max(0.0, slot - time.monotonic()))
+                booked = self._start(slot, epoch)
+                if booked is None:
+                    return epoch
+                slot, epoch = booked
+        except BaseException:
+            self._cancel()
+            raise
+
+    async def acquire_async(self) -> int:
+        """Wait until the calling task may send a request; see :meth:`acquire`."""
+        slot, epoch = self._reserve()
+        try:
+            while True:
+                await asyncio.sleep(max(0.0, slot - time.monotonic()))
+                booked = self._start(slot, epoch)
+                if booked is None:
+                    return epoch
+                slot, epoch = booked
+        except BaseException:
+            self._cancel()
+            raise
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(
+        self, retry_after: Optional[float], attempt: int, epoch: Optional[int] = None
+    ) -> None:
+        """Back off after a throttled response to the *attempt*-th try.
+
+        The rate is decreased at most once per congestion window: throttles
+        of requests sent before the last decrease (an older *epoch*) only
+        extend the ``Retry-After`` pause.
+        """
+        if retry_after is None:
+            retry_after = min(self.max_backoff, self.backoff * 2**attempt)
+            retry_after *= 0.5 + random.random() / 2
+        with self._lock:
+            self._in_flight -= 1
+            self._throttled += 1
+            self._blocked_until = max(
+                self._blocked_until, time.monotonic() + retry_after
+            )
+            if epoch is None or epoch == self._epoch:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                # Queued callers re-book at the new rate once they wake up.
+                self._epoch += 1
+                self._tat = self._blocked_until
+            else:
+                self._tat = max(self._tat, self._blocked_until)
+
+    def on_error(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def on_response(
+        self, response: httpx.Response, attempt: int, epoch: Optional[int] = None
+    ) -> bool:
+        """Record the outcome of *response*; return True if it should be retried.
+
+        *epoch* is the value :meth:`acquire` returned for the request.
+        """
+        if response.status_code not in THROTTLE_STATUSES:
+            self.on_success()
+            return False
+        if attempt >= self.max_retries:
+            self.on_error()
+            return False
+        self.on_throttle(
+            parse_retry_after(response.headers.get("retry-after")), attempt, epoch
+        )
+        with self._lock:
+            self._retries += 1
+        return True
+
+
+class RateLimitTransport(httpx.BaseTransport):
+    """Synchronous httpx transport paced by an :class:`AdaptiveRateLimiter`."""
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: AdaptiveRateLimiter):
+        self.transport = transport
+        self.limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            epoch = self.limiter.acquire()
+            try:
+                response = self.transport.handle_request(request)
+            except BaseException:
+                self.limiter.on_error()
+                raise
+            if not self.limiter.on_response(response, attempt, epoch):
+                return response
+            response.close()
+            attempt += 1
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRateLimitTransport(httpx.AsyncBaseTransport):
+    """Asynchronous counterpart of :class:`RateLimitTransport`."""
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, limiter: AdaptiveRateLimiter
+    ):
+        self.transport = transport
+        self.limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            epoch = await self.limiter.acquire_async()
+            try:
+                response = await self.transport.handle_async_request(request)
+            except BaseException:
+                self.limiter.on_error()
+                raise
+            if not self.limiter.on_response(response, attempt, epoch):
+                return response
+            await response.aclose()
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
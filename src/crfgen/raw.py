@@ -0,0 +1,95 @@
+"""
+Raw-JSON access to the generated CDISC Library endpoints.
+
+Every generated endpoint module funnels responses through ``_parse_response``,
+which materialises nested attrs models via ``Model.from_dict``. Bulk crawls
+only need the decoded JSON, so :class:`RawEndpoint` reuses the module's
+``_get_kwargs`` and skips the model layer::
+
+    ig = RawEndpoint(get_mdr_cdashig_version).sync(client=client, version="2-3")
+    ig["_links"]["domains"]
+
+``orjson`` is used for decoding when it is installed.
+"""
+
+from __future__ import annotations
+
+import json
+from http import HTTPStatus
+from types import ModuleType
+from typing import Any, Optional, Union
+
+import httpx
+
+from cdisc_library_client import errors
+from cdisc_library_client.client import AuthenticatedClient, Client
+from cdisc_library_client.types import Response
+
+try:
+    import orjson
+
+    loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speed-up
+    loads = json.loads
+
+AnyClient = Union[AuthenticatedClient, Client]
+
+
+def _build_response(*, client: AnyClient, response: httpx.Response) -> Response[Any]:
+    parsed: Optional[Any] = None
+    if response.content:
+        try:
+            parsed = loads(response.content)
+        except ValueError:
+            if response.status_code == 200 or client.raise_on_unexpected_status:
+                raise errors.UnexpectedStatus(response.status_code, response.content)
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=parsed,
+    )
+
+
+def _ok(response: Response[Any]) -> Optional[Any]:
+    """Decoded body of a successful *response*; raise for any other status."""
+    if not 200 <= response.status_code < 300:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    return response.parsed
+
+
+class RawEndpoint:
+    """Drop-in replacement for a generated endpoint module returning plain JSON.
+
+    ``sync`` and ``asyncio`` raise
+    :class:`~cdisc_library_client.errors.UnexpectedStatus` for non-2xx
+    responses, so a 404 or an exhausted 429 never passes for content. The ``*_detailed`` variants return every response; their
+    ``parsed`` holds the decoded body, i.e. the Library's error dict instead
+    of a ``DefaultErrorResponse``.
+    """
+
+    def __init__(self, module: ModuleType):
+        self.module = module
+
+    def __repr__(self) -> str:
+        return f"RawEndpoint({self.module.__name__})"
+
+    def sync_detailed(self, *, client: AnyClient, **kwargs: Any) -> Response[Any]:
+        response = client.get_httpx_client().request(
+            **self.module._get_kwargs(**kwargs)
+        )
+        return _build_response(client=client, response=response)
+
+    def sync(self, *, client: AnyClient, **kwargs: Any) -> Optional[Any]:
+        return _ok(self.sync_detailed(client=client, **kwargs))
+
+    async def asyncio_detailed(
+        self, *, client: AnyClient, **kwargs: Any
+    ) -> Response[Any]:
+        response = await client.get_async_httpx_client().request(
+            **self.module._get_kwargs(**kwargs)
+        )
+        return _build_response(client=client, response=response)
+
+    async def asyncio(self, *, client: AnyClient, **kwargs: Any) -> Optional[Any]:
+        return _ok(await self.asyncio_detailed(client=client, **kwargs))
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 import pathlib
-from typing import Iterable, Literal, Optional
+from typing import Iterable, Iterator, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 from pydantic.config import ConfigDict
@@ -67,3 +67,23 @@ def dump_forms(forms: Iterable[Form], path: str | pathlib.Path):
 def load_forms(path: str | pathlib.Path) -> list[Form]:
     raw = json.loads(pathlib.Path(path).read_text())
     return [Form(**d) for d in raw]
+
+
+def dump_forms_ndjson(forms: Iterable[Form], path: str | pathlib.Path) -> int:
+    """Write *forms* one JSON object per line as they arrive; return the count."""
+    count = 0
+    with pathlib.Path(path).open("w") as fh:
+        for f in forms:
+            fh.write(f.model_dump_json())
+            fh.write("\n")
+            fh.flush()
+            count += 1
+    return count
+
+
+def iter_forms_ndjson(path: str | pathlib.Path) -> Iterator[Form]:
+    """Read forms written by :func:`dump_forms_ndjson` one at a time."""
+    with pathlib.Path(path).open() as fh:
+        for line in fh:
+            if line.strip():
+                yield Form.model_validate_json(line)
@@ -0,0 +1,229 @@
+"""
+Search-driven bulk harvest of a CDASH IG version.
+
+The link-following harvest issues one request per domain and per scenario.
+``/mdr/search`` can instead return every *Data Collection Field* of an IG
+version in a handful of pages, each hit carrying its href and the field
+metadata. :class:`SearchHarvester` fetches those pages concurrently, groups
+the hits into one :class:`~crfgen.schema.Form` per domain and scenario, and
+only falls back to link traversal for gaps: IG domains and scenarios without
+any hit, and hits too sparse to build a field from::
+
+    harvester = SearchHarvester(client, prefetch=4)
+    forms = asyncio.run(harvester.harvest("2-3"))
+    harvester.stats.requests
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from cdisc_library_client.api.searches import get_mdr_search
+from cdisc_library_client.client import AuthenticatedClient
+from crfgen.paginate import Paginator
+from crfgen.raw import RawEndpoint, loads
+from crfgen.schema import Codelist, FieldDef, Form
+from crfgen.traverse import last_segment, normalize_href
+
+get_mdr_search = RawEndpoint(get_mdr_search)
+
+# Search result type of CDASHIG domain and scenario fields
+FIELD_TYPE = "Data Collection Field"
+# CDASHIG simpleDatatype -> FieldDef.datatype
+DATATYPES = {"char": "text", "num": "float"}
+
+FIELD_HREF = re.compile(
+    r"^/mdr/cdashig/(?P<version>[^/]+)/(?P<kind>domains|scenarios)/"
+    r"(?P<parent>[^/]+)/fields/(?P<field>[^/]+)$"
+)
+NCI_CODE = re.compile(r"C\d+$")
+
+
+def parse_field_href(href: str) -> Optional[tuple[str, str, Optional[str], str]]:
+    """Split a CDASHIG field href into ``(version, domain, scenario, field)``."""
+    match = FIELD_HREF.match(normalize_href(href))
+    if match is None:
+        return None
+    domain, scenario = match["parent"], None
+    if match["kind"] == "scenarios":
+        domain, _, scenario = domain.partition(".")
+    return match["version"], domain, scenario, match["field"]
+
+
+def field_from_payload(data: dict[str, Any]) -> Optional[FieldDef]:
+    """Build a FieldDef from a search hit or a field resource.
+
+    Returns ``None`` when *data* lacks the prompt or datatype, so the caller
+    can fetch the full field resource instead.
+    """
+    name = data.get("name")
+    prompt = data.get("prompt") or data.get("questionText")
+    datatype = data.get("simpleDatatype")
+    if not (name and prompt and datatype):
+        return None
+    codelist = None
+    refs = (data.get("_links") or {}).get("codelist") or []
+    href = refs[0]["href"] if refs else data.get("codelist")
+    if href and NCI_CODE.search(href):
+        codelist = Codelist(
+            nci_code=NCI_CODE.search(href)[0], href=normalize_href(href)
+        )
+    return FieldDef(
+        oid=name,
+        prompt=prompt,
+        datatype=DATATYPES.get(datatype.lower(), datatype),
+        cdash_var=name,
+        codelist=codelist,
+    )
+
+
+class _Limited:
+    """Endpoint whose async calls each hold *limit* while in flight."""
+
+    def __init__(self, endpoint: RawEndpoint, limit: asyncio.Semaphore):
+        self.endpoint = endpoint
+        self.limit = limit
+
+    async def asyncio(self, **kwargs: Any) -> Any:
+        async with self.limit:
+            return await self.endpoint.asyncio(**kwargs)
+
+
+@dataclass
+class SearchStats:
+    requests: int = 0
+    pages: int = 0
+    hits: int = 0
+    gaps: int = 0
+
+
+class SearchHarvester:
+    """Assemble CDASH IG forms from paginated ``/mdr/search`` results.
+
+    Args:
+        client: Client whose async httpx client performs the requests.
+        prefetch: Maximum requests in flight.
+        page_size: Search hits requested per page.
+        query: Search expression; the filters do the actual selection.
+    """
+
+    def __init__(
+        self,
+        client: AuthenticatedClient,
+        prefetch: int = 4,
+        page_size: int = 100,
+        query: str = "*",
+    ):
+        self.client = client
+        self.page_size = page_size
+        self.query = query
+        self.prefetch = prefetch
+        self.stats = SearchStats()
+        self._limit = asyncio.Semaphore(prefetch)
+
+    async def _get(self, href: str) -> Any:
+        async with self._limit:
+            response = await self.client.get_async_httpx_client().get(
+                normalize_href(href)
+            )
+        self.stats.requests += 1
+        response.raise_for_status()
+        return loads(response.content)
+
+    async def search(self, **filters: Any) -> list[dict]:
+        """Return all hits for *filters*; later pages are prefetched concurrently."""
+        # Prefetched pages share the limit with every other request.
+        pages = Paginator(
+            _Limited(get_mdr_search, self._limit),
+            self.client,
+            page_size=self.page_size,
+            prefetch=self.prefetch,
+            q=self.query,
+            **filters,
+        )
+        hits = [hit async for hit in pages]
+        self.stats.requests += pages.pages
+        self.stats.pages += pages.pages
+        self.stats.hits += len(hits)
+        return hits
+
+    async def _fields_of(self, parent_href: str) -> list[FieldDef]:
+        listing = await self._get(parent_href.rstrip("/") + "/fields")
+        refs = (listing.get("_links") or {}).get("fields") or []
+        payloads = await asyncio.gather(*(self._get(ref["href"]) for ref in refs))
+        return [f for f in map(field_from_payload, payloads) if f is not None]
+
+    async def harvest(self, version: str) -> list[Form]:
+        """Forms for every domain and scenario of CDASH IG *version*.
+
+        Domains follow the order of the IG's ``domains`` links and are titled
+        with their link titles; scenarios follow their domain in name order.
+        Fields keep the ``ordinal`` order of the hits, falling back to the
+        order they were returned in. Linked domains and scenarios listed
+        under ``/scenarios`` without any hit are filled from their
+        ``/fields`` listing. Hits of domains the IG does not link are
+        dropped, as the link-following harvest never reaches them.
+        """
+        ig, listing, hits = await asyncio.gather(
+            self._get(f"/mdr/cdashig/{version}"),
+            self._get(f"/mdr/cdashig/{version}/scenarios"),
+            self.search(product="cdashig", version=version, type_=FIELD_TYPE),
+        )
+
+        groups: dict[tuple[str, Optional[str]], list[tuple[float, int, dict]]] = {}
+        for seq, hit in enumerate(hits):
+            key = parse_field_href(hit.get("href", ""))
+            if key is None or key[0] != version:
+                continue
+            ordinal = float(hit.get("ordinal") or seq)
+            groups.setdefault(key[1:3], []).append((ordinal, seq, hit))
+
+        async def resolve(hit: dict) -> Optional[FieldDef]:
+            field = field_from_payload(hit)
+            if field is None:
+                self.stats.gaps += 1
+                field = field_from_payload(await self._get(hit["href"]))
+            return field
+
+        async def build(key: tuple[str, Optional[str]]) -> list[FieldDef]:
+            ordered = [hit for _, _, hit in sorted(groups[key], key=lambda t: t[:2])]
+            fields = await asyncio.gather(*(resolve(hit) for hit in ordered))
+            return [f for f in fields if f is not None]
+
+        titles: dict[str, str] = {}
+        hrefs: dict[tuple[str, Optional[str]], str] = {}
+        for link in (ig.get("_links") or {}).get("domains") or []:
+            domain = last_segment(link)
+            titles[domain] = link.get("title") or domain
+            hrefs[domain, None] = link["href"]
+        for link in (listing.get("_links") or {}).get("scenarios") or []:
+            domain, _, scenario = last_segment(link).partition(".")
+            if domain in titles:
+                hrefs[domain, scenario] = link["href"]
+
+        keys: list[tuple[str, Optional[str]]] = []
+        for domain in titles:
+            keys.append((domain, None))
+            keys += sorted(
+                k for k in {*groups, *hrefs} if k[0] == domain and k[1] is not None
+            )
+
+        self.stats.gaps += sum(key not in groups for key in keys)
+        resolved = await asyncio.gather(
+            *(
+                build(key) if key in groups else self._fields_of(hrefs[key])
+                for key in keys
+            )
+        )
+        return [
+            Form(
+                title=titles[domain] if scenario is None else f"{domain}.{scenario}",
+                domain=domain,
+                scenario=scenario,
+                fields=fields,
+            )
+            for (domain, scenario), fields in zip(keys, resolved)
+        ]
@@ -0,0 +1,198 @@
+"""
+Generic HATEOAS crawler for the CDISC Library.
+
+Every Library resource advertises related resources under ``_links`` (and in
+the ``_links`` of nested objects such as fields or codelist references).
+:class:`LinkCrawler` follows those ``href`` values from one or more roots with
+a deduplicating priority frontier, so resources shared between products
+(parent product, prior versions, codelist refs, ...) are fetched once per run.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from cdisc_library_client.client import AuthenticatedClient, Client
+
+# Product-group listings that link to every version of a standard family
+ROOTS = {
+    "cdash": "/mdr/products/DataCollection",
+    "cdashig": "/mdr/products/DataCollection",
+    "sdtm": "/mdr/products/DataTabulation",
+    "sdtmig": "/mdr/products/DataTabulation",
+    "sendig": "/mdr/products/DataTabulation",
+    "adam": "/mdr/products/DataAnalysis",
+    "ct": "/mdr/products/Terminology",
+    "qrs": "/mdr/products/Measures",
+}
+
+Priority = Callable[[str, str, int], float]
+
+
+def iter_links(payload: Any) -> Iterator[tuple[str, str]]:
+    """Yield ``(rel, href)`` for every link found anywhere in *payload*."""
+    if isinstance(payload, dict):
+        for key, value in payload.items():
+            if key == "_links" and isinstance(value, dict):
+                for rel, refs in value.items():
+                    for ref in refs if isinstance(refs, list) else [refs]:
+                        if isinstance(ref, dict) and ref.get("href"):
+                            yield rel, ref["href"]
+            else:
+                yield from iter_links(value)
+    elif isinstance(payload, list):
+        for item in payload:
+            yield from iter_links(item)
+
+
+def normalize_href(href: str) -> str:
+    """Reduce *href* to the API-relative path used as the frontier key."""
+    parts = urlsplit(href)
+    path = parts.path
+    if path.startswith("/api/"):
+        path = path[len("/api") :]
+    path = path.rstrip("/") or "/"
+    return f"{path}?{parts.query}" if parts.query else path
+
+
+def last_segment(link: dict) -> str:
+    """``/mdr/cdashig/2-3/domains/VS`` -> ``VS``; link titles are display names."""
+    return normalize_href(link["href"]).rsplit("/", 1)[-1]
+
+
+def by_depth(rel: str, href: str, depth: int) -> float:
+    """Default priority: breadth-first."""
+    return depth
+
+
+@dataclass(order=True)
+class _Task:
+    priority: float
+    seq: int
+    href: str = field(compare=False)
+    depth: int = field(compare=False)
+
+
+@dataclass
+class CrawlStats:
+    fetched: int = 0
+    duplicates: int = 0
+    filtered: int = 0
+    errors: dict[str, int] = field(default_factory=dict)
+
+
+class LinkCrawler:
+    """Follow ``_links.*.href`` values breadth-first (or by custom priority).
+
+    Args:
+        client: Client whose httpx session performs the requests.
+        prefixes: Only follow hrefs starting with one of these paths.
+        max_depth: Do not follow links further than this from a root.
+        rels: Only follow these link relations (all of them if ``None``).
+        skip_rels: Link relations never followed.
+        priority: ``f(rel, href, depth)``; lower values are fetched first.
+    """
+
+    def __init__(
+        self,
+        client: AuthenticatedClient | Client,
+        prefixes: Iterable[str] = (),
+        max_depth: Optional[int] = None,
+        rels: Optional[Iterable[str]] = None,
+        skip_rels: Iterable[str] = ("self",),
+        priority: Priority = by_depth,
+    ):
+        self.client = client
+        self.prefixes = tuple(normalize_href(p) for p in prefixes)
+        self.max_depth = max_depth
+        self.rels = set(rels) if rels is not None else None
+        self.skip_rels = set(skip_rels)
+        self.priority = priority
+        self.stats = CrawlStats()
+        self._seen: set[str] = set()
+        self._frontier: list[_Task] = []
+        self._seq = itertools.count()
+
+    def _push(self, rel: str, href: str, depth: int, root: bool = False) -> None:
+        href = normalize_href(href)
+        if not root:
+            if rel in self.skip_rels or (
+                self.rels is not None and rel not in self.rels
+            ):
+                return
+            if self.max_depth is not None and depth > self.max_depth:
+                self.stats.filtered += 1
+                return
+            if self.prefixes and not href.startswith(self.prefixes):
+                self.stats.filtered += 1
+                return
+        if href in self._seen:
+            self.stats.duplicates += 1
+            return
+        self._seen.add(href)
+        heapq.heappush(
+            self._frontier,
+            _Task(self.priority(rel, href, depth), next(self._seq), href, depth),
+        )
+
+    def _seed(self, roots: Iterable[str]) -> None:
+        for root in roots:
+            self._push("root", ROOTS.get(root, root), 0, root=True)
+
+    def _accept(self, task: _Task, response: httpx.Response) -> Optional[Any]:
+        if response.status_code != 200:
+            self.stats.errors[task.href] = response.status_code
+            return None
+        payload = response.json()
+        self.stats.fetched += 1
+        for rel, href in iter_links(payload):
+            self._push(rel, href, task.depth + 1)
+        return payload
+
+    def crawl(self, *roots: str) -> Iterator[tuple[str, Any]]:
+        """Fetch every reachable resource once, yielding ``(href, payload)``.
+
+        *roots* are hrefs or keys of :data:`ROOTS` (``"cdashig"``, ``"ct"``...).
+        """
+        self._seed(roots)
+        http = self.client.get_httpx_client()
+        while self._frontier:
+            task = heapq.heappop(self._frontier)
+            payload = self._accept(task, http.get(task.href))
+            if payload is not None:
+                yield task.href, payload
+
+    async def crawl_async(self, *roots: str, concurrency: int = 8) -> dict[str, Any]:
+        """Concurrent :meth:`crawl`; returns payloads keyed by href."""
+        self._seed(roots)
+        http = self.client.get_async_httpx_client()
+        results: dict[str, Any] = {}
+        pending: set[asyncio.Task] = set()
+
+        async def fetch(task: _Task):
+            return task, await http.get(task.href)
+
+        try:
+            while self._frontier or pending:
+                while self._frontier and len(pending) < concurrency:
+                    task = heapq.heappop(self._frontier)
+                    pending.add(asyncio.create_task(fetch(task)))
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for finished in done:
+                    task, response = finished.result()
+                    payload = self._accept(task, response)
+                    if payload is not None:
+                        results[task.href] = payload
+        finally:
+            for straggler in pending:
+                straggler.cancel()
+        return results
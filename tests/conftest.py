@@ -0,0 +1,133 @@
+import asyncio
+import copy
+import random
+from unittest.mock import patch
+
+import pytest
+
+import crfgen.crfgen
+from crfgen.mockserver import LIBRARY_URL
+from crfgen.raw import RawEndpoint
+
+DOMAINS = {"AE": [], "VS": ["Generic", "Horizontal"]}
+
+
+def _field(name, prompt, datatype, ordinal):
+    return {
+        "ordinal": str(ordinal),
+        "name": name,
+        "prompt": prompt,
+        "simpleDatatype": datatype,
+    }
+
+
+def _library() -> dict[str, dict]:
+    """Small CDASHIG tree keyed by API path, with absolute hrefs like the Library."""
+    library = {
+        "/mdr/products/DataCollection": {
+            "_links": {
+                "cdashig": [
+                    {"href": f"{LIBRARY_URL}/mdr/cdashig/{v}", "title": f"CDASHIG {v}"}
+                    for v in ("2-2", "2-3")
+                ]
+            }
+        }
+    }
+    for version in ("2-2", "2-3"):
+        base = f"/mdr/cdashig/{version}"
+        library[base] = {
+            "_links": {
+                "domains": [
+                    {
+                        "href": f"{LIBRARY_URL}{base}/domains/{d}",
+                        "title": f"{d} {version}",
+                    }
+                    for d in DOMAINS
+                ]
+            }
+        }
+        for domain, scenarios in DOMAINS.items():
+            library[f"{base}/domains/{domain}"] = {
+                "name": domain,
+                "label": f"{domain} label",
+                "fields": [
+                    _field(f"{domain}DAT", "Date", "Char", 1),
+                    _field(f"{domain}SEQ", "Sequence", "Num", 2),
+                ],
+                "_links": {
+                    "scenarios": [
+                        {
+                            "href": f"{LIBRARY_URL}{base}/scenarios/{domain}.{s}",
+                            "title": f"{domain} - {s}",
+                        }
+                        for s in scenarios
+                    ]
+                },
+            }
+            for scenario in scenarios:
+                library[f"{base}/scenarios/{domain}.{scenario}"] = {
+                    "domain": domain,
+                    "scenario": f"{domain} - {scenario}",
+                    "fields": [_field(f"{domain}ORRES", "Result", "Char", 1)],
+                }
+    return library
+
+
+LIBRARY = _library()
+
+
+class FakeEndpoint:
+    """Serve :data:`LIBRARY` through a generated endpoint's ``_get_kwargs``.
+
+    The real SDK module builds the URL, so keyword mismatches surface as they
+    would against the Library. *fail* is a URL predicate raising
+    ``ConnectionError``.
+    """
+
+    def __init__(self, endpoint: RawEndpoint, calls: list, stats: dict, fail=None):
+        self.endpoint = endpoint
+        self.calls = calls
+        self.stats = stats
+        self.fail = fail
+
+    def sync(self, *, client, **kwargs):
+        self.calls.append(kwargs)
+        url = self.endpoint.module._get_kwargs(**kwargs)["url"]
+        if self.fail is not None and self.fail(url):
+            raise ConnectionError("network down")
+        return copy.deepcopy(LIBRARY[url])
+
+    async def asyncio(self, *, client, **kwargs):
+        self.stats["in_flight"] += 1
+        self.stats["peak"] = max(self.stats["peak"], self.stats["in_flight"])
+        await asyncio.sleep(random.random() / 100)
+        self.stats["in_flight"] -= 1
+        return self.sync(client=client, **kwargs)
+
+
+@pytest.fixture
+def fake_library():
+    """Patch the endpoints of :mod:`crfgen.crfgen` to serve :data:`LIBRARY`.
+
+    Returns a function taking an optional *fail* predicate; the recorded
+    call kwargs and the async concurrency stats are on its attributes.
+    """
+    patches = []
+
+    def install(fail=None):
+        for p in patches:
+            p.stop()
+        patches.clear()
+        fakes = {
+            name: FakeEndpoint(value, install.calls, install.stats, fail)
+            for name, value in vars(crfgen.crfgen).items()
+            if isinstance(value, RawEndpoint)
+        }
+        patches.append(patch.multiple("crfgen.crfgen", **fakes))
+        patches[-1].start()
+
+    install.calls = []
+    install.stats = {"in_flight": 0, "peak": 0}
+    yield install
+    for p in patches:
+        p.stop()
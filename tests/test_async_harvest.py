@@ -0,0 +1,47 @@
+from conftest import LIBRARY
+
+from crfgen.crfgen import CrfGen
+from crfgen.mockserver import MockLibrary
+
+
+def test_async_harvest_matches_sync_order(fake_library):
+    fake_library()
+    gen = CrfGen("token")
+    expected = gen.harvest()
+    got = gen.async_harvest(concurrency=3)
+
+    assert got == expected
+    assert [f.title for f in got[:3]] == ["AE 2-2", "VS 2-2", "VS.Generic"]
+    assert len(got) == 8
+    assert 1 < fake_library.stats["peak"] <= 3
+
+
+def test_async_harvest_respects_ig_filter(fake_library):
+    fake_library()
+    got = CrfGen("token", ig_filter="2-3").async_harvest()
+
+    assert [f.title for f in got] == ["AE 2-3", "VS 2-3", "VS.Generic", "VS.Horizontal"]
+
+
+def test_iter_harvest_is_lazy(fake_library):
+    fake_library()
+    forms = CrfGen("token").iter_harvest()
+    assert next(forms).title == "AE 2-2"
+    # products, IG version and one domain; no scenarios fetched yet
+    assert len(fake_library.calls) == 3
+
+
+def test_harvest_against_mock_library():
+    with MockLibrary(LIBRARY) as server:
+        gen = CrfGen("token", ig_filter="2-3", base_url=server.base_url)
+        forms = gen.harvest()
+        assert gen.async_harvest(concurrency=4) == forms
+
+    vs, generic = forms[1], forms[2]
+    assert (vs.title, vs.domain, vs.scenario) == ("VS 2-3", "VS", None)
+    assert (generic.domain, generic.scenario) == ("VS", "Generic")
+    assert [(f.oid, f.prompt, f.datatype) for f in vs.fields] == [
+        ("VSDAT", "Date", "text"),
+        ("VSSEQ", "Sequence", "float"),
+    ]
+    assert generic.field_oids() == ["VSORRES"]
@@ -1,9 +1,12 @@
 import pathlib
 import subprocess
 import sys
+from importlib.metadata import EntryPoint
 
 import pytest
 
+from crfgen.exporter import registry
+
 
 @pytest.mark.parametrize("fmt", [["md"], ["csv"], ["md", "csv"]])
 def test_build_cli(tmp_path: pathlib.Path, fmt):
@@ -27,3 +30,85 @@ def test_build_cli(tmp_path: pathlib.Path, fmt):
             assert (tmp_path / "forms.csv").exists()
         elif f == "tex":
             assert any(tmp_path.glob("*.tex"))
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_build_cli_isolates_failures(tmp_path: pathlib.Path, jobs):
+    (tmp_path / "forms.csv").mkdir()  # csv exporter cannot open its output
+    cmd = [
+        sys.executable,
+        "scripts/build.py",
+        "--source",
+        "tests/.data/sample_crf.json",
+        "--outdir",
+        str(tmp_path),
+        "--jobs",
+        jobs,
+        "--formats",
+        "csv",
+        "md",
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    assert result.returncode != 0
+    assert "csv: FAILED" in result.stderr
+    assert "md: done" in result.stdout
+    assert any(tmp_path.glob("*.md"))
+
+
+def test_build_cli_isolates_unimportable_exporter(tmp_path, monkeypatch, capsys):
+    from scripts import build
+
+    ep = EntryPoint(
+        name="broken",
+        value="crfgen_missing_plugin:export",
+        group=registry.ENTRY_POINT_GROUP,
+    )
+    monkeypatch.setattr(registry, "_plugins", {ep.name: ep})
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "build.py",
+            "--source",
+            "tests/.data/sample_crf.json",
+            "--outdir",
+            str(tmp_path),
+            "--formats",
+            "broken",
+            "md",
+        ],
+    )
+    with pytest.raises(SystemExit) as exit_:
+        build.main()
+
+    out, err = capsys.readouterr()
+    assert "1 format(s) failed: broken" in str(exit_.value.code)
+    assert "broken: FAILED" in err and "ModuleNotFoundError" in err
+    assert "md: done" in out
+    assert any(tmp_path.glob("*.md"))
+
+
+def test_build_cli_recreates_deleted_outputs(tmp_path: pathlib.Path):
+    cmd = [
+        sys.executable,
+        "scripts/build.py",
+        "--source",
+        "tests/.data/sample_crf.json",
+        "--outdir",
+        str(tmp_path),
+        "--formats",
+        "md",
+        "csv",
+    ]
+    assert subprocess.run(cmd, capture_output=True).returncode == 0
+    rendered = sorted(p.name for p in tmp_path.glob("*.md"))
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    assert "md: up to date" in result.stdout and "csv: up to date" in result.stdout
+
+    (tmp_path / rendered[0]).unlink()
+    (tmp_path / "forms.csv").unlink()
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert "md: done" in result.stdout and "csv: done" in result.stdout
+    assert sorted(p.name for p in tmp_path.glob("*.md")) == rendered
+    assert (tmp_path / "forms.csv").exists()
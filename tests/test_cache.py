@@ -0,0 +1,91 @@
+import asyncio
+
+import httpx
+from conftest import LIBRARY
+
+from crfgen.cache import AsyncCacheTransport, CacheTransport, ResponseCache
+from crfgen.crfgen import CrfGen
+from crfgen.mockserver import MockLibrary
+
+
+def _server(calls):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(dict(request.headers))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, json={"path": request.url.path}, headers={"ETag": '"v1"'}
+        )
+
+    return handler
+
+
+def test_revalidates_and_serves_from_disk(tmp_path):
+    calls = []
+    cache = ResponseCache(tmp_path)
+    transport = CacheTransport(httpx.MockTransport(_server(calls)), cache)
+    with httpx.Client(transport=transport, base_url="https://x") as client:
+        assert client.get("/mdr/a").json() == {"path": "/mdr/a"}
+        assert client.get("/mdr/a").json() == {"path": "/mdr/a"}
+
+    assert "if-none-match" not in calls[0]
+    assert calls[1]["if-none-match"] == '"v1"'
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.revalidated) == (0, 1, 1)
+
+    # A fresh cache instance picks up the entries already on disk
+    reopened = ResponseCache(tmp_path, max_age=60)
+    transport = CacheTransport(httpx.MockTransport(_server(calls)), reopened)
+    with httpx.Client(transport=transport, base_url="https://x") as client:
+        assert client.get("/mdr/a").json() == {"path": "/mdr/a"}
+    assert len(calls) == 2
+    assert reopened.stats.hits == 1
+
+
+def test_lru_eviction(tmp_path):
+    calls = []
+    cache = ResponseCache(tmp_path, max_bytes=1)
+    transport = CacheTransport(httpx.MockTransport(_server(calls)), cache)
+    with httpx.Client(transport=transport, base_url="https://x") as client:
+        client.get("/mdr/a")
+        client.get("/mdr/b")
+
+    assert len(cache._index) == 1
+    assert cache.get(cache.key("GET", "https://x/mdr/b")) is not None
+    assert cache.get(cache.key("GET", "https://x/mdr/a")) is None
+
+
+def test_async_transport(tmp_path):
+    calls = []
+    cache = ResponseCache(tmp_path)
+    transport = AsyncCacheTransport(httpx.MockTransport(_server(calls)), cache)
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport, base_url="https://x") as c:
+            await c.get("/mdr/a")
+            return (await c.get("/mdr/a")).json()
+
+    assert asyncio.run(run()) == {"path": "/mdr/a"}
+    assert (cache.stats.hits, cache.stats.revalidated) == (0, 1)
+
+
+def test_max_age_serves_crfgen_requests_locally(tmp_path):
+    with MockLibrary(LIBRARY) as server:
+        fresh = ResponseCache(tmp_path / "fresh", max_age=3600)
+        gen = CrfGen("token", ig_filter="2-3", cache=fresh, base_url=server.base_url)
+        forms = gen.harvest()
+        fetched = sum(server.requests.values())
+        assert gen.harvest() == forms
+        assert gen.async_harvest() == forms
+        assert sum(server.requests.values()) == fetched
+        assert fresh.stats.hits == 2 * fetched
+
+        revalidating = ResponseCache(tmp_path / "fresh")
+        gen = CrfGen(
+            "token", ig_filter="2-3", cache=revalidating, base_url=server.base_url
+        )
+        gen.harvest()
+
+    assert server.requests[200] == fetched
+    assert server.requests[304] == fetched
+    assert revalidating.stats.revalidated == fetched
+    assert revalidating.stats.hit_ratio == 0
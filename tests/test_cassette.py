@@ -0,0 +1,105 @@
+import asyncio
+import gzip
+
+import httpx
+import pytest
+from conftest import LIBRARY
+
+from crfgen.cassette import (
+    AsyncCassetteTransport,
+    Cassette,
+    CassetteMiss,
+    CassetteTransport,
+)
+from crfgen.crawl import crawl_links
+from crfgen.crfgen import CrfGen
+from crfgen.mockserver import MockLibrary
+from crfgen.ratelimit import AdaptiveRateLimiter
+from crfgen.traverse import LinkCrawler
+
+FIXTURES = "tests/fixtures/crawl_fixture.json"
+
+
+def test_record_then_replay_offline(tmp_path):
+    path = tmp_path / "cdashig.cassette"
+    with MockLibrary.from_file(FIXTURES, api_key="secret") as server:
+        with Cassette(path, mode="record") as cassette:
+            gen = CrfGen("secret", base_url=server.base_url, cassette=cassette)
+            live = dict(LinkCrawler(gen.client).crawl("cdashig"))
+        served = sum(server.requests.values())
+
+    assert len(cassette) == served
+    assert b"secret" not in gzip.decompress(path.read_bytes())
+
+    # No server running: every answer comes from the archive.
+    replayed = crawl_links("offline", "cdashig", cassette=Cassette(path))
+    assert replayed == live
+
+
+def test_replay_is_byte_for_byte(tmp_path):
+    bodies = [b'{"a": 1}', b'{"a":  2 }']
+
+    def handler(request):
+        return httpx.Response(200, content=bodies[len(seen)], headers={"ETag": '"x"'})
+
+    seen = []
+    path = tmp_path / "c.cassette"
+    with Cassette(path, mode="record") as cassette:
+        transport = CassetteTransport(cassette, httpx.MockTransport(handler))
+        with httpx.Client(transport=transport, base_url="https://a.test") as client:
+            for _ in bodies:
+                seen.append(client.get("/mdr/x?q=1").content)
+
+    transport = CassetteTransport(Cassette(path))
+    with httpx.Client(transport=transport, base_url="https://elsewhere.test") as client:
+        got = [client.get("/mdr/x?q=1") for _ in range(3)]
+
+    assert [r.content for r in got] == bodies + bodies[-1:]
+    assert got[0].headers["etag"] == '"x"'
+    with pytest.raises(CassetteMiss):
+        transport.handle_request(httpx.Request("GET", "https://a.test/mdr/y"))
+
+
+def test_async_replay(tmp_path):
+    path = tmp_path / "c.cassette"
+    with Cassette(path, mode="record") as cassette:
+        transport = CassetteTransport(
+            cassette,
+            httpx.MockTransport(lambda r: httpx.Response(200, json={"p": r.url.path})),
+        )
+        with httpx.Client(transport=transport) as client:
+            client.get("https://a.test/one")
+
+    async def replay():
+        transport = AsyncCassetteTransport(Cassette(path))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return (await client.get("https://a.test/one")).json()
+
+    assert asyncio.run(replay()) == {"p": "/one"}
+
+
+def test_recording_needs_a_transport(tmp_path):
+    with pytest.raises(ValueError):
+        CassetteTransport(Cassette(tmp_path / "c", mode="record"))
+
+
+def test_throttled_recording_replays_final_responses(tmp_path):
+    path = tmp_path / "c.cassette"
+    limiter = AdaptiveRateLimiter(rate=100, max_rate=100, backoff=0.01)
+    with MockLibrary(LIBRARY, rate_limit=4) as server:
+        with Cassette(path, mode="record") as cassette:
+            gen = CrfGen(
+                "k",
+                ig_filter="2-3",
+                base_url=server.base_url,
+                limiter=limiter,
+                cassette=cassette,
+            )
+            live = gen.harvest()
+
+    assert server.requests[429] > 0
+    assert {item["status"] for item in cassette.interactions} == {200}
+    assert len(cassette) == server.requests[200]
+    replay = CrfGen("offline", ig_filter="2-3", cassette=Cassette(path))
+    assert replay.harvest() == live
+    assert replay.async_harvest() == live
@@ -0,0 +1,103 @@
+import time
+from unittest.mock import patch
+
+import pytest
+from conftest import LIBRARY
+
+from cdisc_library_client.errors import UnexpectedStatus
+from crfgen.checkpoint import Journal
+from crfgen.crfgen import CrfGen
+from crfgen.mockserver import MockLibrary
+from crfgen.schema import Form
+
+TITLES = ["AE 2-3", "VS 2-3", "VS.Generic", "VS.Horizontal"]
+
+
+def test_interrupted_harvest_resumes(tmp_path, fake_library):
+    path = tmp_path / "journal.ndjson"
+    fake_library(fail=lambda url: url.endswith("/VS.Horizontal"))
+    with pytest.raises(ConnectionError):
+        list(CrfGen("t", ig_filter="2-3").iter_harvest(journal=Journal(path)))
+    assert len(Journal(path)) == 3
+
+    fake_library()
+    fake_library.calls.clear()
+    forms = list(CrfGen("t", ig_filter="2-3").iter_harvest(journal=Journal(path)))
+
+    assert [f.title for f in forms] == TITLES
+    assert forms[1].field_oids() == ["VSDAT", "VSSEQ"]
+    # products + IG version, then only the scenario that failed
+    assert fake_library.calls[2:] == [
+        {"version": "2-3", "domain": "VS", "scenario": "Horizontal"}
+    ]
+
+
+def test_failed_response_is_not_journaled(tmp_path):
+    path = tmp_path / "journal.ndjson"
+    horizontal = "/mdr/cdashig/2-3/scenarios/VS.Horizontal"
+    partial = {k: v for k, v in LIBRARY.items() if k != horizontal}
+    with MockLibrary(partial) as server:
+        gen = CrfGen("t", ig_filter="2-3", base_url=server.base_url)
+        with pytest.raises(UnexpectedStatus) as err:
+            list(gen.iter_harvest(journal=Journal(path)))
+    assert err.value.status_code == 404
+    journal = Journal(path)
+    assert len(journal) == 3
+    assert journal.get(("2-3", "VS", "Horizontal")) is None
+
+    with MockLibrary(LIBRARY) as server:
+        gen = CrfGen("t", ig_filter="2-3", base_url=server.base_url)
+        forms = list(gen.iter_harvest(journal=Journal(path)))
+        # products, IG version and the scenario that failed
+        assert sum(server.requests.values()) == 3
+
+    assert [f.title for f in forms] == TITLES
+    assert forms[-1].field_oids() == ["VSORRES"]
+
+
+def test_workers_split_domains(tmp_path, fake_library):
+    path = tmp_path / "journal.ndjson"
+    fake_library()
+    gen = CrfGen("t", ig_filter="2-3")
+    journal_a, journal_b = Journal(path), Journal(path)
+    assert journal_a.claim("2-3", "AE", "a")
+    a = list(gen.iter_harvest(journal=journal_a, worker="a"))
+    b = list(gen.iter_harvest(journal=journal_b, worker="b"))
+    merged = list(gen.iter_harvest(journal=Journal(path)))
+
+    assert [f.title for f in a] == TITLES
+    assert b == []
+    assert merged == a
+
+
+def test_cleared_journal_crawls_again(tmp_path, fake_library):
+    path = tmp_path / "journal.ndjson"
+    fake_library()
+    gen = CrfGen("t", ig_filter="2-3")
+    journal = Journal(path)
+    list(gen.iter_harvest(journal=journal))
+    journal.clear()
+
+    assert not path.exists() and len(journal) == 0
+    fake_library.calls.clear()
+    assert [f.title for f in gen.iter_harvest(journal=Journal(path))] == TITLES
+    assert len(fake_library.calls) == 2 + len(TITLES)
+
+
+def test_expired_claims_can_be_taken_over(tmp_path):
+    path = tmp_path / "journal.ndjson"
+    assert Journal(path, lease=60).claim("2-3", "AE", "a")
+    assert not Journal(path, lease=60).claim("2-3", "AE", "b")
+    later = time.time() + 120
+    with patch("crfgen.checkpoint.time.time", return_value=later):
+        assert Journal(path, lease=60).claim("2-3", "AE", "b")
+
+
+def test_torn_trailing_line_is_ignored(tmp_path):
+    path = tmp_path / "journal.ndjson"
+    journal = Journal(path)
+    journal.record(("2-3", "AE", None), Form(title="AE", domain="AE", fields=[]), [])
+    with path.open("a") as fh:
+        fh.write('{"unit": ["2-3", "VS"')
+    assert ("2-3", "AE", None) in Journal(path)
+    assert len(Journal(path)) == 1
@@ -0,0 +1,138 @@
+import asyncio
+
+import httpx
+import pytest
+
+from cdisc_library_client.client import AuthenticatedClient
+from crfgen.ct import (
+    CodelistTerms,
+    CTIndex,
+    CTLoader,
+    package_date,
+    select_packages,
+)
+
+
+def _codelist(code, value, terms):
+    return {
+        "conceptId": code,
+        "submissionValue": value,
+        "name": value.title(),
+        "extensible": "false",
+        "terms": [
+            {
+                "conceptId": c,
+                "submissionValue": v,
+                "preferredTerm": v.title(),
+                "synonyms": [v],
+            }
+            for c, v in terms
+        ],
+    }
+
+
+OLD = "sdtmct-2024-09-27"
+NEW = "sdtmct-2025-03-28"
+RESOURCES = {
+    "/api/mdr/ct/packages": {
+        "_links": {
+            "packages": [
+                {"href": f"/mdr/ct/packages/{name}"}
+                for name in (OLD, NEW, "cdashct-2025-03-28", "adamct-2024-09-27")
+            ]
+        }
+    },
+    f"/api/mdr/ct/packages/{NEW}": {
+        "_links": {},
+        "codelists": [
+            _codelist("C66769", "AESEV", [("C41338", "MILD"), ("C41339", "MODERATE")]),
+            _codelist("C66731", "SEX", [("C20197", "M"), ("C16576", "F")]),
+        ],
+    },
+    f"/api/mdr/ct/packages/{OLD}": {
+        "_links": {"self": {"href": f"/mdr/ct/packages/{OLD}"}}
+    },
+    f"/api/mdr/ct/packages/{OLD}/codelists": {
+        "_links": {"codelists": [{"href": f"/mdr/ct/packages/{OLD}/codelists/C66769"}]}
+    },
+    f"/api/mdr/ct/packages/{OLD}/codelists/C66769": {
+        "_links": {},
+        **_codelist("C66769", "AESEV", [("C41338", "MILD")]),
+    },
+}
+
+
+def _client(requests):
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path in RESOURCES:
+            return httpx.Response(200, json=RESOURCES[request.url.path])
+        return httpx.Response(404, json={"message": "Not found"})
+
+    return AuthenticatedClient(
+        base_url="https://lib.test/api",
+        token="k",
+        httpx_args={"transport": httpx.MockTransport(handler)},
+    )
+
+
+def test_select_packages():
+    names = [OLD, NEW, "cdashct-2025-03-28", "adamct-2024-09-27", "junk"]
+    assert select_packages(names, ["sdtmct"]) == [OLD, NEW]
+    assert select_packages(names, latest=True) == [
+        "adamct-2024-09-27",
+        "cdashct-2025-03-28",
+        NEW,
+    ]
+    assert package_date(NEW) == "2025-03-28"
+
+
+def test_loader_builds_index():
+    requests = []
+    loader = CTLoader(_client(requests))
+    available = asyncio.run(loader.available())
+    index = asyncio.run(loader.load(select_packages(available, ["sdtmct"])))
+
+    assert index.packages == [OLD, NEW]
+    assert index.term("C66769", "MILD").code == "C41338"
+    assert index.term("C66769", "C41339").submission_value == "MODERATE"
+    assert [t.code for t in index.terms("C66769", OLD)] == ["C41338"]
+    assert index.codelist("C66769", "2024-09-27").name == "Aesev"
+    assert index.codelist("C66731", OLD) is None
+    assert index.term("C00000", "MILD") is None
+    # listing + embedded package + (package, codelist listing, codelist)
+    assert loader.requests == len(requests) == 5
+
+
+def test_index_roundtrip_skips_loaded_packages(tmp_path):
+    requests = []
+    loader = CTLoader(_client(requests))
+    asyncio.run(loader.load([NEW], CTIndex())).save(tmp_path)
+
+    index = CTIndex.load(tmp_path)
+    assert NEW in index and len(index) == 1
+    assert index.term("C66731", "F").synonyms == ("F",)
+
+    asyncio.run(loader.load([NEW, OLD], index))
+    assert requests.count(f"/api/mdr/ct/packages/{NEW}") == 1
+    assert index.packages == [OLD, NEW]
+    assert index.terms("C66769") == index.terms("C66769", NEW)
+
+
+def test_add_indexes_each_package_once(monkeypatch):
+    def codelist(value):
+        return CodelistTerms.from_api(_codelist("C66769", value, []))
+
+    index = CTIndex()
+    monkeypatch.setattr(index, "_reindex", lambda: pytest.fail("full reindex"))
+    for name, value in [
+        (NEW, "NEW"),
+        ("sendct-2025-03-28", "SEND"),
+        (OLD, "OLD"),
+        ("cdashct-2025-03-28", "CDASH"),
+    ]:
+        index.add(name, [codelist(value)])
+
+    assert index.codelist("C66769").submission_value == "SEND"
+    assert index.codelist("C66769", "2025-03-28").submission_value == "CDASH"
+    assert index.codelist("C66769", "2024-09-27").submission_value == "OLD"
@@ -0,0 +1,110 @@
+import pytest
+from openpyxl import Workbook
+
+from crfgen.ctstore import CTStore, build_ct_store
+
+HEADER = [
+    "Code",
+    "Codelist Code",
+    "Codelist Extensible (Yes/No)",
+    "Codelist Name",
+    "CDISC Submission Value",
+    "CDISC Synonym(s)",
+    "CDISC Definition",
+    "NCI Preferred Term",
+    "Standard and Date",
+]
+
+
+def _workbook(path, rows, standard):
+    wb = Workbook()
+    wb.active.title = "ReadMe"
+    ws = wb.create_sheet("Terminology")
+    ws.append(HEADER)
+    for code, codelist, ext, name, value, synonyms in rows:
+        ws.append(
+            [code, codelist, ext, name, value, synonyms, "", value.title(), standard]
+        )
+    wb.save(path)
+    return path
+
+
+@pytest.fixture
+def store(tmp_path):
+    sdtm = _workbook(
+        tmp_path / "SDTM_CT.xlsx",
+        [
+            ("C66742", None, "No", "No Yes Response", "NY", "No Yes Response"),
+            ("C49488", "C66742", None, "No Yes Response", "Y", "Yes"),
+            ("C49487", "C66742", None, "No Yes Response", "N", "No"),
+            ("C66769", None, "No", "Severity", "AESEV", None),
+            ("C41338", "C66769", None, "Severity", "MILD", "1; Grade 1"),
+        ],
+        "SDTM CT 2025-03-28",
+    )
+    send = _workbook(
+        tmp_path / "SEND_CT.xlsx",
+        [
+            ("C66742", None, "Yes", "No Yes Response", "NY", None),
+            ("C49488", "C66742", None, "No Yes Response", "YES", None),
+        ],
+        "SEND CT 2025-03-28",
+    )
+    counts = build_ct_store([sdtm, send], tmp_path / "ct.sqlite")
+    assert counts == {"codelists": 2, "terms": 3}
+    with CTStore(tmp_path / "ct.sqlite") as store:
+        yield store
+
+
+def test_lookups(store):
+    assert "C66742" in store and "C00000" not in store
+    assert [t.submission_value for t in store.terms("C66742")] == ["Y", "N"]
+    assert store.term("C66769", "MILD").synonyms == ("1", "Grade 1")
+    assert store.term("C66769", "C41338").preferred_term == "Mild"
+    assert store.term("C66769", "Grade 1").code == "C41338"
+    assert store.term("C66742", "No").submission_value == "N"
+    assert store.term("C66769", "SEVERE") is None
+    assert store.code("N") == "C49487"
+    assert store.code("MILD", codelist="C66742") is None
+
+    codelist = store.codelist("C66742")
+    assert codelist.submission_value == "NY" and not codelist.extensible
+    assert codelist.get("Y").code == "C49488"
+    assert store.codelist("C00000") is None
+
+
+def test_expand_ct_codes(store):
+    assert [t.code for t in store.expand("C66742; C66769")] == [
+        "C49488",
+        "C49487",
+        "C41338",
+    ]
+    assert store.expand("") == []
+
+
+def test_first_workbook_keeps_its_terms(tmp_path):
+    codelist = ("C66742", None, "No", "No Yes Response", "NY", None)
+    sdtm = _workbook(
+        tmp_path / "SDTM_CT.xlsx",
+        [codelist, ("C49488", "C66742", None, "No Yes Response", "Y", None)],
+        "SDTM CT 2025-03-28",
+    )
+    send = _workbook(
+        tmp_path / "SEND_CT.xlsx",
+        [
+            codelist,
+            ("C49487", "C66742", None, "No Yes Response", "N", None),
+            ("C17998", "C66742", None, "No Yes Response", "U", None),
+        ],
+        "SEND CT 2025-03-28",
+    )
+    counts = build_ct_store([sdtm, send], tmp_path / "ct.sqlite")
+
+    assert counts == {"codelists": 1, "terms": 1}
+    with CTStore(tmp_path / "ct.sqlite") as store:
+        assert [t.submission_value for t in store.terms("C66742")] == ["Y"]
+
+
+def test_missing_store(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        CTStore(tmp_path / "missing.sqlite")
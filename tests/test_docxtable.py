@@ -0,0 +1,30 @@
+import docx
+
+from crfgen.docxtable import append_rows
+
+
+def _table():
+    doc = docx.Document()
+    return doc.add_table(rows=1, cols=3)
+
+
+def test_append_rows_matches_add_row():
+    expected = _table()
+    for texts in (["A", "", "C"], ["D", " e ", "F\tG"]):
+        cells = expected.add_row().cells
+        for cell, text in zip(cells, texts):
+            cell.text = text
+
+    table = _table()
+    cells = append_rows(table, [["A", "", "C"], ["D", " e ", "F\tG"]])
+
+    assert len(cells) == 2 and len(table.rows) == 3
+    assert table._tbl.xml == expected._tbl.xml
+
+
+def test_append_rows_returns_editable_cells():
+    table = _table()
+    (first,) = append_rows(table, [["x", None]])
+    first[1].paragraphs[0].add_run("late").bold = True
+    first[2].text = "z"
+    assert [c.text for c in table.rows[1].cells] == ["x", "late", "z"]
@@ -61,3 +61,143 @@ def test_generate(tmp_path):
     # The variables table is the second one
     table = doc.tables[1]
     assert len(table.columns) == 6
+
+
+def test_load_ig_cache(tmp_path, monkeypatch):
+    import shutil
+
+    import pandas as pd
+
+    from scripts import generate_cdash_crf
+
+    ig = tmp_path / "ig.xlsx"
+    shutil.copy("data_standards/1_collection/CDASHIG_v2.3.xlsx", ig)
+    cache = tmp_path / "cache"
+
+    first = generate_cdash_crf.load_ig(str(ig), cache)
+    assert len(list(cache.glob("*.pkl"))) == 1
+
+    def no_excel(*args, **kwargs):
+        raise AssertionError("workbook parsed despite cache")
+
+    monkeypatch.setattr(generate_cdash_crf.pd, "read_excel", no_excel)
+    pd.testing.assert_frame_equal(generate_cdash_crf.load_ig(str(ig), cache), first)
+
+    # A changed workbook misses the cache.
+    with open(ig, "ab") as fh:
+        fh.write(b"\0")
+    monkeypatch.undo()
+    monkeypatch.setattr(generate_cdash_crf, "_read_ig", lambda path: first.head(1))
+    assert len(generate_cdash_crf.load_ig(str(ig), cache)) == 1
+    assert len(list(cache.glob("*.pkl"))) == 2
+
+
+def test_generate_parallel(tmp_path):
+    out_dir = tmp_path / "out"
+    result = subprocess.run(
+        [
+            sys.executable,
+            "scripts/generate_cdash_crf.py",
+            "--model",
+            "data_standards/1_collection/CDASH_Model_v1.3.xlsx",
+            "--ig",
+            "data_standards/1_collection/CDASHIG_v2.3.xlsx",
+            "--out",
+            str(out_dir),
+            "--jobs",
+            "2",
+            "--cache-dir",
+            str(tmp_path / "cache"),
+            "--domains",
+            "VS",
+            "AE",
+            "DM",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    saved = [line.split()[2] for line in result.stdout.splitlines() if "Saved" in line]
+    assert saved == [
+        "out/VS_Vital_Signs_CRF.docx",
+        "out/AE_Adverse_Events_CRF.docx",
+        "out/DM_Demographics_CRF.docx",
+    ]
+    assert "3 domains in" in result.stdout
+    assert len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+
+
+def test_generate_book(tmp_path):
+    out_dir = tmp_path / "out"
+    result = subprocess.run(
+        [
+            sys.executable,
+            "scripts/generate_cdash_crf.py",
+            "--model",
+            "data_standards/1_collection/CDASH_Model_v1.3.xlsx",
+            "--ig",
+            "data_standards/1_collection/CDASHIG_v2.3.xlsx",
+            "--out",
+            str(out_dir),
+            "--book",
+            "--domains",
+            "AE",
+            "VS",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert [p.name for p in out_dir.iterdir()] == ["CRF_Book.docx"]
+
+    from docx import Document
+
+    doc = Document(out_dir / "CRF_Book.docx")
+    assert len(doc.sections) == 2
+    titles = [s.header.tables[0].cell(0, 1).text for s in doc.sections]
+    assert titles == ["Adverse Events", "Vital Signs"]
+    assert len(doc.tables) == 4
+    assert doc.tables[1].cell(1, 0).text == "STUDYID"
+    questions = [doc.tables[i].cell(1, 0).text for i in (0, 2)]
+    assert questions == ["Was adverse events completed?", "Was vital signs completed?"]
+
+
+def test_prepare_ig_offers_subset_codelist(tmp_path):
+    from openpyxl import Workbook
+
+    from crfgen.ctstore import COLUMNS, CTStore, build_ct_store
+    from scripts import generate_cdash_crf
+
+    cdash_ct = "data_standards/terminology/CDASH_CT_2025-03-28.xlsx"
+    build_ct_store([cdash_ct], tmp_path / "cdash.sqlite")
+    with CTStore(tmp_path / "cdash.sqlite") as store:
+        subset = store.terms("C78417")  # CMDOSU
+
+    # UNIT (C71620) lives in the SDTM workbook: a superset of CMDOSU.
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Terminology"
+    header = list(COLUMNS)
+    ws.append(header)
+    rows = [{"Code": "C71620", "CDISC Submission Value": "UNIT"}]
+    for code, value in [(t.code, t.submission_value) for t in subset] + [
+        ("C28252", "kg")
+    ]:
+        rows.append(
+            {"Code": code, "Codelist Code": "C71620", "CDISC Submission Value": value}
+        )
+    for row in rows:
+        ws.append([row.get(name) for name in header])
+    wb.save(tmp_path / "SDTM_CT.xlsx")
+    build_ct_store([cdash_ct, tmp_path / "SDTM_CT.xlsx"], tmp_path / "ct.sqlite")
+
+    ig = generate_cdash_crf.load_ig("data_standards/1_collection/CDASHIG_v2.3.xlsx")
+    row = ig[ig["Variable"] == "CMDOSU"]
+    assert row["CT Codes"].tolist() == ["C71620; C78417"]
+    with CTStore(tmp_path / "ct.sqlite") as store:
+        prepared = generate_cdash_crf.prepare_ig(row, store)
+
+    assert prepared["CTText"].tolist() == [
+        "; ".join(t.submission_value for t in subset)
+    ]
+    assert "kg" not in prepared["CTText"].iloc[0]
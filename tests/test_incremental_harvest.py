@@ -0,0 +1,52 @@
+import json
+from unittest.mock import patch
+
+from crfgen.crawl import changed_groups, harvest_if_changed, state_path
+from crfgen.schema import FieldDef, Form, iter_forms_ndjson
+
+FORM = Form(
+    title="VS",
+    domain="VS",
+    fields=[
+        FieldDef(oid="VSORRES", prompt="Res", datatype="text", cdash_var="VSORRES")
+    ],
+)
+
+
+def test_changed_groups():
+    prev = {"overall": "2025-01-01", "data-collection": "2025-01-01"}
+    cur = {"overall": "2025-02-01", "data-collection": "2025-01-01", "measure": "x"}
+    assert changed_groups(prev, cur) == {"overall", "measure"}
+
+
+def test_harvest_skipped_when_nothing_moved(tmp_path):
+    out = tmp_path / "crf.json"
+    stamps = {"overall": "2025-01-01", "data-collection": "2025-01-01"}
+    with patch("crfgen.crfgen.CrfGen.last_updated", return_value=stamps), patch(
+        "crfgen.crfgen.CrfGen.harvest", return_value=[FORM]
+    ) as crawl:
+        assert harvest_if_changed("token", out) == [FORM]
+        assert json.loads(state_path(out).read_text())["lastupdated"] == stamps
+
+        assert harvest_if_changed("token", out) is None
+        assert crawl.call_count == 1
+
+        # Terminology moving does not affect the CDASHIG crawl
+        stamps["terminology"] = "2025-03-01"
+        assert harvest_if_changed("token", out) is None
+
+        stamps["data-collection"] = "2025-03-01"
+        assert harvest_if_changed("token", out) == [FORM]
+        assert crawl.call_count == 2
+
+
+def test_incremental_ndjson_output(tmp_path):
+    out = tmp_path / "crf.ndjson"
+    stamps = {"data-collection": "2025-01-01"}
+    with patch("crfgen.crfgen.CrfGen.last_updated", return_value=stamps), patch(
+        "crfgen.crfgen.CrfGen.harvest", return_value=[FORM, FORM]
+    ):
+        assert harvest_if_changed("token", out) == [FORM, FORM]
+        assert harvest_if_changed("token", out) is None
+
+    assert list(iter_forms_ndjson(out)) == [FORM, FORM]
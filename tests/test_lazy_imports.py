@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+import cdisc_library_client.api as api
+import cdisc_library_client.models as models
+
+# Importing the harvester should only pull in the models its endpoints use.
+MODEL_MODULE_BUDGET = 20
+
+
+def test_import_budget():
+    code = (
+        "import sys, crfgen.crfgen; "
+        "print(sum(m.startswith('cdisc_library_client.models.') for m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert int(result.stdout) <= MODEL_MODULE_BUDGET
+
+
+def test_every_model_resolves():
+    for name in models.__all__:
+        assert getattr(models, name).__name__ == name
+    assert set(models.__all__) <= set(dir(models))
+
+
+def test_api_subpackages_resolve_lazily():
+    endpoint = api.cdash_implementation_guide_cdashig.get_mdr_cdashig_version
+    assert callable(endpoint.sync)
+    try:
+        api.default.no_such_endpoint
+    except AttributeError as exc:
+        assert "no_such_endpoint" in str(exc)
+    else:
+        raise AssertionError("unknown attribute did not raise")
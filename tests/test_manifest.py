@@ -0,0 +1,72 @@
+from crfgen.manifest import MANIFEST_NAME, BuildManifest, exporter_version, form_hash
+from crfgen.schema import FieldDef, Form
+
+
+def _form(domain, prompt="Result", scenario=None):
+    field = FieldDef(
+        oid=f"{domain}ORRES", prompt=prompt, datatype="text", cdash_var="X"
+    )
+    return Form(title=domain, domain=domain, scenario=scenario, fields=[field])
+
+
+FORMS = [_form("AE"), _form("VS"), _form("VS", scenario="VS.Generic")]
+
+
+def test_form_hash_is_content_based():
+    assert form_hash(_form("AE")) == form_hash(_form("AE"))
+    assert form_hash(_form("AE")) != form_hash(_form("AE", prompt="Other"))
+
+
+def test_per_form_units_are_domains(tmp_path):
+    manifest = BuildManifest.load(tmp_path)
+    assert manifest.stale("md", FORMS, "v1", per_form=True) == [0, 1, 2]
+    manifest.record("md", FORMS, "v1", per_form=True)
+    manifest.save()
+
+    manifest = BuildManifest.load(tmp_path)
+    assert manifest.stale("md", FORMS, "v1", per_form=True) == []
+    edited = [FORMS[0], FORMS[1], _form("VS", "Changed", "VS.Generic")]
+    # Both VS forms share VS.md, so both are re-rendered.
+    assert manifest.stale("md", edited, "v1", per_form=True) == [1, 2]
+    assert manifest.stale("md", FORMS, "v2", per_form=True) == [0, 1, 2]
+    assert manifest.stale("tex", FORMS, "v1", per_form=True) == [0, 1, 2]
+
+
+def test_aggregate_rebuilt_on_any_change(tmp_path):
+    manifest = BuildManifest.load(tmp_path)
+    manifest.record("csv", FORMS, "v1", per_form=False)
+    assert manifest.stale("csv", FORMS, "v1", per_form=False) == []
+    assert manifest.stale("csv", FORMS[:2], "v1", per_form=False) == [0, 1]
+    manifest.forget("csv")
+    assert manifest.stale("csv", FORMS, "v1", per_form=False) == [0, 1, 2]
+
+
+def test_corrupt_manifest_is_ignored(tmp_path):
+    (tmp_path / MANIFEST_NAME).write_text("{not json")
+    assert BuildManifest.load(tmp_path).formats == {}
+
+
+def test_exporter_version_covers_templates(tmp_path):
+    template = tmp_path / "t.j2"
+    template.write_text("a")
+    before = exporter_version(form_hash, [template])
+    template.write_text("b")
+    assert exporter_version(form_hash, [template]) != before
+
+
+def test_missing_outputs_are_stale(tmp_path):
+    manifest = BuildManifest.load(tmp_path)
+    manifest.record("md", FORMS, "v1", per_form=True, outputs=["{domain}.md"])
+    manifest.record("csv", FORMS, "v1", per_form=False, outputs=["forms.csv"])
+    for name in ("AE.md", "VS.md", "forms.csv"):
+        (tmp_path / name).write_text("")
+    manifest.save()
+
+    manifest = BuildManifest.load(tmp_path)
+    assert manifest.formats["md"]["outputs"] == {"AE": ["AE.md"], "VS": ["VS.md"]}
+    assert manifest.stale("md", FORMS, "v1", per_form=True) == []
+    assert manifest.stale("csv", FORMS, "v1", per_form=False) == []
+    (tmp_path / "VS.md").unlink()
+    (tmp_path / "forms.csv").unlink()
+    assert manifest.stale("md", FORMS, "v1", per_form=True) == [1, 2]
+    assert manifest.stale("csv", FORMS, "v1", per_form=False) == [0, 1, 2]
@@ -0,0 +1,69 @@
+import httpx
+
+from cdisc_library_client.client import AuthenticatedClient
+from crfgen.cache import CacheTransport, ResponseCache
+from crfgen.mockserver import MockLibrary
+from crfgen.ratelimit import AdaptiveRateLimiter, RateLimitTransport
+from crfgen.traverse import LinkCrawler
+
+FIXTURES = "tests/fixtures/crawl_fixture.json"
+
+
+def test_crawler_against_recorded_fixtures():
+    with MockLibrary.from_file(FIXTURES) as server:
+        client = AuthenticatedClient(base_url=server.base_url, token="k")
+        fetched = dict(LinkCrawler(client).crawl("cdashig"))
+
+    assert "/mdr/cdashig/2-2/scenarios/VS.Generic" in fetched
+    assert fetched["/mdr/cdashig/2-2/domains/VS"]["label"] == "Vital Signs"
+    # hrefs are rewritten so clients stay on the stand-in server
+    href = fetched["/mdr/cdashig/2-2"]["_links"]["domains"][0]["href"]
+    assert href.startswith(server.base_url)
+
+
+def test_openapi_examples_fill_gaps():
+    with MockLibrary(spec="openapi/cdisc-library.json") as server:
+        response = httpx.get(server.base_url + "/mdr/sdtmig/3-4/datasets/AE")
+        missing = httpx.get(server.base_url + "/nowhere")
+
+    assert response.status_code == 200
+    assert "_links" in response.json()
+    assert missing.status_code == 404
+
+
+def test_etags_allow_cache_revalidation(tmp_path):
+    cache = ResponseCache(tmp_path)
+    with MockLibrary.from_file(FIXTURES) as server:
+        transport = CacheTransport(httpx.HTTPTransport(), cache)
+        with httpx.Client(transport=transport, base_url=server.base_url) as client:
+            client.get("/mdr/cdashig/2-2")
+            client.get("/mdr/cdashig/2-2")
+
+    assert server.requests[304] == 1
+    assert (cache.stats.hits, cache.stats.revalidated) == (0, 1)
+
+
+def test_throttling_and_errors_are_retried():
+    limiter = AdaptiveRateLimiter(rate=100, max_rate=100, backoff=0.01)
+    with MockLibrary.from_file(
+        FIXTURES, rate_limit=5, error_rate=0.2, seed=1
+    ) as server:
+        transport = RateLimitTransport(httpx.HTTPTransport(), limiter)
+        with httpx.Client(transport=transport, base_url=server.base_url) as client:
+            statuses = [client.get("/mdr/cdashig/2-2").status_code for _ in range(7)]
+
+    assert statuses == [200] * 7
+    assert server.requests[429] + server.requests[503] > 0
+    assert limiter.stats().throttled > 0
+
+
+def test_api_key_is_checked():
+    with MockLibrary.from_file(FIXTURES, api_key="secret") as server:
+        ok = AuthenticatedClient(
+            base_url=server.base_url,
+            token="secret",
+            auth_header_name="api-key",
+            prefix="",
+        )
+        assert ok.get_httpx_client().get("/mdr/cdashig/2-2").status_code == 200
+        assert httpx.get(server.base_url + "/mdr/cdashig/2-2").status_code == 401
@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import time
+from contextlib import aclosing
+
+import pytest
+
+from crfgen.paginate import Paginator
+
+
+class PagedEndpoint:
+    """Fake start/page_size endpoint over ``range(n)``."""
+
+    def __init__(self, n, report_total=True, delay=0.01):
+        self.n = n
+        self.report_total = report_total
+        self.delay = delay
+        self.starts = []
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def _page(self, start, page_size):
+        page = {"hits": list(range(self.n))[int(start) : int(start) + int(page_size)]}
+        if self.report_total:
+            page["totalHits"] = self.n
+        return page
+
+    def _enter(self, start):
+        with self.lock:
+            self.starts.append(start)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+    def _leave(self):
+        with self.lock:
+            self.in_flight -= 1
+
+    def sync(self, *, client, start, page_size, q):
+        self._enter(start)
+        time.sleep(self.delay)
+        self._leave()
+        return self._page(start, page_size)
+
+    async def asyncio(self, *, client, start, page_size, q):
+        self._enter(start)
+        await asyncio.sleep(self.delay)
+        self._leave()
+        return self._page(start, page_size)
+
+
+async def _collect(pages):
+    return [item async for item in pages]
+
+
+@pytest.mark.parametrize("report_total", [True, False])
+def test_sync_and_async_yield_all_items_in_order(report_total):
+    for run in (list, lambda p: asyncio.run(_collect(p))):
+        endpoint = PagedEndpoint(95, report_total)
+        pages = Paginator(endpoint, None, page_size=10, prefetch=3, q="*")
+        assert run(pages) == list(range(95))
+        assert 1 < endpoint.peak <= 3
+        if report_total:
+            assert sorted(endpoint.starts) == list(range(0, 95, 10))
+
+
+def test_exact_multiple_without_total_stops_on_empty_page():
+    endpoint = PagedEndpoint(20, report_total=False)
+    items = list(Paginator(endpoint, None, page_size=10, prefetch=1, q="*"))
+    assert items == list(range(20))
+    assert endpoint.starts == [0, 10, 20]
+
+
+def test_early_stop_bounds_requests():
+    endpoint = PagedEndpoint(1000)
+    pages = Paginator(endpoint, None, page_size=10, prefetch=4, q="*")
+    for item in pages:
+        if item == 15:
+            break
+    time.sleep(0.05)
+    # first page, then one window of prefetched pages
+    assert len(endpoint.starts) <= 5
+
+    async def stop_early():
+        pages = Paginator(endpoint, None, page_size=10, prefetch=4, q="*")
+        async for item in pages:
+            if item == 15:
+                break
+
+    endpoint.starts.clear()
+    asyncio.run(stop_early())
+    assert len(endpoint.starts) <= 5
+
+
+def test_async_break_cancels_prefetched_pages():
+    class Staggered(PagedEndpoint):
+        # later pages take longer, so they are still in flight at the break
+        async def asyncio(self, *, client, start, page_size, q):
+            self.delay = start / 200
+            return await super().asyncio(
+                client=client, start=start, page_size=page_size, q=q
+            )
+
+    endpoint = Staggered(1000)
+
+    async def stop_early():
+        pages = Paginator(endpoint, None, page_size=10, prefetch=4, q="*")
+        async with aclosing(aiter(pages)) as items:
+            async for item in items:
+                if item == 10:  # first item of the first prefetched page
+                    break
+        # prefetched requests were cancelled and awaited by the close
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+        made = len(endpoint.starts)
+        await asyncio.sleep(0.1)
+        return made
+
+    made = asyncio.run(stop_early())
+    # first page, then one window of prefetched pages
+    assert len(endpoint.starts) == made <= 5
+
+
+def test_unexpected_page_raises():
+    class Broken(PagedEndpoint):
+        def _page(self, start, page_size):
+            return {"message": "Unauthorized"}
+
+    with pytest.raises(RuntimeError):
+        list(Paginator(Broken(10), None, q="*"))
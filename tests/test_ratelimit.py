@@ -0,0 +1,120 @@
+import asyncio
+import time
+
+import httpx
+
+from crfgen.crfgen import CrfGen
+from crfgen.ratelimit import (
+    AdaptiveRateLimiter,
+    AsyncRateLimitTransport,
+    RateLimitTransport,
+    parse_retry_after,
+)
+
+
+def _flaky(throttle_first: int, retry_after: str = "0"):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(time.monotonic())
+        if len(calls) <= throttle_first:
+            return httpx.Response(429, headers={"Retry-After": retry_after})
+        return httpx.Response(200, json={"ok": True})
+
+    return handler, calls
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=1445412470) == 10.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_retries_throttled_requests_and_backs_off():
+    handler, calls = _flaky(2)
+    limiter = AdaptiveRateLimiter(rate=1000, max_rate=1000)
+    transport = RateLimitTransport(httpx.MockTransport(handler), limiter)
+    with httpx.Client(transport=transport, base_url="https://x") as client:
+        assert client.get("/mdr/a").status_code == 200
+
+    stats = limiter.stats()
+    assert len(calls) == 3
+    assert stats.throttled == 2 and stats.retries == 2
+    assert stats.rate < 1000
+    assert stats.queue_depth == 0 and stats.in_flight == 0
+
+
+def test_gives_up_after_max_retries():
+    handler, calls = _flaky(10)
+    limiter = AdaptiveRateLimiter(rate=1000, max_retries=1)
+    transport = RateLimitTransport(httpx.MockTransport(handler), limiter)
+    with httpx.Client(transport=transport, base_url="https://x") as client:
+        assert client.get("/mdr/a").status_code == 429
+    assert len(calls) == 2
+
+
+def test_async_retry_waits_for_retry_after():
+    handler, calls = _flaky(1, retry_after="1")
+    limiter = AdaptiveRateLimiter(rate=1000, max_rate=1000)
+    transport = AsyncRateLimitTransport(httpx.MockTransport(handler), limiter)
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport, base_url="https://x") as c:
+            return await asyncio.gather(*(c.get(f"/mdr/{i}") for i in range(3)))
+
+    responses = asyncio.run(run())
+    assert [r.status_code for r in responses] == [200, 200, 200]
+    assert calls[-1] - calls[0] >= 0.9
+    assert limiter.stats().in_flight == 0
+
+
+def test_paces_requests_to_rate():
+    handler, calls = _flaky(0)
+    limiter = AdaptiveRateLimiter(rate=50, max_rate=50)
+    transport = RateLimitTransport(httpx.MockTransport(handler), limiter)
+    with httpx.Client(transport=transport, base_url="https://x") as client:
+        for i in range(5):
+            client.get(f"/mdr/{i}")
+    assert calls[-1] - calls[0] >= 4 / 50 * 0.9
+
+
+def test_crfgen_only_paces_when_asked():
+    def transport(gen):
+        return gen.client.get_httpx_client()._transport
+
+    assert not isinstance(transport(CrfGen("t")), RateLimitTransport)
+    limiter = AdaptiveRateLimiter(rate=5)
+    assert transport(CrfGen("t", limiter=limiter)).limiter is limiter
+
+
+def test_queued_requests_wait_out_retry_after_and_rate_halves_once():
+    arrivals, throttled_at = [], []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        now = time.monotonic()
+        arrivals.append(now)
+        await asyncio.sleep(0.125)
+        # The server throttles everything arriving in its first second.
+        if now < arrivals[0] + 1:
+            throttled_at.append(time.monotonic())
+            return httpx.Response(429, headers={"Retry-After": "1"})
+        return httpx.Response(200, json={"ok": True})
+
+    limiter = AdaptiveRateLimiter(rate=20, max_rate=50)
+    transport = AsyncRateLimitTransport(httpx.MockTransport(handler), limiter)
+
+    async def run():
+        async with httpx.AsyncClient(transport=transport, base_url="https://x") as c:
+            return await asyncio.gather(*(c.get(f"/mdr/{i}") for i in range(8)))
+
+    responses = asyncio.run(run())
+    assert [r.status_code for r in responses] == [200] * 8
+    window = (throttled_at[0], throttled_at[0] + 1)
+    assert not [t for t in arrivals if window[0] < t < window[1] - 0.05]
+    stats = limiter.stats()
+    # Requests in flight when the first 429 arrived are throttled as well,
+    # but only the first throttle halves the rate; each success adds 0.5.
+    assert 1 < stats.throttled < 8
+    assert stats.rate == 20 * 0.5 + 8 * 0.5
+    assert stats.queue_depth == 0 and stats.in_flight == 0
@@ -0,0 +1,57 @@
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from cdisc_library_client.api.cdash_implementation_guide_cdashig import (
+    get_mdr_cdashig_version,
+)
+from cdisc_library_client.client import AuthenticatedClient
+from cdisc_library_client.errors import UnexpectedStatus
+from crfgen.raw import RawEndpoint
+
+IG = {"name": "CDASHIG v2.3", "_links": {"domains": [{"title": "AE"}]}}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/mdr/cdashig/2-3"):
+        return httpx.Response(200, json=IG)
+    return httpx.Response(404, json={"message": "not found"})
+
+
+def _client(transport):
+    return AuthenticatedClient(
+        base_url="https://library.cdisc.org/api",
+        token="t",
+        httpx_args={"transport": transport},
+    )
+
+
+def test_raw_endpoint_skips_models():
+    client = _client(httpx.MockTransport(_handler))
+    endpoint = RawEndpoint(get_mdr_cdashig_version)
+    with patch(
+        "cdisc_library_client.models.cdashig_product.CdashigProduct.from_dict",
+        side_effect=AssertionError("model built"),
+    ):
+        assert endpoint.sync(client=client, version="2-3") == IG
+        missing = endpoint.sync_detailed(client=client, version="9-9")
+    assert missing.status_code == 404
+    assert missing.parsed == {"message": "not found"}
+
+
+def test_raw_endpoint_async():
+    client = _client(httpx.MockTransport(_handler))
+    endpoint = RawEndpoint(get_mdr_cdashig_version)
+    assert asyncio.run(endpoint.asyncio(client=client, version="2-3")) == IG
+
+
+def test_raw_endpoint_raises_on_error_status():
+    client = _client(httpx.MockTransport(_handler))
+    endpoint = RawEndpoint(get_mdr_cdashig_version)
+    with pytest.raises(UnexpectedStatus) as err:
+        endpoint.sync(client=client, version="9-9")
+    assert err.value.status_code == 404
+    with pytest.raises(UnexpectedStatus):
+        asyncio.run(endpoint.asyncio(client=client, version="9-9"))
@@ -0,0 +1,57 @@
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+
+from crfgen.exporter import registry
+
+
+def test_formats_known_without_imports():
+    code = (
+        "import sys; from crfgen.exporter import registry as reg; "
+        "names = reg.formats(); reg.get('csv'); "
+        "print(sorted(names), 'docx' in sys.modules, 'jinja2' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == [
+        "['csv',",
+        "'docx',",
+        "'md',",
+        "'odm',",
+        "'tex',",
+        "'xlsx']",
+        "False",
+        "False",
+    ]
+
+
+def test_get_imports_builtin_on_demand():
+    fn = registry.get("md")
+    assert fn.per_form and fn.templates
+    assert registry.get("md") is fn
+
+
+def export_plugin(forms, outdir):
+    pass
+
+
+def test_entry_point_plugin(monkeypatch):
+    value = f"{__name__}:export_plugin"
+    ep = EntryPoint(name="json-lines", value=value, group=registry.ENTRY_POINT_GROUP)
+    monkeypatch.setattr(registry, "_plugins", {ep.name: ep})
+    monkeypatch.delitem(registry._registry, "json-lines", raising=False)
+
+    assert "json-lines" in registry.formats()
+    fn = registry.get("json-lines")
+    assert fn.__name__ == "export_plugin" and fn.per_form is False
+    monkeypatch.delitem(registry._registry, "json-lines")
+
+
+def test_unknown_format():
+    try:
+        registry.get("nope")
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("unknown exporter did not raise")
@@ -1,6 +1,13 @@
 import pathlib
 
-from crfgen.schema import FieldDef, Form, dump_forms, load_forms
+from crfgen.schema import (
+    FieldDef,
+    Form,
+    dump_forms,
+    dump_forms_ndjson,
+    iter_forms_ndjson,
+    load_forms,
+)
 
 
 def test_roundtrip(tmp_path: pathlib.Path):
@@ -15,3 +22,19 @@ def test_roundtrip(tmp_path: pathlib.Path):
     dump_forms([f], tmp)
     out = load_forms(tmp)
     assert out[0].title == "VS"
+
+
+def test_ndjson_roundtrip(tmp_path: pathlib.Path):
+    forms = (
+        Form(
+            title=dom,
+            domain=dom,
+            fields=[FieldDef(oid="X", prompt="X", datatype="text", cdash_var="X")],
+        )
+        for dom in ("AE", "VS")
+    )
+    tmp = tmp_path / "crf.ndjson"
+    assert dump_forms_ndjson(forms, tmp) == 2
+    assert len(tmp.read_text().splitlines()) == 2
+    out = list(iter_forms_ndjson(tmp))
+    assert [f.domain for f in out] == ["AE", "VS"]
@@ -0,0 +1,198 @@
+import asyncio
+from unittest.mock import patch
+
+import httpx
+
+from cdisc_library_client.client import AuthenticatedClient
+from crfgen.crfgen import CrfGen
+from crfgen.search import SearchHarvester, field_from_payload, parse_field_href
+
+BASE = "/api/mdr/cdashig/2-3"
+
+
+def _hit(path, name, prompt="Prompt", ordinal=None, **extra):
+    hit = {
+        "href": f"/mdr/cdashig/2-3/{path}/fields/{name}",
+        "type": "Data Collection Field",
+    }
+    hit.update(name=name, simpleDatatype="Char", **extra)
+    if prompt:
+        hit["prompt"] = prompt
+    if ordinal:
+        hit["ordinal"] = str(ordinal)
+    return hit
+
+
+HITS = [
+    _hit("domains/VS", "VSDAT", ordinal=2),
+    _hit("scenarios/AE.Generic", "AETERM"),
+    _hit("domains/AE", "AETERM", ordinal=1),
+    _hit("domains/VS", "VSTEST", ordinal=1, codelist="C66741"),
+    _hit("domains/AE", "AESEV", prompt=None, ordinal=2),  # too sparse
+    _hit("domains/XX", "XXTERM"),  # not linked from the IG
+    {
+        "href": "/mdr/sdtmig/3-3/datasets/AE/variables/AETERM",
+        "type": "SDTM Dataset Variable",
+    },
+]
+
+RESOURCES = {
+    BASE: {
+        "_links": {
+            "domains": [
+                {"href": "/mdr/cdashig/2-3/domains/AE", "title": "Adverse Events"},
+                {"href": "/mdr/cdashig/2-3/domains/DM", "title": "Demographics"},
+                {"href": "/mdr/cdashig/2-3/domains/VS", "title": "Vital Signs"},
+            ]
+        }
+    },
+    BASE
+    + "/domains/AE/fields/AESEV": {
+        "name": "AESEV",
+        "prompt": "Severity",
+        "simpleDatatype": "Char",
+        "_links": {"codelist": [{"href": "/mdr/root/ct/sdtmct/codelists/C66769"}]},
+    },
+    BASE
+    + "/domains/DM/fields": {
+        "_links": {"fields": [{"href": "/mdr/cdashig/2-3/domains/DM/fields/SEX"}]}
+    },
+    BASE
+    + "/domains/DM/fields/SEX": {
+        "name": "SEX",
+        "prompt": "Sex",
+        "simpleDatatype": "Char",
+    },
+    BASE
+    + "/scenarios": {
+        "_links": {
+            "scenarios": [
+                {"href": "/mdr/cdashig/2-3/scenarios/AE.Generic"},
+                {"href": "/mdr/cdashig/2-3/scenarios/VS.Horizontal"},
+            ]
+        }
+    },
+    BASE
+    + "/scenarios/VS.Horizontal/fields": {
+        "_links": {
+            "fields": [
+                {"href": "/mdr/cdashig/2-3/scenarios/VS.Horizontal/fields/VSPOS"}
+            ]
+        }
+    },
+    BASE
+    + "/scenarios/VS.Horizontal/fields/VSPOS": {
+        "name": "VSPOS",
+        "prompt": "Position",
+        "simpleDatatype": "Char",
+    },
+}
+
+
+def _handler(requests):
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path == "/api/mdr/search":
+            start = int(request.url.params["start"])
+            assert request.url.params["version"] == "2-3"
+            size = int(request.url.params["pageSize"])
+            return httpx.Response(
+                200, json={"hits": HITS[start : start + size], "totalHits": len(HITS)}
+            )
+        if request.url.path in RESOURCES:
+            return httpx.Response(200, json=RESOURCES[request.url.path])
+        return httpx.Response(404, json={"message": "Not found"})
+
+    return handler
+
+
+def _client(requests, handler=None):
+    return AuthenticatedClient(
+        base_url="https://lib.test/api",
+        token="k",
+        httpx_args={"transport": httpx.MockTransport(handler or _handler(requests))},
+    )
+
+
+def test_parse_field_href():
+    href = "https://library.cdisc.org/api/mdr/cdashig/2-3/scenarios/AE.Generic/fields/AETERM"
+    assert parse_field_href(href) == ("2-3", "AE", "Generic", "AETERM")
+    assert parse_field_href("/mdr/sdtmig/3-3/datasets/AE/variables/AETERM") is None
+
+
+def test_field_from_payload():
+    field = field_from_payload(
+        {
+            "name": "VSTEST",
+            "prompt": "Test",
+            "simpleDatatype": "Num",
+            "codelist": "C66741",
+        }
+    )
+    assert field.datatype == "float"
+    assert field.codelist.nci_code == "C66741"
+    assert field_from_payload({"name": "AESEV", "simpleDatatype": "Char"}) is None
+
+
+def test_search_harvest_assembles_forms():
+    requests = []
+    harvester = SearchHarvester(_client(requests), page_size=2)
+    forms = asyncio.run(harvester.harvest("2-3"))
+
+    assert [(f.domain, f.scenario) for f in forms] == [
+        ("AE", None),
+        ("AE", "Generic"),
+        ("DM", None),
+        ("VS", None),
+        ("VS", "Horizontal"),
+    ]
+    ae, _, dm, vs, horizontal = forms
+    assert ae.title == "Adverse Events"
+    assert ae.field_oids() == ["AETERM", "AESEV"]
+    assert ae.fields[1].codelist.nci_code == "C66769"
+    assert dm.field_oids() == ["SEX"]
+    assert vs.field_oids() == ["VSTEST", "VSDAT"]
+    # a scenario without hits is filled from its field listing
+    assert (horizontal.title, horizontal.field_oids()) == ("VS.Horizontal", ["VSPOS"])
+    # XXTERM's domain is not linked from the IG, so it yields no form
+    assert "XX" not in {f.domain for f in forms}
+
+    # 4 search pages + IG + scenario listing + one sparse hit
+    # + DM and VS.Horizontal field listings and their fields
+    assert requests.count("/api/mdr/search") == 4
+    assert harvester.stats.requests == len(requests) == 11
+    assert harvester.stats.gaps == 3
+
+
+def test_prefetch_bounds_all_requests():
+    stats = {"in_flight": 0, "peak": 0}
+    handler = _handler([])
+
+    async def slow(request):
+        stats["in_flight"] += 1
+        stats["peak"] = max(stats["peak"], stats["in_flight"])
+        # a slow IG request overlaps the prefetched search pages
+        await asyncio.sleep(0.05 if request.url.path == BASE else 0.01)
+        stats["in_flight"] -= 1
+        return handler(request)
+
+    harvester = SearchHarvester(_client([], slow), prefetch=2, page_size=1)
+    assert len(asyncio.run(harvester.harvest("2-3"))) == 5
+    assert stats["peak"] == 2
+
+
+def test_crfgen_search_harvest():
+    requests = []
+    products = {
+        "_links": {"cdashig": [{"href": "/mdr/cdashig/2-3", "title": "CDASHIG 2-3"}]}
+    }
+    RESOURCES["/api/mdr/products/DataCollection"] = products
+    try:
+        gen = CrfGen("k")
+        with patch.object(CrfGen, "_get_async_client", return_value=_client(requests)):
+            forms = gen.search_harvest()
+    finally:
+        del RESOURCES["/api/mdr/products/DataCollection"]
+
+    assert len(forms) == 5
+    assert requests.count("/api/mdr/search") == 1
@@ -0,0 +1,104 @@
+import asyncio
+
+import httpx
+
+from crfgen.traverse import LinkCrawler, iter_links, normalize_href
+
+
+def ref(href):
+    return {"href": href, "title": href.rsplit("/", 1)[-1]}
+
+
+GRAPH = {
+    "/mdr/products/DataCollection": {
+        "_links": {
+            "self": ref("/mdr/products/DataCollection"),
+            "cdashig": [ref("/mdr/cdashig/2-2"), ref("/mdr/cdashig/2-3")],
+        }
+    },
+    "/mdr/cdashig/2-2": {
+        "_links": {"domains": [ref("/mdr/cdashig/2-2/domains/AE")]},
+    },
+    "/mdr/cdashig/2-3": {
+        "_links": {
+            "priorVersion": ref("/mdr/cdashig/2-2"),
+            "domains": [ref("/mdr/cdashig/2-3/domains/AE")],
+        },
+    },
+    "/mdr/cdashig/2-2/domains/AE": {
+        "fields": [
+            {"_links": {"codelist": [ref("/mdr/root/ct/cdashct/codelists/C66742")]}}
+        ],
+    },
+    "/mdr/cdashig/2-3/domains/AE": {
+        "_links": {"priorVersion": ref("/mdr/cdashig/2-2/domains/AE")},
+        "fields": [
+            {"_links": {"codelist": [ref("/mdr/root/ct/cdashct/codelists/C66742")]}}
+        ],
+    },
+    "/mdr/root/ct/cdashct/codelists/C66742": {"_links": {}},
+}
+
+
+class FakeClient:
+    """Serves GRAPH through httpx.MockTransport and records every path hit."""
+
+    base_url = "https://library.cdisc.org/api"
+
+    def __init__(self, hits):
+        self.hits = hits
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/api")
+        self.hits.append(path)
+        if path not in GRAPH:
+            return httpx.Response(404, json={})
+        return httpx.Response(200, json=GRAPH[path])
+
+    def get_httpx_client(self):
+        transport = httpx.MockTransport(self.handler)
+        return httpx.Client(transport=transport, base_url=self.base_url)
+
+    def get_async_httpx_client(self):
+        transport = httpx.MockTransport(self.handler)
+        return httpx.AsyncClient(transport=transport, base_url=self.base_url)
+
+
+def test_iter_links_finds_nested_refs():
+    rels = sorted(iter_links(GRAPH["/mdr/cdashig/2-3/domains/AE"]))
+    assert rels == [
+        ("codelist", "/mdr/root/ct/cdashct/codelists/C66742"),
+        ("priorVersion", "/mdr/cdashig/2-2/domains/AE"),
+    ]
+    assert (
+        normalize_href("https://library.cdisc.org/api/mdr/sdtm/2-0/") == "/mdr/sdtm/2-0"
+    )
+
+
+def test_shared_children_fetched_once():
+    hits = []
+    crawler = LinkCrawler(FakeClient(hits))
+    fetched = dict(crawler.crawl("cdashig"))
+
+    assert set(fetched) == set(GRAPH)
+    assert sorted(hits) == sorted(GRAPH)
+    assert crawler.stats.duplicates >= 2
+    # breadth-first: both versions before any domain
+    assert hits[1:3] == ["/mdr/cdashig/2-2", "/mdr/cdashig/2-3"]
+
+
+def test_depth_and_prefix_filters():
+    hits = []
+    crawler = LinkCrawler(FakeClient(hits), prefixes=["/mdr/cdashig/2-3"], max_depth=2)
+    list(crawler.crawl("cdashig", "/mdr/cdashig/2-3"))
+    assert "/mdr/cdashig/2-2" not in hits
+    assert "/mdr/cdashig/2-3/domains/AE" in hits
+    assert "/mdr/root/ct/cdashct/codelists/C66742" not in hits
+
+
+def test_async_crawl_matches_sync():
+    hits = []
+    crawler = LinkCrawler(FakeClient(hits))
+    fetched = asyncio.run(crawler.crawl_async("cdashig", concurrency=3))
+    assert set(fetched) == set(GRAPH)
+    assert sorted(hits) == sorted(GRAPH)